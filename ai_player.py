@@ -0,0 +1,201 @@
+"""
+AIController - Lawan CPU yang memprediksi lintasan bola secara analitik
+Titik potong bola dengan garis paddle dihitung langsung dengan "melipat"
+pantulan dinding (tanpa mensimulasikan frame demi frame), sehingga satu
+keputusan hanya butuh beberapa mikrodetik
+"""
+
+import random
+from collections import deque
+
+from simulation import PongSimulation
+
+
+def predict_intercept(x, y, velocity_x, velocity_y, target_x, top, bottom):
+    """
+    Prediksi posisi y bola saat mencapai target_x dengan melipat pantulan
+    dinding atas/bawah. Bekerja juga untuk array NumPy (elemen per elemen).
+
+    Args:
+        x (float): Posisi x bola
+        y (float): Posisi y bola
+        velocity_x (float): Velocity horizontal (per frame)
+        velocity_y (float): Velocity vertikal (per frame)
+        target_x (float): Posisi x yang dituju
+        top (float): Batas atas posisi y bola (dinding + radius)
+        bottom (float): Batas bawah posisi y bola (dinding - radius)
+
+    Returns:
+        tuple: (y saat mencapai target_x, jumlah frame sampai target_x).
+            Frame bernilai negatif jika bola bergerak menjauhi target.
+    """
+    frames = (target_x - x) / velocity_x
+    span = bottom - top
+    # Lintasan lurus tanpa dinding, lalu dilipat ke rentang [top, bottom]:
+    # setiap 2 * span jarak tempuh, bola kembali ke posisi dan arah semula
+    folded = (y - top + velocity_y * frames) % (2 * span)
+    return top + span - abs(folded - span), frames
+
+
+class AIController:
+    """
+    Pengendali paddle CPU untuk satu player
+    Menghasilkan input MOVE_UP, STOP atau MOVE_DOWN setiap frame, sama seperti
+    input keyboard, sehingga bisa dipakai di PongGame, simulasi headless
+    maupun pertandingan AI vs AI.
+
+    Tingkat kesulitan diatur oleh:
+    - reaction_delay: AI melihat bola sekian frame yang lalu
+    - noise: simpangan (pixel) prediksi, diacak sekali per datangnya bola
+    - max_speed: fraksi frame di mana paddle boleh bergerak (0.0 - 1.0)
+    """
+
+    DIFFICULTIES = {
+        "easy": {"reaction_delay": 20, "noise": 70.0, "max_speed": 0.55},
+        "medium": {"reaction_delay": 12, "noise": 35.0, "max_speed": 0.75},
+        "hard": {"reaction_delay": 8, "noise": 28.0, "max_speed": 0.85},
+        "perfect": {"reaction_delay": 0, "noise": 0.0, "max_speed": 1.0},
+    }
+
+    def __init__(self, player, difficulty="medium", reaction_delay=None, noise=None,
+                 max_speed=None, seed=None):
+        """
+        Constructor untuk AIController
+
+        Args:
+            player (int): Player yang dikendalikan (1 = kiri, 2 = kanan)
+            difficulty (str): Nama preset pada DIFFICULTIES
+            reaction_delay (int): Override delay reaksi (frame)
+            noise (float): Override simpangan prediksi (pixel)
+            max_speed (float): Override fraksi kecepatan maksimal paddle
+            seed (int): Seed RNG untuk noise (None = random)
+        """
+        if difficulty not in self.DIFFICULTIES:
+            raise ValueError(f"Difficulty tidak dikenal: {difficulty}")
+        preset = self.DIFFICULTIES[difficulty]
+
+        self.__player = player
+        self.__difficulty = difficulty
+        self.__reaction_delay = preset["reaction_delay"] if reaction_delay is None else reaction_delay
+        self.__noise = preset["noise"] if noise is None else noise
+        self.__max_speed = preset["max_speed"] if max_speed is None else max_speed
+        self.__rng = random.Random(seed)
+
+        # Riwayat posisi bola yang dilihat AI (untuk delay reaksi)
+        self.__observations = deque(maxlen=self.__reaction_delay + 1)
+        self.__approaching = False
+        self.__offset = 0.0
+        self.__speed_credit = 0.0
+
+    # GETTER methods
+    def get_player(self):
+        """Mengambil nomor player yang dikendalikan"""
+        return self.__player
+
+    def get_difficulty(self):
+        """Mengambil nama difficulty"""
+        return self.__difficulty
+
+    def get_reaction_delay(self):
+        """Mengambil delay reaksi (frame)"""
+        return self.__reaction_delay
+
+    def get_noise(self):
+        """Mengambil simpangan prediksi (pixel)"""
+        return self.__noise
+
+    def get_max_speed(self):
+        """Mengambil fraksi kecepatan maksimal paddle"""
+        return self.__max_speed
+
+    def reset(self):
+        """Lupakan riwayat bola (dipanggil saat pertandingan di-reset)"""
+        self.__observations.clear()
+        self.__approaching = False
+        self.__offset = 0.0
+        self.__speed_credit = 0.0
+
+    def get_input(self, simulation):
+        """
+        Tentukan input paddle untuk frame ini
+
+        Args:
+            simulation: PongSimulation atau MultiBallSimulation
+
+        Returns:
+            int: MOVE_UP, STOP atau MOVE_DOWN
+        """
+        if self.__player == 1:
+            paddle = simulation.paddle1
+            target_x = paddle.get_x() + paddle.get_width()
+        else:
+            paddle = simulation.paddle2
+            target_x = None
+
+        # Ambil bola yang paling cepat sampai ke paddle ini
+        best = None
+        for ball in simulation.get_balls():
+            if not ball.is_active():
+                continue
+            velocity_x = ball.get_velocity_x()
+            if velocity_x == 0 or (velocity_x < 0) != (self.__player == 1):
+                continue
+            if target_x is None:
+                # Bola menyentuh paddle kanan saat sisi kanannya mencapai paddle
+                target_x = paddle.get_x() - 2 * ball.get_radius()
+            frames = (target_x - ball.get_x()) / velocity_x
+            if best is None or frames < best[0]:
+                best = (frames, ball)
+
+        if best is None:
+            observation = None
+        else:
+            ball = best[1]
+            observation = (
+                ball.get_x(), ball.get_y(), ball.get_velocity_x(),
+                ball.get_velocity_y(), ball.get_radius(), target_x
+            )
+        self.__observations.append(observation)
+
+        # Yang dilihat AI adalah kondisi reaction_delay frame yang lalu
+        seen = self.__observations[0]
+        height = simulation.HEIGHT
+        if seen is None:
+            self.__approaching = False
+            target_y = height / 2
+        else:
+            if not self.__approaching:
+                # Bola baru mulai datang: acak kesalahan prediksi sekali
+                self.__approaching = True
+                self.__offset = self.__rng.gauss(0.0, self.__noise) if self.__noise > 0 else 0.0
+            x, y, velocity_x, velocity_y, radius, seen_target_x = seen
+            target_y, _ = predict_intercept(
+                x, y, velocity_x, velocity_y, seen_target_x, radius, height - radius
+            )
+            # Titik tumbukan dihitung dari y bola terhadap tengah paddle
+            target_y += self.__offset
+
+        return self._steer(paddle, target_y)
+
+    def _steer(self, paddle, target_y):
+        """
+        Gerakkan tengah paddle ke target_y dengan batas kecepatan
+
+        Args:
+            paddle (Paddle): Paddle yang dikendalikan
+            target_y (float): Posisi y yang dituju tengah paddle
+
+        Returns:
+            int: MOVE_UP, STOP atau MOVE_DOWN
+        """
+        distance = target_y - (paddle.get_y() + paddle.get_height() / 2)
+        # Dead zone setengah langkah paddle agar tidak bergetar di sekitar target
+        if abs(distance) <= paddle.get_speed() / 2:
+            return PongSimulation.STOP
+
+        # Batas kecepatan: paddle hanya bergerak pada sebagian frame
+        self.__speed_credit += self.__max_speed
+        if self.__speed_credit < 1.0:
+            return PongSimulation.STOP
+        self.__speed_credit -= 1.0
+        return PongSimulation.MOVE_DOWN if distance > 0 else PongSimulation.MOVE_UP
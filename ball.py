@@ -13,7 +13,15 @@ class Ball(GameObject):
     Menambahkan fitur khusus untuk bola seperti kecepatan dan pantulan
     """
     
-    def __init__(self, x, y, radius, color, speed):
+    __slots__ = (
+        "__radius", "__speed", "__base_speed", "__velocity_x",
+        "__velocity_y", "__speed_boost", "__rng"
+    )
+    
+    # State GameObject + velocity_x, velocity_y, speed, speed_boost
+    STATE_SIZE = GameObject.STATE_SIZE + 4
+    
+    def __init__(self, x, y, radius, color, speed, rng=None):
         """
         Constructor untuk Ball
         
@@ -23,6 +31,8 @@ class Ball(GameObject):
             radius (float): Jari-jari bola
             color (str): Warna bola
             speed (float): Kecepatan dasar bola
+            rng (random.Random): Sumber random untuk arah bola
+                (None = modul random global)
         """
         # Panggil constructor parent class (GameObject)
         super().__init__(x, y, radius * 2, radius * 2, color)
@@ -34,6 +44,7 @@ class Ball(GameObject):
         self.__velocity_x = 0
         self.__velocity_y = 0
         self.__speed_boost = 1.0  # Multiplier untuk power-up
+        self.__rng = rng if rng is not None else random
         
         # Inisialisasi arah bola secara random
         self.reset_velocity()
@@ -86,10 +97,10 @@ class Ball(GameObject):
         Digunakan saat game start atau setelah skor
         """
         # Random sudut antara -45 hingga 45 derajat
-        angle = random.uniform(-math.pi/4, math.pi/4)
+        angle = self.__rng.uniform(-math.pi/4, math.pi/4)
         
         # Random arah kiri atau kanan
-        direction = random.choice([-1, 1])
+        direction = self.__rng.choice([-1, 1])
         
         self.__velocity_x = direction * self.__speed * math.cos(angle)
         self.__velocity_y = self.__speed * math.sin(angle)
@@ -115,25 +126,56 @@ class Ball(GameObject):
         """Balik arah vertikal (pantulan di atas/bawah)"""
         self.__velocity_y = -self.__velocity_y
     
-    def update(self):
+    def update(self, dt=1):
         """
         Override method update dari GameObject (POLYMORPHISM)
         Update posisi bola berdasarkan velocity
+        
+        Args:
+            dt (float): Lama step dalam satuan frame (default 1 frame)
         """
         if not self.is_active():
             return
         
         # Update posisi berdasarkan velocity
-        self.set_x(self.get_x() + self.__velocity_x)
-        self.set_y(self.get_y() + self.__velocity_y)
+        self.move_by(self.__velocity_x * dt, self.__velocity_y * dt)
+    
+    def export_state(self, buffer, offset=0):
+        """
+        Tulis state bola ke buffer datar (lihat GameObject.export_state)
+        
+        Returns:
+            int: Index setelah nilai terakhir yang ditulis
+        """
+        offset = super().export_state(buffer, offset)
+        buffer[offset] = self.__velocity_x
+        buffer[offset + 1] = self.__velocity_y
+        buffer[offset + 2] = self.__speed
+        buffer[offset + 3] = self.__speed_boost
+        return offset + 4
     
-    def draw(self, canvas):
+    def import_state(self, buffer, offset=0):
+        """
+        Baca state bola dari buffer datar
+        
+        Returns:
+            int: Index setelah nilai terakhir yang dibaca
+        """
+        offset = super().import_state(buffer, offset)
+        self.__velocity_x = buffer[offset]
+        self.__velocity_y = buffer[offset + 1]
+        self.__speed = buffer[offset + 2]
+        self.__speed_boost = buffer[offset + 3]
+        return offset + 4
+    
+    def draw(self, canvas, detail=GameObject.DETAIL_FULL):
         """
         Override method draw dari GameObject (POLYMORPHISM)
         Menggambar bola sebagai oval di canvas
         
         Args:
             canvas: Tkinter canvas object
+            detail (int): Tingkat detail; highlight hanya di DETAIL_FULL
         """
         if not self.is_active():
             return
@@ -151,6 +193,9 @@ class Ball(GameObject):
             tags="ball"
         )
         
+        if detail < GameObject.DETAIL_FULL:
+            return
+        
         # Tambahkan highlight untuk efek 3D
         canvas.create_oval(
             x - r/2, y - r/2, x, y,
@@ -159,17 +204,41 @@ class Ball(GameObject):
             stipple="gray50",
             tags="ball"
         )
-    
-    def bounce_off_paddle(self, paddle):
+
+    def draw_sprite(self, canvas, sprites, detail=GameObject.DETAIL_FULL):
+        """
+        Override method draw_sprite dari GameObject (POLYMORPHISM)
+        Menggambar bola sebagai satu image pre-render (tanpa stipple)
+
+        Args:
+            canvas: Tkinter canvas object
+            sprites (SpriteCache): Cache sprite
+            detail (int): Tidak dipakai; highlight sudah ada di sprite tanpa biaya tambahan
+        """
+        if not self.is_active():
+            return
+
+        canvas.create_image(
+            self.get_x(), self.get_y(),
+            image=sprites.ball(self.__radius, self.get_color()),
+            tags="ball"
+        )
+
+    def bounce_off_paddle(self, paddle, paddle_y=None):
         """
         Hitung pantulan bola dari paddle dengan sudut berdasarkan posisi impact
         
         Args:
             paddle: Objek Paddle yang ditabrak
+            paddle_y (float): Posisi y paddle saat kontak (default posisi sekarang),
+                dipakai collision kontinu yang kontaknya terjadi di tengah step
         """
+        if paddle_y is None:
+            paddle_y = paddle.get_y()
+        
         # Hitung posisi relatif impact (0 = tengah, -1 = atas, 1 = bawah)
         ball_center = self.get_y()
-        paddle_center = paddle.get_y() + paddle.get_height() / 2
+        paddle_center = paddle_y + paddle.get_height() / 2
         relative_impact = (ball_center - paddle_center) / (paddle.get_height() / 2)
         
         # Batasi relative_impact antara -1 dan 1
@@ -0,0 +1,217 @@
+"""
+BatchPongSimulation - Menjalankan N dunia Pong sekaligus dengan NumPy
+Fisika sama dengan Ball.update, Ball.bounce_off_paddle, Paddle.update,
+pantulan dinding dan scoring milik PongSimulation (tanpa power-up dan particle)
+"""
+
+import math
+import numpy as np
+
+from simulation import PongSimulation
+
+class BatchPongSimulation:
+    """
+    Simulasi banyak pertandingan secara paralel (vectorized)
+    State setiap dunia disimpan sebagai kolom pada array NumPy sehingga satu
+    step() memajukan semua dunia dengan operasi vektor. Dunia yang selesai
+    (game over) di-reset di tempat tanpa alokasi ulang array.
+    """
+
+    WIDTH = PongSimulation.WIDTH
+    HEIGHT = PongSimulation.HEIGHT
+    WINNING_SCORE = PongSimulation.WINNING_SCORE
+    BALL_RESPAWN_DELAY = PongSimulation.BALL_RESPAWN_DELAY
+
+    # Ukuran objek, sama dengan PongSimulation
+    BALL_RADIUS = 10
+    BALL_SPEED = 5
+    PADDLE_WIDTH = 15
+    PADDLE_HEIGHT = 100
+    PADDLE_SPEED = 7
+    PADDLE1_X = 30
+    PADDLE2_X = PongSimulation.WIDTH - 45
+
+    def __init__(self, num_worlds, seed=None, auto_reset=True):
+        """
+        Constructor untuk BatchPongSimulation
+
+        Args:
+            num_worlds (int): Jumlah dunia yang disimulasikan bersamaan
+            seed (int): Seed untuk arah awal bola (None = random)
+            auto_reset (bool): True agar dunia yang game over langsung di-reset
+        """
+        self.__num_worlds = num_worlds
+        self.__rng = np.random.default_rng(seed)
+        self.__auto_reset = auto_reset
+
+        # State bola
+        self.ball_x = np.zeros(num_worlds)
+        self.ball_y = np.zeros(num_worlds)
+        self.ball_vx = np.zeros(num_worlds)
+        self.ball_vy = np.zeros(num_worlds)
+        self.ball_speed = np.full(num_worlds, float(self.BALL_SPEED))
+        self.respawn_timer = np.zeros(num_worlds, dtype=np.int32)
+
+        # State paddle (posisi x dan tinggi sama untuk semua dunia)
+        self.paddle1_y = np.zeros(num_worlds)
+        self.paddle2_y = np.zeros(num_worlds)
+
+        # Score dan hasil step terakhir
+        self.score1 = np.zeros(num_worlds, dtype=np.int32)
+        self.score2 = np.zeros(num_worlds, dtype=np.int32)
+        self.scored = np.zeros(num_worlds, dtype=np.int8)  # 0, 1 atau 2
+        self.winner = np.zeros(num_worlds, dtype=np.int8)  # 0, 1 atau 2
+        self.paddle_hit = np.zeros(num_worlds, dtype=bool)
+        self.wall_hit = np.zeros(num_worlds, dtype=bool)
+
+        # Hasil pertandingan yang selesai pada step terakhir (sebelum auto reset)
+        self.final_winner = np.zeros(num_worlds, dtype=np.int8)
+        self.final_score1 = np.zeros(num_worlds, dtype=np.int32)
+        self.final_score2 = np.zeros(num_worlds, dtype=np.int32)
+
+        self.reset()
+
+    def get_num_worlds(self):
+        """Mengambil jumlah dunia"""
+        return self.__num_worlds
+
+    def reset(self, mask=None):
+        """
+        Reset dunia ke kondisi awal pertandingan
+
+        Args:
+            mask (np.ndarray): Array bool dunia yang di-reset (None = semua)
+        """
+        if mask is None:
+            mask = np.ones(self.__num_worlds, dtype=bool)
+
+        self.paddle1_y[mask] = self.HEIGHT / 2 - self.PADDLE_HEIGHT / 2
+        self.paddle2_y[mask] = self.HEIGHT / 2 - self.PADDLE_HEIGHT / 2
+        self.score1[mask] = 0
+        self.score2[mask] = 0
+        self.winner[mask] = 0
+        self._reset_ball(mask)
+        self.respawn_timer[mask] = 0
+
+    def _reset_ball(self, mask):
+        """
+        Reset bola ke tengah dengan arah random (seperti Ball.reset_position)
+
+        Args:
+            mask (np.ndarray): Array bool dunia yang bolanya di-reset
+        """
+        count = int(np.count_nonzero(mask))
+        if count == 0:
+            return
+
+        # Random sudut antara -45 hingga 45 derajat, arah kiri atau kanan
+        angle = self.__rng.uniform(-math.pi / 4, math.pi / 4, count)
+        direction = self.__rng.choice((-1.0, 1.0), count)
+
+        self.ball_speed[mask] = self.BALL_SPEED
+        self.ball_x[mask] = self.WIDTH / 2
+        self.ball_y[mask] = self.HEIGHT / 2
+        self.ball_vx[mask] = direction * self.BALL_SPEED * np.cos(angle)
+        self.ball_vy[mask] = self.BALL_SPEED * np.sin(angle)
+
+    def _paddle_collision(self, paddle_x, paddle_y):
+        """
+        AABB overlap bola dengan paddle (sama dengan GameObject.collides_with)
+
+        Returns:
+            np.ndarray: Array bool dunia yang bolanya menyentuh paddle
+        """
+        size = 2 * self.BALL_RADIUS
+        x = self.ball_x
+        y = self.ball_y
+        return ~(
+            (x + size < paddle_x)
+            | (x > paddle_x + self.PADDLE_WIDTH)
+            | (y + size < paddle_y)
+            | (y > paddle_y + self.PADDLE_HEIGHT)
+        )
+
+    def _bounce(self, mask, paddle_y, direction):
+        """
+        Pantulkan bola dari paddle (sama dengan Ball.bounce_off_paddle)
+
+        Args:
+            mask (np.ndarray): Dunia yang bolanya memantul
+            paddle_y (np.ndarray): Posisi y paddle yang ditabrak
+            direction (float): Arah horizontal setelah pantulan (1 atau -1)
+        """
+        half_height = self.PADDLE_HEIGHT / 2
+        relative_impact = (self.ball_y[mask] - (paddle_y[mask] + half_height)) / half_height
+        np.clip(relative_impact, -1, 1, out=relative_impact)
+        bounce_angle = relative_impact * (math.pi / 3)
+        speed = self.ball_speed[mask]
+        self.ball_vx[mask] = direction * speed * np.cos(bounce_angle)
+        self.ball_vy[mask] = speed * np.sin(bounce_angle)
+
+    def step(self, inputs1, inputs2):
+        """
+        Jalankan satu step untuk semua dunia
+
+        Args:
+            inputs1 (np.ndarray): Input paddle 1 per dunia (-1 naik, 0 diam, 1 turun)
+            inputs2 (np.ndarray): Input paddle 2 per dunia
+
+        Returns:
+            np.ndarray: Array bool dunia yang game over pada step ini
+                (hasilnya ada di final_winner, final_score1, final_score2)
+        """
+        radius = self.BALL_RADIUS
+        active = self.respawn_timer == 0
+
+        # Update posisi bola (bola yang menunggu respawn tidak bergerak)
+        self.ball_x += np.where(active, self.ball_vx, 0.0)
+        self.ball_y += np.where(active, self.ball_vy, 0.0)
+
+        # Update paddle dengan boundary checking
+        max_y = self.HEIGHT - self.PADDLE_HEIGHT
+        self.paddle1_y += np.asarray(inputs1) * self.PADDLE_SPEED
+        np.clip(self.paddle1_y, 0, max_y, out=self.paddle1_y)
+        self.paddle2_y += np.asarray(inputs2) * self.PADDLE_SPEED
+        np.clip(self.paddle2_y, 0, max_y, out=self.paddle2_y)
+
+        # Collision dengan dinding atas/bawah
+        top = self.ball_y - radius < 0
+        bottom = ~top & (self.ball_y + radius > self.HEIGHT)
+        self.ball_y[top] = radius
+        self.ball_y[bottom] = self.HEIGHT - radius
+        np.logical_or(top, bottom, out=self.wall_hit)
+        self.ball_vy[self.wall_hit] *= -1
+
+        # Collision dengan paddle (paddle 2 hanya dicek jika paddle 1 tidak kena)
+        hit1 = self._paddle_collision(self.PADDLE1_X, self.paddle1_y) & (self.ball_vx < 0)
+        hit2 = ~hit1 & self._paddle_collision(self.PADDLE2_X, self.paddle2_y) & (self.ball_vx > 0)
+        self._bounce(hit1, self.paddle1_y, 1.0)
+        self._bounce(hit2, self.paddle2_y, -1.0)
+        np.logical_or(hit1, hit2, out=self.paddle_hit)
+
+        # Scoring
+        scored2 = self.ball_x < 0
+        scored1 = ~scored2 & (self.ball_x > self.WIDTH)
+        self.score2 += scored2
+        self.score1 += scored1
+        self.scored[:] = 0
+        self.scored[scored1] = 1
+        self.scored[scored2] = 2
+        scored = scored1 | scored2
+        self._reset_ball(scored)
+
+        # Respawn timer: yang baru skor mulai menunggu, lalu semua hitung mundur
+        timer = self.respawn_timer
+        timer[scored] = self.BALL_RESPAWN_DELAY
+        timer[timer > 0] -= 1
+
+        # Game over
+        self.winner[self.score1 >= self.WINNING_SCORE] = 1
+        self.winner[self.score2 >= self.WINNING_SCORE] = 2
+        done = self.winner > 0
+        self.final_winner[:] = self.winner
+        np.multiply(self.score1, done, out=self.final_score1)
+        np.multiply(self.score2, done, out=self.final_score2)
+        if self.__auto_reset and done.any():
+            self.reset(done)
+        return done
@@ -0,0 +1,4 @@
+"""
+Benchmark suite untuk hot path simulasi dan rendering
+Jalankan dari root project: python -m benchmarks.run --help
+"""
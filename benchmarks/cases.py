@@ -0,0 +1,434 @@
+"""
+Daftar benchmark untuk hot path game
+Setiap benchmark adalah factory(context) yang menyiapkan state lalu
+mengembalikan fungsi run(n) yang menjalankan n operasi
+"""
+
+from ball import Ball
+from paddle import Paddle
+from powerup import PowerUp
+from particle import ParticleSystem
+from simulation import PongSimulation
+from batch_simulation import BatchPongSimulation
+from fast_forward import FastForward
+from multi_ball import MultiBallSimulation
+from snapshot import take_snapshot, restore_snapshot
+from rollback import RollbackSession
+from ai_player import AIController
+from rl_env import PongEnv
+
+BENCHMARKS = []
+
+
+class Benchmark:
+    """Data satu benchmark yang terdaftar"""
+
+    def __init__(self, name, group, factory, needs_display):
+        """
+        Constructor untuk Benchmark
+
+        Args:
+            name (str): Nama unik benchmark (dipakai di file hasil)
+            group (str): Kelompok benchmark (simulation atau render)
+            factory: Fungsi factory(context) -> run(n)
+            needs_display (bool): True jika butuh Tk dan X display
+        """
+        self.name = name
+        self.group = group
+        self.factory = factory
+        self.needs_display = needs_display
+
+
+def benchmark(name, group="simulation", needs_display=False):
+    """
+    Decorator untuk mendaftarkan factory benchmark
+
+    Args:
+        name (str): Nama unik benchmark
+        group (str): Kelompok benchmark
+        needs_display (bool): True jika butuh Tk canvas
+    """
+    def decorator(factory):
+        BENCHMARKS.append(Benchmark(name, group, factory, needs_display))
+        return factory
+    return decorator
+
+
+def _make_ball():
+    """Buat bola dengan posisi dan kecepatan tetap"""
+    ball = Ball(400, 300, 10, "#00d4ff", 5)
+    ball.set_velocity_x(3.0)
+    ball.set_velocity_y(4.0)
+    return ball
+
+
+# ===== Simulation =====
+
+@benchmark("ball.update")
+def bench_ball_update(context):
+    ball = _make_ball()
+
+    def run(n):
+        for _ in range(n):
+            ball.update()
+    return run
+
+
+@benchmark("paddle.update")
+def bench_paddle_update(context):
+    paddle = Paddle(30, 250, 15, 100, "#FF6B6B", 7)
+    paddle.move_down()
+
+    def run(n):
+        for _ in range(n):
+            paddle.update()
+    return run
+
+
+@benchmark("game_object.collides_with")
+def bench_collides_with(context):
+    ball = _make_ball()
+    paddle = Paddle(30, 250, 15, 100, "#FF6B6B", 7)
+
+    def run(n):
+        for _ in range(n):
+            ball.collides_with(paddle)
+    return run
+
+
+@benchmark("particle_system.update.heavy")
+def bench_particle_update_heavy(context):
+    particles = ParticleSystem()
+
+    def run(n):
+        # Burst skor + tabrakan dinding + paddle setiap frame
+        for _ in range(n):
+            particles.emit(400, 300, "#FF6B6B", count=30)
+            particles.emit(400, 0, "#00d4ff", count=8)
+            particles.emit(30, 300, "#4ECDC4", count=10)
+            particles.update()
+    return run
+
+
+@benchmark("powerup.update")
+def bench_powerup_update(context):
+    powerup = PowerUp(400, 300, 20, PowerUp.SPEED_BOOST)
+
+    def run(n):
+        for _ in range(n):
+            powerup.update()
+    return run
+
+
+@benchmark("simulation.step")
+def bench_simulation_step(context):
+    simulation = PongSimulation()
+    inputs = (PongSimulation.MOVE_DOWN, PongSimulation.MOVE_UP)
+
+    def run(n):
+        for _ in range(n):
+            if simulation.is_game_over():
+                simulation.reset()
+            simulation.step(inputs)
+    return run
+
+
+@benchmark("simulation.step.headless")
+def bench_simulation_step_headless(context):
+    simulation = PongSimulation(particles=False)
+    inputs = (PongSimulation.MOVE_DOWN, PongSimulation.MOVE_UP)
+
+    def run(n):
+        for _ in range(n):
+            if simulation.is_game_over():
+                simulation.reset()
+            simulation.step(inputs)
+    return run
+
+
+@benchmark("fast_forward.frames")
+def bench_fast_forward(context):
+    simulation = PongSimulation(particles=False, seed=1)
+    fast_forward = FastForward(simulation)
+    inputs = (PongSimulation.STOP, PongSimulation.STOP)
+
+    # Satu operasi = satu frame simulasi (dilompati atau dijalankan)
+    def run(n):
+        while n > 0:
+            if simulation.is_game_over():
+                simulation.reset()
+            start = simulation.get_frame()
+            fast_forward.advance(inputs, n)
+            n -= simulation.get_frame() - start
+    return run
+
+
+@benchmark("batch_simulation.step.1024")
+def bench_batch_simulation_step(context):
+    import numpy as np
+    batch = BatchPongSimulation(1024, seed=0)
+    inputs = np.zeros(1024, dtype=np.int8)
+
+    # Satu operasi = satu step untuk 1024 dunia
+    def run(n):
+        for _ in range(n):
+            batch.step(inputs, inputs)
+    return run
+
+
+def _midgame_simulation():
+    """Simulasi headless di tengah pertandingan"""
+    simulation = PongSimulation(particles=False, seed=0)
+    for _ in range(500):
+        simulation.step((PongSimulation.MOVE_DOWN, PongSimulation.MOVE_UP))
+    return simulation
+
+
+@benchmark("snapshot.take")
+def bench_snapshot_take(context):
+    simulation = _midgame_simulation()
+    buffer = take_snapshot(simulation)
+
+    def run(n):
+        for _ in range(n):
+            take_snapshot(simulation, buffer)
+    return run
+
+
+@benchmark("snapshot.restore")
+def bench_snapshot_restore(context):
+    simulation = _midgame_simulation()
+    data = bytes(take_snapshot(simulation))
+
+    def run(n):
+        for _ in range(n):
+            restore_snapshot(simulation, data)
+    return run
+
+
+@benchmark("rollback.8_frames")
+def bench_rollback(context):
+    simulation = PongSimulation(particles=False, seed=0)
+
+    # Satu operasi = 8 frame prediksi lalu rollback dan simulasi ulang 8 frame
+    def run(n):
+        session = RollbackSession(simulation, 1, max_rollback=8)
+        for _ in range(n):
+            if simulation.is_game_over():
+                simulation.reset()
+                session = RollbackSession(simulation, 1, max_rollback=8)
+            first = session.get_frame() + 1
+            for _ in range(8):
+                session.advance(PongSimulation.MOVE_DOWN)
+            for frame in range(first, first + 8):
+                session.add_remote_input(frame, PongSimulation.MOVE_UP)
+            session.synchronize()
+    return run
+
+
+@benchmark("ai.get_input")
+def bench_ai_get_input(context):
+    simulation = _midgame_simulation()
+    controller = AIController(2, "hard", seed=0)
+
+    def run(n):
+        for _ in range(n):
+            controller.get_input(simulation)
+    return run
+
+
+@benchmark("ai.match_step.32")
+def bench_ai_match_step(context):
+    matches = [
+        (PongSimulation(particles=False, seed=seed), AIController(1, "hard", seed=seed), AIController(2, "medium", seed=seed))
+        for seed in range(32)
+    ]
+
+    # Satu operasi = satu step untuk 32 pertandingan AI vs AI
+    def run(n):
+        for _ in range(n):
+            for simulation, player1, player2 in matches:
+                if simulation.is_game_over():
+                    simulation.reset()
+                    player1.reset()
+                    player2.reset()
+                simulation.step((player1.get_input(simulation), player2.get_input(simulation)))
+    return run
+
+
+@benchmark("pong_game.frame.null_renderer")
+def bench_pong_game_null_renderer(context):
+    from pong_game import PongGame
+
+    # Game lengkap (game loop, state machine UI, AI) tanpa display
+    game = PongGame()
+    game.press_key("c")
+    game.press_key("Return")
+    frame = 1.0 / PongGame.FPS
+
+    def run(n):
+        for _ in range(n):
+            if not game.game_loop.is_running():
+                game.press_key("Return")
+            game.scheduler.advance(frame)
+    return run
+
+
+def _env_factory(observation):
+    """Buat factory benchmark PongEnv.step dengan mode observasi tertentu"""
+    def factory(context):
+        env = PongEnv(observation=observation, seed=0)
+        env.reset()
+
+        # Satu operasi = satu step environment (aksi bergantian)
+        def run(n):
+            for index in range(n):
+                _, _, terminated, _, _ = env.step(index % PongEnv.ACTION_COUNT)
+                if terminated:
+                    env.reset()
+        return run
+    return factory
+
+
+benchmark("rl_env.step.vector")(_env_factory(PongEnv.OBSERVATION_VECTOR))
+benchmark("rl_env.step.pixels")(_env_factory(PongEnv.OBSERVATION_PIXELS))
+
+
+def _multi_ball_factory(ball_collisions):
+    """Buat factory benchmark step multi-ball dengan 256 bola"""
+    def factory(context):
+        simulation = MultiBallSimulation(
+            num_balls=256,
+            ball_collisions=ball_collisions,
+            particles=False,
+            seed=0
+        )
+        inputs = (PongSimulation.MOVE_DOWN, PongSimulation.MOVE_UP)
+
+        # Satu operasi = satu step untuk 256 bola
+        def run(n):
+            for _ in range(n):
+                if simulation.is_game_over():
+                    simulation.reset()
+                simulation.step(inputs)
+        return run
+    return factory
+
+
+benchmark("multi_ball.step.256")(_multi_ball_factory(False))
+benchmark("multi_ball.step.256.ball_collisions")(_multi_ball_factory(True))
+
+
+# ===== Rendering (Tk canvas di bawah X display) =====
+
+def _new_canvas(context):
+    """Buat canvas baru di root Tk milik runner"""
+    import tkinter as tk
+    canvas = tk.Canvas(context["root"], width=800, height=600)
+    canvas.pack()
+    return canvas
+
+
+def _draw_frame(target, simulation):
+    """Gambar semua objek simulasi seperti PongGame._render"""
+    simulation.ball.draw(target)
+    simulation.paddle1.draw(target)
+    simulation.paddle2.draw(target)
+    powerup = simulation.get_current_powerup()
+    if powerup and powerup.is_active():
+        powerup.draw(target)
+    simulation.particle_system.draw(target)
+
+
+def _busy_simulation(particle_scale=1.0):
+    """Simulasi dengan power-up dan banyak particle untuk benchmark render"""
+    simulation = PongSimulation()
+    simulation.particle_system.set_emission_scale(particle_scale)
+    for _ in range(30):
+        simulation.step()
+    simulation.particle_system.emit(400, 300, "#FF6B6B", count=60)
+    return simulation
+
+
+@benchmark("draw.immediate", group="render", needs_display=True)
+def bench_draw_immediate(context):
+    canvas = _new_canvas(context)
+    simulation = _busy_simulation()
+    powerup = PowerUp(400, 300, 20, PowerUp.SIZE_BOOST)
+
+    def run(n):
+        for _ in range(n):
+            # Cara lama: hapus lalu buat ulang semua item
+            canvas.delete("ball", "paddle", "powerup", "particle")
+            _draw_frame(canvas, simulation)
+            powerup.draw(canvas)
+        canvas.update_idletasks()
+    return run
+
+
+def _framebuffer_factory(level):
+    """Buat factory benchmark software renderer pada tingkat kualitas tertentu"""
+    def factory(context):
+        from framebuffer import FramebufferRenderer, draw_simulation
+        from quality import QualityController
+
+        _, particle_scale, detail = QualityController.LEVELS[level]
+        renderer = FramebufferRenderer()
+        simulation = _busy_simulation(particle_scale)
+
+        # Software renderer tidak butuh display: satu operasi = satu frame penuh
+        def run(n):
+            for _ in range(n):
+                renderer.begin_frame()
+                draw_simulation(renderer, simulation, detail=detail)
+        return run
+    return factory
+
+
+benchmark("draw.framebuffer", group="render")(_framebuffer_factory(0))
+benchmark("draw.framebuffer.minimal", group="render")(_framebuffer_factory(-1))
+
+
+@benchmark("draw.sprites", group="render", needs_display=True)
+def bench_draw_sprites(context):
+    from renderer import CanvasRenderer
+    from sprite_cache import SpriteCache
+
+    canvas = _new_canvas(context)
+    renderer = CanvasRenderer(canvas)
+    sprites = SpriteCache(canvas)
+    simulation = _busy_simulation()
+    powerup = PowerUp(400, 300, 20, PowerUp.SIZE_BOOST)
+    objects = [simulation.ball, simulation.paddle1, simulation.paddle2, powerup]
+
+    def run(n):
+        for _ in range(n):
+            # Pulse power-up berganti bucket, bola bergerak: hanya coords/image berubah
+            simulation.step()
+            powerup.update()
+            renderer.begin_frame()
+            for game_object in objects:
+                game_object.draw_sprite(renderer, sprites)
+            renderer.end_frame()
+        canvas.update_idletasks()
+    return run
+
+
+@benchmark("render.pong_game", group="render", needs_display=True)
+def bench_render_pong_game(context):
+    from pong_game import PongGame
+    import tkinter as tk
+
+    window = tk.Toplevel(context["root"])
+    game = PongGame(window)
+    game.start_game()
+    game.game_loop.stop()
+    for _ in range(30):
+        game.simulation.step()
+    game.particle_system.emit(400, 300, "#FF6B6B", count=60)
+
+    def run(n):
+        for i in range(n):
+            game._render((i % 4) / 4)
+        game.renderer.get_canvas().update_idletasks()
+    return run
@@ -0,0 +1,206 @@
+"""
+Runner benchmark: mengukur operasi per detik untuk setiap benchmark,
+menyimpan hasil ke file JSON dan membandingkan dengan baseline
+
+Contoh:
+    python -m benchmarks.run --output bench_results.json
+    python -m benchmarks.run --compare bench_baseline.json --threshold 0.1
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+
+from benchmarks.cases import BENCHMARKS
+
+
+def _measure(run, min_time, repeat):
+    """
+    Ukur kecepatan fungsi run(n)
+
+    Args:
+        run: Fungsi yang menjalankan n operasi
+        min_time (float): Durasi minimal satu pengukuran (detik)
+        repeat (int): Jumlah pengulangan pengukuran
+
+    Returns:
+        dict: ops_per_sec terbaik dan median beserta jumlah operasi
+    """
+    # Kalibrasi jumlah operasi agar satu pengukuran >= min_time
+    n = 1
+    while True:
+        start = time.perf_counter()
+        run(n)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / 4 or n >= 1 << 24:
+            break
+        n *= 2
+    n = max(1, int(n * min_time / max(elapsed, 1e-9)))
+
+    rates = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(n)
+        elapsed = time.perf_counter() - start
+        rates.append(n / elapsed)
+
+    rates.sort()
+    return {
+        "ops_per_sec": rates[-1],
+        "median_ops_per_sec": rates[len(rates) // 2],
+        "ops": n,
+        "repeat": repeat
+    }
+
+
+def _start_virtual_display():
+    """
+    Siapkan X display untuk benchmark render
+    Memakai DISPLAY yang ada, atau menjalankan Xvfb jika tersedia
+
+    Returns:
+        tuple: (display tersedia (bool), proses Xvfb atau None)
+    """
+    if os.environ.get("DISPLAY"):
+        return True, None
+
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        return False, None
+
+    display = ":97"
+    process = subprocess.Popen(
+        [xvfb, display, "-screen", "0", "1024x768x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    time.sleep(0.5)
+    os.environ["DISPLAY"] = display
+    return process.poll() is None, process
+
+
+def run_benchmarks(name_filter=None, min_time=0.2, repeat=5, render=True):
+    """
+    Jalankan semua benchmark yang cocok dengan filter
+
+    Args:
+        name_filter (str): Hanya jalankan benchmark yang namanya mengandung teks ini
+        min_time (float): Durasi minimal satu pengukuran (detik)
+        repeat (int): Jumlah pengulangan per benchmark
+        render (bool): False untuk melewati benchmark render
+
+    Returns:
+        dict: Hasil dalam format file JSON benchmark
+    """
+    selected = [b for b in BENCHMARKS if not name_filter or name_filter in b.name]
+    context = {}
+    xvfb_process = None
+    skipped = []
+
+    if render and any(b.needs_display for b in selected):
+        has_display, xvfb_process = _start_virtual_display()
+        if has_display:
+            import tkinter as tk
+            context["root"] = tk.Tk()
+
+    results = {}
+    try:
+        for bench in selected:
+            if bench.needs_display and "root" not in context:
+                skipped.append(bench.name)
+                continue
+            result = _measure(bench.factory(context), min_time, repeat)
+            result["group"] = bench.group
+            results[bench.name] = result
+            print("{:<36}{:>16,.0f} ops/s".format(bench.name, result["ops_per_sec"]))
+    finally:
+        if "root" in context:
+            context["root"].destroy()
+        if xvfb_process is not None:
+            xvfb_process.terminate()
+
+    for name in skipped:
+        print("{:<36}{:>16}".format(name, "skipped (no display)"))
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "min_time": min_time,
+            "repeat": repeat
+        },
+        "results": results,
+        "skipped": skipped
+    }
+
+
+def compare_results(current, baseline, threshold):
+    """
+    Bandingkan hasil dengan baseline
+
+    Args:
+        current (dict): Hasil benchmark saat ini
+        baseline (dict): Hasil benchmark baseline
+        threshold (float): Penurunan relatif yang dianggap regresi (0.1 = 10%)
+
+    Returns:
+        list: Nama benchmark yang mengalami regresi
+    """
+    regressions = []
+    print()
+    print("{:<36}{:>14}{:>14}{:>10}".format("benchmark", "baseline", "current", "change"))
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            print("{:<36}{:>14}{:>14,.0f}{:>10}".format(name, "-", result["ops_per_sec"], "new"))
+            continue
+
+        change = result["ops_per_sec"] / base["ops_per_sec"] - 1.0
+        flag = ""
+        if change < -threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print("{:<36}{:>14,.0f}{:>14,.0f}{:>+9.1%}{}".format(
+            name, base["ops_per_sec"], result["ops_per_sec"], change, flag
+        ))
+    return regressions
+
+
+def main(argv=None):
+    """Entry point command line"""
+    parser = argparse.ArgumentParser(description="Benchmark hot path Pong game")
+    parser.add_argument("--output", help="Tulis hasil ke file JSON")
+    parser.add_argument("--compare", help="File JSON baseline untuk dibandingkan")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Penurunan relatif yang dianggap regresi (default 0.10)")
+    parser.add_argument("--filter", help="Hanya jalankan benchmark yang namanya mengandung teks ini")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="Durasi minimal satu pengukuran dalam detik")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-render", action="store_true", help="Lewati benchmark render")
+    args = parser.parse_args(argv)
+
+    current = run_benchmarks(args.filter, args.min_time, args.repeat, not args.no_render)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_results(current, baseline, args.threshold)
+        if regressions:
+            print("\n{} regression(s): {}".format(len(regressions), ", ".join(regressions)))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
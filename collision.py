@@ -0,0 +1,102 @@
+"""
+Collision kontinu (swept AABB) untuk objek yang bergerak cepat
+Menghitung waktu tabrakan (time of impact) dan normal kontak sehingga bola
+tidak menembus paddle/power-up walaupun timestep besar atau kecepatan tinggi
+"""
+
+import math
+
+
+def aabb_overlap(bounds1, bounds2):
+    """
+    Cek overlap dua AABB (aturan sama dengan GameObject.collides_with)
+
+    Args:
+        bounds1 (tuple): (left, top, right, bottom)
+        bounds2 (tuple): (left, top, right, bottom)
+
+    Returns:
+        bool: True jika beririsan (bersentuhan dihitung beririsan)
+    """
+    left1, top1, right1, bottom1 = bounds1
+    left2, top2, right2, bottom2 = bounds2
+    return not (right1 < left2 or left1 > right2 or bottom1 < top2 or top1 > bottom2)
+
+
+def _axis_times(start_min, start_max, target_min, target_max, delta):
+    """
+    Hitung waktu masuk dan keluar pada satu sumbu
+
+    Returns:
+        tuple: (entry, exit), atau None jika tidak pernah beririsan di sumbu ini
+    """
+    if delta > 0:
+        return (target_min - start_max) / delta, (target_max - start_min) / delta
+    if delta < 0:
+        return (target_max - start_min) / delta, (target_min - start_max) / delta
+    if start_max < target_min or start_min > target_max:
+        return None
+    return -math.inf, math.inf
+
+
+def swept_aabb(moving_bounds, dx, dy, target_bounds):
+    """
+    Swept AABB: kotak bergerak sejauh (dx, dy) selama t = 0..1 terhadap kotak diam
+    Untuk target yang juga bergerak, kirim perpindahan relatif
+    (perpindahan moving dikurangi perpindahan target)
+
+    Args:
+        moving_bounds (tuple): (left, top, right, bottom) kotak bergerak saat t = 0
+        dx (float): Perpindahan horizontal selama step
+        dy (float): Perpindahan vertikal selama step
+        target_bounds (tuple): (left, top, right, bottom) kotak target saat t = 0
+
+    Returns:
+        tuple: (toi, normal_x, normal_y) dengan toi di [0, 1] dan normal menunjuk
+            keluar dari sisi target yang ditabrak, atau None jika tidak bertabrakan
+    """
+    left, top, right, bottom = moving_bounds
+    target_left, target_top, target_right, target_bottom = target_bounds
+
+    # Sudah beririsan di awal step: kontak pada t = 0, normal melawan gerakan
+    if aabb_overlap(moving_bounds, target_bounds):
+        if abs(dx) >= abs(dy):
+            return (0.0, -1.0 if dx > 0 else 1.0, 0.0)
+        return (0.0, 0.0, -1.0 if dy > 0 else 1.0)
+
+    x_times = _axis_times(left, right, target_left, target_right, dx)
+    if x_times is None:
+        return None
+    y_times = _axis_times(top, bottom, target_top, target_bottom, dy)
+    if y_times is None:
+        return None
+
+    x_entry, x_exit = x_times
+    y_entry, y_exit = y_times
+    entry = max(x_entry, y_entry)
+    exit_time = min(x_exit, y_exit)
+
+    if entry > exit_time or entry > 1.0 or entry < 0.0:
+        return None
+
+    # Sumbu yang masuk paling akhir menentukan sisi kontak
+    if x_entry > y_entry:
+        return (entry, -1.0 if dx > 0 else 1.0, 0.0)
+    return (entry, 0.0, -1.0 if dy > 0 else 1.0)
+
+
+def ray_box(origin_x, origin_y, dx, dy, target_bounds):
+    """
+    Ray vs box: titik bergerak sejauh (dx, dy) terhadap kotak diam
+
+    Args:
+        origin_x (float): Posisi x titik awal
+        origin_y (float): Posisi y titik awal
+        dx (float): Perpindahan horizontal
+        dy (float): Perpindahan vertikal
+        target_bounds (tuple): (left, top, right, bottom)
+
+    Returns:
+        tuple: (toi, normal_x, normal_y) atau None
+    """
+    return swept_aabb((origin_x, origin_y, origin_x, origin_y), dx, dy, target_bounds)
@@ -0,0 +1,226 @@
+"""
+FastForward - Simulasi berbasis event yang melompat ke collision berikutnya
+Di antara kontak dengan dinding, paddle dan power-up bola bergerak lurus,
+sehingga frame-frame kosong bisa dilompati sekaligus secara analitik
+"""
+
+import math
+
+class FastForward:
+    """
+    Pembungkus PongSimulation untuk menjalankan banyak step dengan input konstan
+    Waktu menuju event berikutnya (dinding, masuk area paddle/power-up, skor,
+    timer habis, spawn power-up) dihitung dari posisi dan velocity. Frame
+    sebelum event dilompati dengan PongSimulation.skip_idle_frames(), sedangkan
+    frame di sekitar event dijalankan dengan step() biasa. Dengan input konstan
+    urutan event dan hasil pertandingan sama dengan menjalankan step() satu per
+    satu (posisi hanya berbeda sebatas pembulatan floating point).
+    """
+
+    # Frame terakhir sebelum event tetap dijalankan normal sebagai pengaman
+    # terhadap selisih pembulatan perhitungan analitik
+    SAFETY_FRAMES = 1
+
+    def __init__(self, simulation):
+        """
+        Constructor untuk FastForward
+
+        Args:
+            simulation (PongSimulation): Simulasi yang dimajukan
+        """
+        self.__simulation = simulation
+        self.__skipped_frames = 0
+
+    def get_skipped_frames(self):
+        """Mengambil total frame yang dilompati tanpa step()"""
+        return self.__skipped_frames
+
+    def advance(self, inputs, frames):
+        """
+        Majukan simulasi sebanyak frames step dengan input konstan
+
+        Args:
+            inputs (tuple): (input_player1, input_player2) untuk semua step
+            frames (int): Jumlah step yang dijalankan
+
+        Returns:
+            list: Semua event yang terjadi, berurutan
+        """
+        simulation = self.__simulation
+        events = []
+        remaining = frames
+
+        while remaining > 0 and not simulation.is_game_over():
+            # Step pertama menerapkan input (dan menangani event saat ini)
+            events.extend(simulation.step(inputs))
+            remaining -= 1
+
+            skip = self.idle_frames(remaining)
+            if skip > 0:
+                simulation.skip_idle_frames(skip)
+                self.__skipped_frames += skip
+                remaining -= skip
+
+        return events
+
+    def run_until_game_over(self, inputs, max_frames=10 ** 7):
+        """
+        Jalankan simulasi dengan input konstan sampai ada pemenang
+
+        Args:
+            inputs (tuple): (input_player1, input_player2)
+            max_frames (int): Batas jumlah step
+
+        Returns:
+            list: Semua event yang terjadi
+        """
+        return self.advance(inputs, max_frames)
+
+    def idle_frames(self, limit):
+        """
+        Hitung berapa step bisa dilompati sebelum event berikutnya
+        (dipakai game untuk menidurkan game loop selama tidak ada yang bergerak)
+
+        Args:
+            limit (int): Batas pencarian
+
+        Returns:
+            int: Jumlah step yang aman dilompati (0 jika tidak ada)
+        """
+        return max(0, min(self.frames_until_event(limit) - 1 - self.SAFETY_FRAMES, limit))
+
+    def frames_until_event(self, limit):
+        """
+        Hitung berapa step lagi event berikutnya terjadi
+
+        Args:
+            limit (int): Batas pencarian (step tersisa)
+
+        Returns:
+            int: Nomor step (>= 1) saat event pertama bisa terjadi,
+                atau limit + 1 jika tidak ada event dalam batas
+        """
+        simulation = self.__simulation
+        nearest = limit + 1
+        # Event sedekat ini berarti tidak ada frame yang bisa dilompati
+        no_skip = 1 + self.SAFETY_FRAMES
+
+        # Particle di-update setiap step, jangan lompati selama masih ada
+        if simulation.particle_system.get_particle_count() > 0:
+            return 1
+
+        # Timer yang habis mengubah state (timer bisa pecahan setelah
+        # step dengan dt pecahan, habis pada step ke-ceil(timer))
+        powerup_timer = simulation.get_powerup_timer()
+        if powerup_timer > 0:
+            nearest = min(nearest, math.ceil(powerup_timer))
+
+        respawn_timer = simulation.get_ball_respawn_timer()
+        if respawn_timer > 0:
+            nearest = min(nearest, math.ceil(respawn_timer))
+
+        powerup = simulation.get_current_powerup()
+        if powerup is not None and powerup.is_active():
+            nearest = min(nearest, math.ceil(powerup.get_lifetime()))
+
+        ball = simulation.ball
+        if ball.is_active():
+            nearest = min(nearest, self._ball_event_frames(simulation, powerup))
+            if nearest <= no_skip:
+                return nearest
+        elif powerup is not None and powerup.is_active() and ball.collides_with(powerup):
+            # Bola yang menunggu respawn tetap bisa mengambil power-up
+            return 1
+
+        # Peluang spawn diundi setiap step selama tidak ada power-up
+        if nearest > no_skip and (powerup is None or not powerup.is_active()):
+            nearest = min(nearest, self._frames_until_spawn(simulation, nearest - 1))
+
+        return max(1, nearest)
+
+    def _ball_event_frames(self, simulation, powerup):
+        """
+        Hitung step sampai bola menyentuh dinding, masuk area paddle/power-up
+        atau keluar layar
+
+        Returns:
+            float: Nomor step event terdekat (inf jika tidak ada)
+        """
+        ball = simulation.ball
+        x = ball.get_x()
+        y = ball.get_y()
+        vx = ball.get_velocity_x()
+        vy = ball.get_velocity_y()
+        radius = ball.get_radius()
+        size = ball.get_width()
+        nearest = math.inf
+
+        # Dinding atas/bawah: y - r < 0 atau y + r > HEIGHT
+        if vy < 0:
+            nearest = min(nearest, math.floor((y - radius) / -vy) + 1)
+        elif vy > 0:
+            nearest = min(nearest, math.floor((simulation.HEIGHT - radius - y) / vy) + 1)
+
+        # Skor: x < 0 atau x > WIDTH
+        if vx < 0:
+            nearest = min(nearest, math.floor(x / -vx) + 1)
+        elif vx > 0:
+            nearest = min(nearest, math.floor((simulation.WIDTH - x) / vx) + 1)
+
+        # Paddle hanya bisa memantulkan bola yang bergerak ke arahnya
+        if vx < 0:
+            paddle = simulation.paddle1
+            nearest = min(nearest, self._band_entry_frames(x, vx, size, paddle.get_x(), paddle.get_width()))
+        elif vx > 0:
+            paddle = simulation.paddle2
+            nearest = min(nearest, self._band_entry_frames(x, vx, size, paddle.get_x(), paddle.get_width()))
+
+        if powerup is not None and powerup.is_active():
+            nearest = min(nearest, self._band_entry_frames(x, vx, size, powerup.get_x(), powerup.get_width()))
+
+        return nearest
+
+    @staticmethod
+    def _band_entry_frames(x, vx, size, band_x, band_width):
+        """
+        Hitung step sampai kotak bola [x, x + size] mulai beririsan dengan
+        rentang horizontal [band_x, band_x + band_width]
+
+        Returns:
+            float: Nomor step (1 jika sudah beririsan, inf jika tidak akan)
+        """
+        band_right = band_x + band_width
+        if vx > 0:
+            if x > band_right:
+                return math.inf
+            if x + size >= band_x:
+                return 1
+            return math.ceil((band_x - size - x) / vx)
+        if vx < 0:
+            if x + size < band_x:
+                return math.inf
+            if x <= band_right:
+                return 1
+            return math.ceil((x - band_right) / -vx)
+        return 1 if band_x <= x + size and x <= band_right else math.inf
+
+    @staticmethod
+    def _frames_until_spawn(simulation, limit):
+        """
+        Cari step pertama saat undian spawn power-up berhasil
+        State RNG dikembalikan setelah pencarian agar undian yang sama
+        tetap terjadi saat frame dijalankan
+
+        Returns:
+            int: Nomor step spawn, atau limit + 1 jika tidak dalam batas
+        """
+        rng = simulation.get_rng()
+        chance = simulation.POWERUP_SPAWN_CHANCE
+        state = rng.getstate()
+        found = limit + 1
+        for frame in range(1, limit + 1):
+            if rng.random() < chance:
+                found = frame
+                break
+        rng.setstate(state)
+        return found
@@ -0,0 +1,472 @@
+"""
+FramebufferRenderer - Software renderer ke array NumPy RGB
+Menyediakan create_oval/create_rectangle/create_polygon/create_text dengan
+signature Tkinter Canvas sehingga method draw() milik objek game bisa
+menggambar langsung ke array yang dialokasikan sekali. Hasilnya bisa
+ditampilkan di jendela Tk sebagai satu image per frame, atau dipakai
+tanpa display sama sekali (test pixel, export video, observasi agent).
+
+Export video: python framebuffer.py --frames 600 --output match.ppm
+lalu: ffmpeg -f image2pipe -vcodec ppm -r 60 -i match.ppm match.mp4
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from game_object import GameObject
+from sprite_cache import parse_hex_color, polygon_mask, render_arena
+
+# Warna bernama yang dipakai game (warna hex dibaca langsung)
+NAMED_COLORS = {
+    "white": (255, 255, 255),
+    "black": (0, 0, 0),
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "yellow": (255, 255, 0),
+    "gray": (190, 190, 190),
+}
+
+# Font bitmap 5x7: setiap baris glyph adalah 5 bit (bit 4 = kolom kiri)
+FONT_WIDTH = 5
+FONT_HEIGHT = 7
+FONT = {
+    "0": (0x0E, 0x11, 0x13, 0x15, 0x19, 0x11, 0x0E),
+    "1": (0x04, 0x0C, 0x04, 0x04, 0x04, 0x04, 0x0E),
+    "2": (0x0E, 0x11, 0x01, 0x02, 0x04, 0x08, 0x1F),
+    "3": (0x1F, 0x02, 0x04, 0x02, 0x01, 0x11, 0x0E),
+    "4": (0x02, 0x06, 0x0A, 0x12, 0x1F, 0x02, 0x02),
+    "5": (0x1F, 0x10, 0x1E, 0x01, 0x01, 0x11, 0x0E),
+    "6": (0x06, 0x08, 0x10, 0x1E, 0x11, 0x11, 0x0E),
+    "7": (0x1F, 0x01, 0x02, 0x04, 0x08, 0x08, 0x08),
+    "8": (0x0E, 0x11, 0x11, 0x0E, 0x11, 0x11, 0x0E),
+    "9": (0x0E, 0x11, 0x11, 0x0F, 0x01, 0x02, 0x0C),
+    "A": (0x0E, 0x11, 0x11, 0x11, 0x1F, 0x11, 0x11),
+    "B": (0x1E, 0x11, 0x11, 0x1E, 0x11, 0x11, 0x1E),
+    "C": (0x0E, 0x11, 0x10, 0x10, 0x10, 0x11, 0x0E),
+    "D": (0x1C, 0x12, 0x11, 0x11, 0x11, 0x12, 0x1C),
+    "E": (0x1F, 0x10, 0x10, 0x1E, 0x10, 0x10, 0x1F),
+    "F": (0x1F, 0x10, 0x10, 0x1E, 0x10, 0x10, 0x10),
+    "G": (0x0E, 0x11, 0x10, 0x17, 0x11, 0x11, 0x0F),
+    "H": (0x11, 0x11, 0x11, 0x1F, 0x11, 0x11, 0x11),
+    "I": (0x0E, 0x04, 0x04, 0x04, 0x04, 0x04, 0x0E),
+    "J": (0x07, 0x02, 0x02, 0x02, 0x02, 0x12, 0x0C),
+    "K": (0x11, 0x12, 0x14, 0x18, 0x14, 0x12, 0x11),
+    "L": (0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x1F),
+    "M": (0x11, 0x1B, 0x15, 0x15, 0x11, 0x11, 0x11),
+    "N": (0x11, 0x11, 0x19, 0x15, 0x13, 0x11, 0x11),
+    "O": (0x0E, 0x11, 0x11, 0x11, 0x11, 0x11, 0x0E),
+    "P": (0x1E, 0x11, 0x11, 0x1E, 0x10, 0x10, 0x10),
+    "Q": (0x0E, 0x11, 0x11, 0x11, 0x15, 0x12, 0x0D),
+    "R": (0x1E, 0x11, 0x11, 0x1E, 0x14, 0x12, 0x11),
+    "S": (0x0F, 0x10, 0x10, 0x0E, 0x01, 0x01, 0x1E),
+    "T": (0x1F, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04),
+    "U": (0x11, 0x11, 0x11, 0x11, 0x11, 0x11, 0x0E),
+    "V": (0x11, 0x11, 0x11, 0x11, 0x11, 0x0A, 0x04),
+    "W": (0x11, 0x11, 0x11, 0x15, 0x15, 0x15, 0x0A),
+    "X": (0x11, 0x11, 0x0A, 0x04, 0x0A, 0x11, 0x11),
+    "Y": (0x11, 0x11, 0x11, 0x0A, 0x04, 0x04, 0x04),
+    "Z": (0x1F, 0x01, 0x02, 0x04, 0x08, 0x10, 0x1F),
+    " ": (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
+    "!": (0x04, 0x04, 0x04, 0x04, 0x04, 0x00, 0x04),
+    "-": (0x00, 0x00, 0x00, 0x1F, 0x00, 0x00, 0x00),
+    ".": (0x00, 0x00, 0x00, 0x00, 0x00, 0x0C, 0x0C),
+    ":": (0x00, 0x0C, 0x0C, 0x00, 0x0C, 0x0C, 0x00),
+    "/": (0x01, 0x01, 0x02, 0x04, 0x08, 0x10, 0x10),
+    "⚡": (0x02, 0x04, 0x08, 0x1F, 0x02, 0x04, 0x08),
+    "⬆": (0x04, 0x0E, 0x15, 0x04, 0x04, 0x04, 0x04),
+}
+
+# Posisi titik anchor Tk di dalam kotak text (fraksi lebar, fraksi tinggi)
+ANCHORS = {
+    "nw": (0.0, 0.0), "n": (0.5, 0.0), "ne": (1.0, 0.0),
+    "w": (0.0, 0.5), "center": (0.5, 0.5), "e": (1.0, 0.5),
+    "sw": (0.0, 1.0), "s": (0.5, 1.0), "se": (1.0, 1.0),
+}
+
+# Batas jumlah bitmap text yang disimpan (text score jarang berubah)
+TEXT_CACHE_SIZE = 256
+
+
+def text_bitmap(text, scale):
+    """
+    Bitmap text dengan font 5x7 yang diperbesar scale kali
+
+    Args:
+        text (str): Text (huruf kecil dianggap huruf besar, karakter lain kosong)
+        scale (int): Ukuran satu pixel font dalam pixel layar
+
+    Returns:
+        numpy.ndarray: Mask bool (tinggi, lebar)
+    """
+    if not text:
+        return np.zeros((0, 0), dtype=bool)
+    blank = FONT[" "]
+    columns = []
+    for index, char in enumerate(text.upper()):
+        rows = FONT.get(char, blank)
+        glyph = np.array([[(row >> (FONT_WIDTH - 1 - col)) & 1 for col in range(FONT_WIDTH)]
+                          for row in rows], dtype=bool)
+        if index:
+            columns.append(np.zeros((FONT_HEIGHT, 1), dtype=bool))  # spasi antar huruf
+        columns.append(glyph)
+    bitmap = np.hstack(columns)
+    return bitmap.repeat(scale, axis=0).repeat(scale, axis=1)
+
+
+def font_scale(font):
+    """
+    Skala font bitmap dari option font Tk, misalnya ("Arial", 48, "bold")
+
+    Returns:
+        int: Ukuran satu pixel font (minimal 1)
+    """
+    size = 12
+    if isinstance(font, (tuple, list)) and len(font) > 1:
+        size = font[1]
+    elif isinstance(font, str) and font.split()[1:]:
+        size = font.split()[1]
+    try:
+        size = abs(int(size))
+    except ValueError:
+        size = 12
+    return max(1, round(size / 8))
+
+
+class FramebufferRenderer:
+    """
+    Pengganti canvas untuk method draw() milik objek game (seperti CanvasRenderer)
+    Setiap frame digambar ulang ke satu array uint8 (tinggi, lebar, 3) yang
+    dialokasikan sekali. Stipple "gray50" digambar sebagai blend 50%.
+    Rasterisasi memakai pusat pixel tanpa anti-aliasing sehingga hasilnya
+    selalu sama untuk state yang sama.
+    """
+
+    def __init__(self, width=800, height=600, background="#0a0e27", canvas=None, center_line=True):
+        """
+        Constructor untuk FramebufferRenderer
+
+        Args:
+            width (int): Lebar frame
+            height (int): Tinggi frame
+            background (str): Warna background
+            canvas: Tkinter canvas untuk menampilkan frame (None = tanpa display)
+            center_line (bool): True untuk menggambar garis tengah di background
+        """
+        self.__width = width
+        self.__height = height
+        self.__colors = {}
+        if center_line:
+            self.__background = np.ascontiguousarray(
+                render_arena(width, height, self._rgb(background))[:, :, :3])
+        else:
+            self.__background = np.empty((height, width, 3), dtype=np.uint8)
+            self.__background[:] = self._rgb(background)
+        self.__frame = self.__background.copy()
+
+        # Koordinat pusat pixel, di-slice untuk setiap bentuk (tanpa alokasi ulang)
+        self.__xs = np.arange(width, dtype=np.float64) + 0.5
+        self.__ys = (np.arange(height, dtype=np.float64) + 0.5)[:, np.newaxis]
+        self.__text_cache = {}
+
+        # Header PPM + frame dalam satu buffer untuk blit ke Tk / export video
+        self.__ppm_header = b"P6 %d %d 255\n" % (width, height)
+
+        self.__canvas = canvas
+        self.__photo = None
+        self.__item = None
+        if canvas is not None:
+            import tkinter as tk
+            self.__photo = tk.PhotoImage(master=canvas, width=width, height=height)
+            self.__item = canvas.create_image(0, 0, image=self.__photo, anchor="nw",
+                                              state="hidden", tags="framebuffer")
+            canvas.tag_lower(self.__item)
+
+    def get_frame(self):
+        """Mengambil array frame (tinggi, lebar, 3) uint8, dipakai ulang tiap frame"""
+        return self.__frame
+
+    def get_canvas(self):
+        """Mengambil Tkinter canvas tujuan blit (None jika tanpa display)"""
+        return self.__canvas
+
+    def get_size(self):
+        """Mengambil ukuran frame (lebar, tinggi)"""
+        return self.__width, self.__height
+
+    def begin_frame(self):
+        """Mulai frame baru dari background"""
+        np.copyto(self.__frame, self.__background)
+
+    def end_frame(self):
+        """Tampilkan frame di canvas sebagai satu image (jika ada canvas)"""
+        if self.__canvas is None:
+            return
+        self.__photo.configure(data=self.to_ppm(), format="ppm")
+        self.__canvas.itemconfigure(self.__item, state="normal")
+
+    def hide_all(self):
+        """Sembunyikan frame (misalnya saat kembali ke menu)"""
+        np.copyto(self.__frame, self.__background)
+        if self.__canvas is not None:
+            self.__canvas.itemconfigure(self.__item, state="hidden")
+
+    def to_ppm(self):
+        """
+        Frame saat ini dalam format PPM biner (P6)
+
+        Returns:
+            bytes: Header + pixel RGB
+        """
+        return self.__ppm_header + self.__frame.tobytes()
+
+    def write_ppm(self, file):
+        """
+        Tulis frame saat ini ke file biner (PPM beruntun bisa dibaca ffmpeg)
+
+        Args:
+            file: File object mode biner
+        """
+        file.write(self.__ppm_header)
+        file.write(memoryview(self.__frame).cast("B"))
+
+    def _rgb(self, color):
+        """Ubah warna Tk (hex atau nama) menjadi array (r, g, b) uint8"""
+        rgb = self.__colors.get(color)
+        if rgb is None:
+            value = parse_hex_color(color)
+            if value is None:
+                value = NAMED_COLORS.get(str(color).lower())
+            if value is None and self.__canvas is not None:
+                value = tuple(channel >> 8 for channel in self.__canvas.winfo_rgb(color))
+            if value is None:
+                raise ValueError(f"Warna tidak dikenal: {color}")
+            rgb = self.__colors[color] = np.array(value, dtype=np.uint8)
+        return rgb
+
+    def _region(self, left, top, right, bottom):
+        """
+        Area pixel yang bisa tersentuh bentuk, dipotong ke batas frame
+
+        Returns:
+            tuple: (slice y, slice x) atau None jika di luar frame
+        """
+        x0 = max(0, int(np.floor(left)))
+        y0 = max(0, int(np.floor(top)))
+        x1 = min(self.__width, int(np.ceil(right)) + 1)
+        y1 = min(self.__height, int(np.ceil(bottom)) + 1)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return slice(y0, y1), slice(x0, x1)
+
+    def _paint(self, region, mask, color, stipple=""):
+        """Warnai pixel mask di area region (stipple = blend 50%)"""
+        if color == "" or color is None:
+            return
+        target = self.__frame[region]
+        rgb = self._rgb(color)
+        if stipple:
+            target[mask] = ((target[mask].astype(np.uint16) + rgb) >> 1).astype(np.uint8)
+        else:
+            target[mask] = rgb
+
+    @staticmethod
+    def _coords(coords):
+        """Ratakan coords (boleh berupa satu list) menjadi tuple angka"""
+        if len(coords) == 1:
+            coords = tuple(coords[0])
+        return coords
+
+    def create_oval(self, *coords, **options):
+        """Gambar oval ke frame"""
+        if options.get("state") == "hidden":
+            return None
+        x1, y1, x2, y2 = self._coords(coords)
+        left, right = min(x1, x2), max(x1, x2)
+        top, bottom = min(y1, y2), max(y1, y2)
+        cx, cy = (left + right) / 2, (top + bottom) / 2
+        rx, ry = (right - left) / 2, (bottom - top) / 2
+        outline = options.get("outline", "black")
+        half_width = options.get("width", 1) / 2 if outline else 0.0
+
+        region = self._region(left - half_width, top - half_width, right + half_width, bottom + half_width)
+        if region is None:
+            return None
+        dx = self.__xs[region[1]] - cx
+        dy = self.__ys[region[0]] - cy
+
+        def inside(grow):
+            if rx + grow <= 0 or ry + grow <= 0:
+                return np.zeros((dy.shape[0], dx.shape[0]), dtype=bool)
+            return (dx / (rx + grow)) ** 2 + (dy / (ry + grow)) ** 2 <= 1.0
+
+        self._paint(region, inside(0.0), options.get("fill", ""), options.get("stipple", ""))
+        if half_width:
+            self._paint(region, inside(half_width) & ~inside(-half_width), outline)
+        return None
+
+    def create_rectangle(self, *coords, **options):
+        """Gambar rectangle ke frame"""
+        if options.get("state") == "hidden":
+            return None
+        x1, y1, x2, y2 = self._coords(coords)
+        left, right = min(x1, x2), max(x1, x2)
+        top, bottom = min(y1, y2), max(y1, y2)
+        outline = options.get("outline", "black")
+        half_width = options.get("width", 1) / 2 if outline else 0.0
+
+        region = self._region(left - half_width, top - half_width, right + half_width, bottom + half_width)
+        if region is None:
+            return None
+        xs = self.__xs[region[1]]
+        ys = self.__ys[region[0]]
+
+        def inside(grow):
+            return ((xs >= left - grow) & (xs < right + grow)) & ((ys >= top - grow) & (ys < bottom + grow))
+
+        self._paint(region, inside(0.0), options.get("fill", ""), options.get("stipple", ""))
+        if half_width:
+            self._paint(region, inside(half_width) & ~inside(-half_width), outline)
+        return None
+
+    def create_polygon(self, *coords, **options):
+        """Gambar polygon ke frame (aturan even-odd)"""
+        if options.get("state") == "hidden":
+            return None
+        coords = self._coords(coords)
+        points = list(zip(coords[0::2], coords[1::2]))
+        outline = options.get("outline", "")
+        half_width = options.get("width", 1) / 2 if outline else 0.0
+        point_xs = [x for x, _ in points]
+        point_ys = [y for _, y in points]
+
+        region = self._region(min(point_xs) - half_width, min(point_ys) - half_width,
+                              max(point_xs) + half_width, max(point_ys) + half_width)
+        if region is None:
+            return None
+        xs = self.__xs[region[1]][np.newaxis, :]
+        ys = self.__ys[region[0]]
+
+        self._paint(region, polygon_mask(xs, ys, points), options.get("fill", "black"),
+                    options.get("stipple", ""))
+        if half_width:
+            # Outline: pixel dengan jarak ke salah satu sisi <= setengah lebar garis
+            stroke = np.zeros((ys.shape[0], xs.shape[1]), dtype=bool)
+            count = len(points)
+            for index in range(count):
+                ax, ay = points[index]
+                bx, by = points[(index + 1) % count]
+                ex, ey = bx - ax, by - ay
+                length = ex * ex + ey * ey
+                if length == 0:
+                    t = 0.0
+                else:
+                    t = np.clip(((xs - ax) * ex + (ys - ay) * ey) / length, 0.0, 1.0)
+                stroke |= (xs - ax - t * ex) ** 2 + (ys - ay - t * ey) ** 2 <= half_width * half_width
+            self._paint(region, stroke, outline)
+        return None
+
+    def create_text(self, *coords, **options):
+        """Gambar text ke frame dengan font bitmap 5x7"""
+        if options.get("state") == "hidden":
+            return None
+        x, y = self._coords(coords)[:2]
+        text = str(options.get("text", ""))
+        scale = font_scale(options.get("font"))
+
+        key = (text, scale)
+        bitmap = self.__text_cache.get(key)
+        if bitmap is None:
+            if len(self.__text_cache) >= TEXT_CACHE_SIZE:
+                self.__text_cache.clear()
+            bitmap = self.__text_cache[key] = text_bitmap(text, scale)
+
+        height, width = bitmap.shape
+        anchor_x, anchor_y = ANCHORS.get(options.get("anchor", "center"), (0.5, 0.5))
+        left = int(round(x - width * anchor_x))
+        top = int(round(y - height * anchor_y))
+
+        # Potong bitmap ke batas frame
+        x0, y0 = max(0, left), max(0, top)
+        x1, y1 = min(self.__width, left + width), min(self.__height, top + height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        mask = bitmap[y0 - top:y1 - top, x0 - left:x1 - left]
+        self._paint((slice(y0, y1), slice(x0, x1)), mask, options.get("fill", "black"))
+        return None
+
+
+def draw_simulation(target, simulation, scores=True, detail=GameObject.DETAIL_FULL):
+    """
+    Gambar satu frame simulasi seperti PongGame: bola, paddle, power-up,
+    particle dan (opsional) score
+
+    Args:
+        target: Canvas, CanvasRenderer atau FramebufferRenderer
+        simulation (PongSimulation): Simulasi yang digambar
+        scores (bool): True untuk menggambar score di atas layar
+        detail (int): Tingkat detail objek game (GameObject.DETAIL_*)
+    """
+    for ball in simulation.get_balls():
+        ball.draw(target, detail)
+    simulation.paddle1.draw(target, detail)
+    simulation.paddle2.draw(target, detail)
+    for powerup in simulation.get_powerups():
+        powerup.draw(target, detail)
+    simulation.particle_system.draw(target, detail)
+
+    if scores:
+        width = simulation.WIDTH
+        score1, score2 = simulation.get_scores()
+        target.create_text(width / 4, 50, text=str(score1), font=("Arial", 48, "bold"),
+                           fill="#FF6B6B", tags="score")
+        target.create_text(width * 3 / 4, 50, text=str(score2), font=("Arial", 48, "bold"),
+                           fill="#4ECDC4", tags="score")
+
+
+def main(argv=None):
+    """Entry point command line: render pertandingan headless ke stream PPM"""
+    from ai_player import AIController
+    from replay import MatchRecording
+    from simulation import PongSimulation
+
+    parser = argparse.ArgumentParser(description="Render pertandingan Pong ke stream PPM (video)")
+    parser.add_argument("--replay", help="file rekaman (F9); default pertandingan CPU vs CPU")
+    parser.add_argument("--frames", type=int, default=600, help="batas jumlah frame")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="-", help="file tujuan (- = stdout)")
+    args = parser.parse_args(argv)
+
+    simulation = PongSimulation(seed=args.seed)
+    if args.replay:
+        recording = MatchRecording.load(args.replay)
+        simulation.reset(recording.seed)
+        inputs = recording.iter_inputs()
+    else:
+        player1 = AIController(1, "hard", seed=args.seed)
+        player2 = AIController(2, "medium", seed=args.seed + 1)
+
+        def ai_inputs():
+            while True:
+                yield player1.get_input(simulation), player2.get_input(simulation)
+        inputs = ai_inputs()
+
+    renderer = FramebufferRenderer(simulation.WIDTH, simulation.HEIGHT)
+    output = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    try:
+        for frame, frame_inputs in enumerate(inputs):
+            if frame >= args.frames or simulation.is_game_over():
+                break
+            simulation.step(frame_inputs)
+            renderer.begin_frame()
+            draw_simulation(renderer, simulation)
+            renderer.write_ppm(output)
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
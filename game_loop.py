@@ -0,0 +1,271 @@
+"""
+FixedTimestepLoop - Game loop dengan fixed timestep untuk Tkinter
+Logika game selalu maju dengan langkah tetap (1/60 detik) apa pun beban mesin,
+sedangkan rendering memakai interpolasi di antara dua state simulasi
+ManualScheduler menggantikan root Tkinter agar loop bisa berjalan tanpa
+display dengan waktu virtual (server, CI)
+"""
+
+import heapq
+import itertools
+import time
+
+
+class ManualScheduler:
+    """
+    Pengganti after/after_cancel milik Tkinter dengan waktu virtual
+    Callback hanya dijalankan saat advance() dipanggil, sehingga hasilnya
+    deterministik dan tidak bergantung pada kecepatan mesin
+    """
+
+    def __init__(self):
+        """Constructor untuk ManualScheduler"""
+        self.__now = 0.0
+        self.__queue = []  # heap (waktu, urutan, id)
+        self.__callbacks = {}  # id -> callback yang belum dijalankan
+        self.__counter = itertools.count()
+
+    def time(self):
+        """Waktu virtual dalam detik (dipakai sebagai clock game loop)"""
+        return self.__now
+
+    def after(self, delay_ms, callback, *args):
+        """
+        Jadwalkan callback setelah delay_ms milidetik waktu virtual
+
+        Returns:
+            str: Id jadwal untuk after_cancel
+        """
+        order = next(self.__counter)
+        after_id = f"after#{order}"
+        self.__callbacks[after_id] = (callback, args)
+        heapq.heappush(self.__queue, (self.__now + delay_ms / 1000.0, order, after_id))
+        return after_id
+
+    def after_cancel(self, after_id):
+        """Batalkan callback yang sudah dijadwalkan"""
+        self.__callbacks.pop(after_id, None)
+
+    def advance(self, seconds):
+        """
+        Majukan waktu virtual dan jalankan callback yang jatuh tempo (urut waktu)
+
+        Args:
+            seconds (float): Lama waktu yang dimajukan
+        """
+        target = self.__now + seconds
+        queue = self.__queue
+        while queue and queue[0][0] <= target:
+            due, _, after_id = heapq.heappop(queue)
+            entry = self.__callbacks.pop(after_id, None)
+            if entry is None:
+                continue
+            self.__now = max(self.__now, due)
+            callback, args = entry
+            callback(*args)
+        self.__now = target
+
+
+class FixedTimestepLoop:
+    """
+    Scheduler game loop berbasis akumulator waktu
+    - Waktu nyata yang berlalu ditambahkan ke akumulator, lalu step simulasi
+      dijalankan sebanyak langkah tetap yang muat (catch-up jika tertinggal)
+    - Jumlah catch-up per frame dibatasi agar tidak terjadi "spiral of death"
+    - Jadwal frame berikutnya dihitung dari deadline absolut sehingga waktu
+      kerja frame tidak menambah jeda (tidak ada drift)
+    - Selama tidak ada yang bergerak loop bisa ditidurkan (suspend) tanpa
+      menjadwalkan frame; wake() dari input atau timer melanjutkannya
+    """
+
+    def __init__(self, root, step_callback, render_callback,
+                 steps_per_second=60, max_steps_per_frame=5, clock=time.perf_counter,
+                 skip_callback=None):
+        """
+        Constructor untuk FixedTimestepLoop
+
+        Args:
+            root: Tkinter root window atau ManualScheduler (dipakai untuk
+                after/after_cancel)
+            step_callback: Fungsi tanpa argumen, menjalankan satu step simulasi
+            render_callback: Fungsi render(alpha), alpha = posisi di antara
+                state sebelumnya (0.0) dan state terbaru (1.0)
+            steps_per_second (int): Jumlah step simulasi per detik
+            max_steps_per_frame (int): Batas step catch-up dalam satu frame
+            clock: Fungsi waktu dalam detik (bisa diganti untuk testing)
+            skip_callback: Fungsi skip(steps) yang menjalankan step yang
+                tertunda selama loop tidur sekaligus (None = dijalankan
+                sebagai catch-up biasa)
+        """
+        self.__root = root
+        self.__step_callback = step_callback
+        self.__render_callback = render_callback
+        self.__skip_callback = skip_callback
+        self.__step_duration = 1.0 / steps_per_second
+        self.__max_steps_per_frame = max_steps_per_frame
+        self.__clock = clock
+
+        self.__running = False
+        self.__suspended = False
+        self.__after_id = None
+        self.__accumulator = 0.0
+        self.__last_time = 0.0
+        self.__next_frame_time = 0.0
+        self.__dropped_time = 0.0  # Total waktu yang dibuang karena batas catch-up
+        self.__profiler = None
+        self.__frame_listener = None
+        self.__last_frame_start = None  # Awal frame sebelumnya (None = setelah start/wake)
+
+    def is_running(self):
+        """Mengecek apakah loop sedang berjalan"""
+        return self.__running
+
+    def is_suspended(self):
+        """Mengecek apakah loop sedang tidur (tidak ada frame terjadwal)"""
+        return self.__suspended
+
+    def get_step_duration(self):
+        """Mengambil durasi satu step simulasi dalam detik"""
+        return self.__step_duration
+
+    def get_dropped_time(self):
+        """Mengambil total waktu (detik) yang dibuang karena mesin terlalu lambat"""
+        return self.__dropped_time
+
+    def set_profiler(self, profiler):
+        """
+        Pasang FrameProfiler, begin_frame/end_frame dipanggil setiap frame
+
+        Args:
+            profiler (FrameProfiler): Profiler, atau None untuk mematikan
+        """
+        self.__profiler = profiler
+
+    def set_frame_listener(self, listener):
+        """
+        Pasang listener yang menerima waktu setiap frame (misalnya QualityController)
+
+        Args:
+            listener: Fungsi listener(interval, work) dalam detik: jarak dari
+                awal frame sebelumnya dan lama kerja frame ini (step + render).
+                Frame pertama setelah start/wake melaporkan interval satu step.
+                None untuk melepas listener
+        """
+        self.__frame_listener = listener
+
+    def start(self):
+        """Mulai loop dari awal (akumulator dikosongkan)"""
+        self.stop()
+        self.__running = True
+        self.__suspended = False
+        now = self.__clock()
+        self.__accumulator = 0.0
+        self.__last_time = now
+        self.__next_frame_time = now
+        self.__last_frame_start = None
+        self._tick()
+
+    def stop(self):
+        """Hentikan loop dan batalkan frame yang sudah dijadwalkan"""
+        self.__running = False
+        self.__suspended = False
+        self._cancel()
+
+    def suspend(self, wake_after=None):
+        """
+        Tidurkan loop: tidak ada frame yang dijadwalkan sampai wake()
+        Waktu selama tidur tetap dihitung dan dijalankan saat bangun
+
+        Args:
+            wake_after (float): Bangun otomatis setelah sekian detik
+                (None = hanya bangun lewat wake())
+        """
+        if not self.__running:
+            return
+        self.__suspended = True
+        self._cancel()
+        if wake_after is not None:
+            delay_ms = max(0, int(wake_after * 1000))
+            self.__after_id = self.__root.after(delay_ms, self.wake)
+
+    def wake(self):
+        """Bangunkan loop yang tidur (misalnya karena input), frame langsung dijalankan"""
+        if not self.__running or not self.__suspended:
+            return
+        self.__suspended = False
+        self._cancel()
+
+        # Step yang tertunda selama tidur dijalankan sekaligus
+        now = self.__clock()
+        self.__accumulator += now - self.__last_time
+        self.__last_time = now
+        steps = int(self.__accumulator // self.__step_duration)
+        if steps > 0 and self.__skip_callback is not None:
+            self.__accumulator -= steps * self.__step_duration
+            self.__skip_callback(steps)
+            if not self.__running:
+                return
+        self.__next_frame_time = now
+        self.__last_frame_start = None
+        self._tick()
+
+    def _cancel(self):
+        """Batalkan frame atau timer bangun yang sudah dijadwalkan"""
+        if self.__after_id is not None:
+            self.__root.after_cancel(self.__after_id)
+            self.__after_id = None
+
+    def _tick(self):
+        """Satu frame: jalankan step yang tertunda, render, lalu jadwalkan frame berikutnya"""
+        self.__after_id = None
+        if not self.__running:
+            return
+
+        profiler = self.__profiler
+        if profiler is not None:
+            profiler.begin_frame()
+
+        now = self.__clock()
+        self.__accumulator += now - self.__last_time
+        self.__last_time = now
+
+        # Catch-up: jalankan step tetap sebanyak waktu yang terkumpul
+        step_duration = self.__step_duration
+        steps = 0
+        while self.__accumulator >= step_duration and steps < self.__max_steps_per_frame:
+            self.__step_callback()
+            self.__accumulator -= step_duration
+            steps += 1
+            if not self.__running:
+                return
+            if self.__suspended:
+                break
+
+        # Mesin terlalu lambat: buang sisa waktu daripada terus tertinggal
+        # (waktu milik loop yang baru saja tidur dijalankan saat bangun)
+        if self.__accumulator >= step_duration and not self.__suspended:
+            dropped = self.__accumulator - self.__accumulator % step_duration
+            self.__dropped_time += dropped
+            self.__accumulator -= dropped
+
+        self.__render_callback(min(1.0, self.__accumulator / step_duration))
+        if profiler is not None:
+            profiler.end_frame()
+
+        listener = self.__frame_listener
+        if listener is not None:
+            previous = self.__last_frame_start
+            interval = step_duration if previous is None else now - previous
+            listener(interval, self.__clock() - now)
+        self.__last_frame_start = now
+        if not self.__running or self.__suspended:
+            return
+
+        # Deadline absolut frame berikutnya, kompensasi waktu kerja frame ini
+        self.__next_frame_time += step_duration
+        now = self.__clock()
+        if self.__next_frame_time < now - step_duration:
+            # Tertinggal lebih dari satu frame, sinkronkan ulang jadwal
+            self.__next_frame_time = now
+        delay_ms = max(0, int(round((self.__next_frame_time - now) * 1000)))
+        self.__after_id = self.__root.after(delay_ms, self._tick)
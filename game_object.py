@@ -8,8 +8,20 @@ class GameObject:
     """
     Base class untuk semua objek game
     Menggunakan ENCAPSULATION dengan private attributes
+    Atribut disimpan di __slots__ (tanpa __dict__ per objek) agar akses
+    lebih cepat dan memori lebih kecil; child class juga mendefinisikan __slots__
     """
     
+    __slots__ = ("__x", "__y", "__width", "__height", "__color", "__active")
+    
+    # Jumlah nilai yang ditulis export_state(): x, y, width, height, active
+    STATE_SIZE = 5
+    
+    # Tingkat detail gambar (diturunkan QualityController di mesin lambat)
+    DETAIL_SIMPLE = 0        # Bentuk dasar saja, power-up tanpa animasi dan icon
+    DETAIL_NO_HIGHLIGHT = 1  # Tanpa overlay highlight
+    DETAIL_FULL = 2          # Semua efek
+    
     def __init__(self, x, y, width, height, color):
         """
         Constructor untuk GameObject
@@ -79,6 +91,54 @@ class GameObject:
         """Mengatur status aktif objek"""
         self.__active = active
     
+    def move_by(self, dx, dy):
+        """
+        Geser posisi objek (jalur cepat untuk update fisika)
+        
+        Args:
+            dx (float): Perpindahan horizontal
+            dy (float): Perpindahan vertikal
+        """
+        self.__x += dx
+        self.__y += dy
+    
+    def export_state(self, buffer, offset=0):
+        """
+        Tulis state numerik objek ke buffer datar (array('d'), list, numpy)
+        Warna tidak ikut karena bukan angka dan tidak berubah selama game
+        
+        Args:
+            buffer: Buffer tujuan dengan panjang minimal offset + STATE_SIZE
+            offset (int): Index awal penulisan
+        
+        Returns:
+            int: Index setelah nilai terakhir yang ditulis
+        """
+        buffer[offset] = self.__x
+        buffer[offset + 1] = self.__y
+        buffer[offset + 2] = self.__width
+        buffer[offset + 3] = self.__height
+        buffer[offset + 4] = 1.0 if self.__active else 0.0
+        return offset + GameObject.STATE_SIZE
+    
+    def import_state(self, buffer, offset=0):
+        """
+        Baca state yang ditulis export_state()
+        
+        Args:
+            buffer: Buffer sumber
+            offset (int): Index awal pembacaan
+        
+        Returns:
+            int: Index setelah nilai terakhir yang dibaca
+        """
+        self.__x = buffer[offset]
+        self.__y = buffer[offset + 1]
+        self.__width = buffer[offset + 2]
+        self.__height = buffer[offset + 3]
+        self.__active = buffer[offset + 4] != 0.0
+        return offset + GameObject.STATE_SIZE
+    
     # Method yang akan di-override oleh child classes (Polymorphism)
     def update(self):
         """
@@ -87,16 +147,29 @@ class GameObject:
         """
         pass
     
-    def draw(self, canvas):
+    def draw(self, canvas, detail=DETAIL_FULL):
         """
         Method untuk menggambar objek di canvas
         Method ini akan di-OVERRIDE oleh child classes
         
         Args:
             canvas: Tkinter canvas object
+            detail (int): Tingkat detail (DETAIL_*)
         """
         pass
-    
+
+    def draw_sprite(self, canvas, sprites, detail=DETAIL_FULL):
+        """
+        Menggambar objek memakai gambar pre-render dari SpriteCache
+        Default: gambar biasa dengan draw(); di-OVERRIDE oleh child classes
+
+        Args:
+            canvas: Tkinter canvas object
+            sprites (SpriteCache): Cache sprite
+            detail (int): Tingkat detail (DETAIL_*)
+        """
+        self.draw(canvas, detail)
+
     def get_bounds(self):
         """
         Mengambil batas-batas objek untuk collision detection
@@ -121,8 +194,14 @@ class GameObject:
         Returns:
             bool: True jika bertabrakan, False jika tidak
         """
-        left1, top1, right1, bottom1 = self.get_bounds()
-        left2, top2, right2, bottom2 = other.get_bounds()
+        # Baca slot langsung (sama dengan get_bounds) tanpa membuat tuple
+        left1 = self.__x
+        top1 = self.__y
+        left2 = other.__x
+        top2 = other.__y
         
         # Collision detection menggunakan AABB (Axis-Aligned Bounding Box)
-        return not (right1 < left2 or left1 > right2 or bottom1 < top2 or top1 > bottom2)
\ No newline at end of file
+        return not (
+            left1 + self.__width < left2 or left1 > left2 + other.__width
+            or top1 + self.__height < top2 or top1 > top2 + other.__height
+        )
\ No newline at end of file
@@ -1,4 +1,5 @@
 
+import argparse
 import tkinter as tk
 from pong_game import PongGame
 
@@ -6,11 +7,19 @@ def main():
     """
     Fungsi utama untuk menjalankan game
     """
+    parser = argparse.ArgumentParser(description="Pong Game OOP")
+    parser.add_argument(
+        "--software-render",
+        action="store_true",
+        help="gambar objek game ke framebuffer NumPy (satu image per frame)"
+    )
+    args = parser.parse_args()
+    
     # Buat Tkinter root window
     root = tk.Tk()
     
     # Buat instance PongGame
-    game = PongGame(root)
+    game = PongGame(root, software_render=args.software_render)
     
     # Jalankan game
     game.run()
@@ -0,0 +1,549 @@
+"""
+MultiBallSimulation - Mode party dengan banyak bola dan beberapa power-up
+Aturan dasarnya sama dengan PongSimulation, tetapi pasangan collision dicari
+lewat SpatialHash (broadphase) sehingga biaya per frame naik linear terhadap
+jumlah bola, bukan kuadratik
+"""
+
+from ball import Ball
+from paddle import Paddle
+from powerup import PowerUp
+from particle import ParticleSystem
+from spatial_hash import SpatialHash
+from simulation import PongSimulation
+import random
+import math
+
+class MultiBallSimulation:
+    """
+    Simulasi Pong dengan banyak bola sekaligus (tanpa Tkinter)
+    Interface-nya sama dengan PongSimulation (step, reset, get_scores,
+    get_balls, get_powerups, apply_interpolation, ...) sehingga PongGame
+    bisa memakai keduanya sebagai model. Setiap bola yang keluar layar
+    memberi satu poin lalu muncul lagi di garis tengah setelah jeda.
+    """
+
+    # Konstanta game (sama dengan PongSimulation)
+    WIDTH = PongSimulation.WIDTH
+    HEIGHT = PongSimulation.HEIGHT
+    FPS = PongSimulation.FPS
+    WINNING_SCORE = PongSimulation.WINNING_SCORE
+    POWERUP_SPAWN_CHANCE = PongSimulation.POWERUP_SPAWN_CHANCE
+    POWERUP_DURATION = PongSimulation.POWERUP_DURATION
+    BALL_RESPAWN_DELAY = PongSimulation.BALL_RESPAWN_DELAY
+
+    ACCENT_COLOR = PongSimulation.ACCENT_COLOR
+    PLAYER1_COLOR = PongSimulation.PLAYER1_COLOR
+    PLAYER2_COLOR = PongSimulation.PLAYER2_COLOR
+
+    MOVE_UP = PongSimulation.MOVE_UP
+    STOP = PongSimulation.STOP
+    MOVE_DOWN = PongSimulation.MOVE_DOWN
+
+    EVENT_WALL_HIT = PongSimulation.EVENT_WALL_HIT
+    EVENT_PADDLE_HIT = PongSimulation.EVENT_PADDLE_HIT
+    EVENT_BALL_HIT = "ball_hit"
+    EVENT_SCORE = PongSimulation.EVENT_SCORE
+    EVENT_POWERUP_COLLECT = PongSimulation.EVENT_POWERUP_COLLECT
+    EVENT_GAME_OVER = PongSimulation.EVENT_GAME_OVER
+
+    BALL_RADIUS = 10
+    BALL_SPEED = 5
+    # Sudut maksimal setelah tabrakan antar bola (sama dengan pantulan paddle)
+    MAX_BOUNCE_ANGLE = math.pi / 3
+    # Sel grid sedikit lebih besar dari diameter bola
+    CELL_SIZE = 32
+
+    def __init__(self, num_balls=8, max_powerups=3, ball_collisions=False,
+                 winning_score=None, particles=True, seed=None):
+        """
+        Constructor untuk MultiBallSimulation
+
+        Args:
+            num_balls (int): Jumlah bola yang dimainkan bersamaan
+            max_powerups (int): Jumlah power-up maksimal di layar
+            ball_collisions (bool): True agar bola saling memantul
+            winning_score (int): Score untuk menang (None = WINNING_SCORE
+                dikali jumlah bola)
+            particles (bool): False untuk mematikan efek particle
+            seed (int): Seed RNG pertandingan (None = random)
+        """
+        self.__num_balls = num_balls
+        self.__max_powerups = max_powerups
+        self.__ball_collisions = ball_collisions
+        self.__winning_score = winning_score if winning_score is not None else self.WINNING_SCORE * num_balls
+        self.__particles_enabled = particles
+
+        self.__seed = seed
+        self.__rng = random.Random(seed)
+
+        self.balls = [
+            Ball(
+                x=self.WIDTH / 2,
+                y=self.HEIGHT / 2,
+                radius=self.BALL_RADIUS,
+                color=self.ACCENT_COLOR,
+                speed=self.BALL_SPEED,
+                rng=self.__rng
+            )
+            for _ in range(num_balls)
+        ]
+
+        self.paddle1 = Paddle(
+            x=30,
+            y=self.HEIGHT / 2 - 50,
+            width=15,
+            height=100,
+            color=self.PLAYER1_COLOR,
+            speed=7
+        )
+        self.paddle1.set_screen_height(self.HEIGHT)
+
+        self.paddle2 = Paddle(
+            x=self.WIDTH - 45,
+            y=self.HEIGHT / 2 - 50,
+            width=15,
+            height=100,
+            color=self.PLAYER2_COLOR,
+            speed=7
+        )
+        self.paddle2.set_screen_height(self.HEIGHT)
+
+        self.particle_system = ParticleSystem(seed=seed)
+
+        # Broadphase: paddle + power-up, dan (opsional) antar bola
+        self.__grid = SpatialHash(self.CELL_SIZE)
+        self.__ball_grid = SpatialHash(self.CELL_SIZE)
+
+        # Power-up di layar dan efek per pemain
+        self.__powerups = []
+        self.__powerup_timers = [0, 0]
+        self.__boosted_balls = ([], [])
+
+        self.__respawn_timers = [0] * num_balls
+        self.__player1_score = 0
+        self.__player2_score = 0
+        self.__winner = None
+        self.__frame = 0
+        self.__events = []
+        self.__previous_positions = None
+        self.__profiler = None
+
+        self.reset()
+
+    # GETTER methods
+    def get_scores(self):
+        """Mengambil score kedua pemain sebagai tuple (player1, player2)"""
+        return (self.__player1_score, self.__player2_score)
+
+    def get_winner(self):
+        """Mengambil pemenang (1 atau 2), None jika belum ada"""
+        return self.__winner
+
+    def is_game_over(self):
+        """Mengecek apakah sudah ada pemenang"""
+        return self.__winner is not None
+
+    def get_winning_score(self):
+        """Mengambil score yang dibutuhkan untuk menang"""
+        return self.__winning_score
+
+    def get_balls(self):
+        """Mengambil semua bola"""
+        return self.balls
+
+    def get_powerups(self):
+        """Mengambil power-up yang sedang muncul"""
+        return self.__powerups
+
+    def get_powerup_timers(self):
+        """Mengambil sisa durasi efek power-up (player1, player2)"""
+        return tuple(self.__powerup_timers)
+
+    def get_seed(self):
+        """Mengambil seed pertandingan (None jika tidak di-seed)"""
+        return self.__seed
+
+    def get_rng(self):
+        """Mengambil RNG pertandingan (random.Random)"""
+        return self.__rng
+
+    def get_frame(self):
+        """Mengambil jumlah step yang sudah dijalankan sejak reset"""
+        return self.__frame
+
+    def set_profiler(self, profiler):
+        """
+        Pasang FrameProfiler untuk mengukur fase setiap step
+
+        Args:
+            profiler (FrameProfiler): Profiler, atau None untuk mematikan
+        """
+        self.__profiler = profiler
+
+    def reset(self, seed=None):
+        """
+        Reset simulasi ke kondisi awal pertandingan
+
+        Args:
+            seed (int): Seed baru (None = lanjutkan RNG yang sedang dipakai)
+        """
+        if seed is not None:
+            self.__seed = seed
+            self.__rng.seed(seed)
+            self.particle_system.seed(seed)
+
+        self.__player1_score = 0
+        self.__player2_score = 0
+        self.__winner = None
+        self.__frame = 0
+
+        # Bola disebar di area tengah agar tidak menumpuk di satu titik
+        rng = self.__rng
+        for index, ball in enumerate(self.balls):
+            ball.reset_position(
+                rng.uniform(self.WIDTH * 0.35, self.WIDTH * 0.65),
+                rng.uniform(self.BALL_RADIUS, self.HEIGHT - self.BALL_RADIUS)
+            )
+            ball.set_active(True)
+            self.__respawn_timers[index] = 0
+
+        self.paddle1.reset_position(30, self.HEIGHT / 2 - 50)
+        self.paddle2.reset_position(self.WIDTH - 45, self.HEIGHT / 2 - 50)
+
+        self.__powerups = []
+        self.__powerup_timers = [0, 0]
+        self.__boosted_balls = ([], [])
+
+        self.particle_system.clear()
+        self._save_previous_positions()
+
+    def step(self, inputs=None):
+        """
+        Jalankan satu step simulasi
+
+        Args:
+            inputs (tuple): (input_player1, input_player2), masing-masing
+                MOVE_UP, STOP atau MOVE_DOWN (None = input terakhir)
+
+        Returns:
+            list: Event yang terjadi pada step ini (bisa berulang, satu per bola)
+        """
+        self.__events = []
+        if self.__winner is not None:
+            return self.__events
+
+        if inputs is not None:
+            self._apply_input(self.paddle1, inputs[0])
+            self._apply_input(self.paddle2, inputs[1])
+
+        self.__frame += 1
+        self._save_previous_positions()
+
+        profiler = self.__profiler
+        if profiler is not None:
+            profiler.skip()
+
+        for ball in self.balls:
+            ball.update()
+        self.paddle1.update()
+        self.paddle2.update()
+        if profiler is not None:
+            profiler.lap(profiler.PHASE_OBJECTS)
+
+        for powerup in self.__powerups:
+            powerup.update()
+        self._update_powerup_effects()
+        self._spawn_powerups()
+        if profiler is not None:
+            profiler.lap(profiler.PHASE_POWERUP)
+
+        self.particle_system.update()
+        if profiler is not None:
+            profiler.lap(profiler.PHASE_PARTICLES)
+
+        self._check_collisions()
+        if self.__ball_collisions:
+            self._check_ball_collisions()
+        self._check_scoring()
+        self._update_ball_respawn()
+        if profiler is not None:
+            profiler.lap(profiler.PHASE_COLLISIONS)
+
+        return self.__events
+
+    def _save_previous_positions(self):
+        """Simpan posisi bola dan paddle sebelum step dijalankan"""
+        self.__previous_positions = (
+            [(ball.get_x(), ball.get_y()) for ball in self.balls],
+            self.paddle1.get_y(),
+            self.paddle2.get_y()
+        )
+
+    def apply_interpolation(self, alpha):
+        """
+        Pindahkan bola dan paddle sementara ke posisi interpolasi (untuk rendering)
+
+        Args:
+            alpha (float): 0.0 = posisi sebelum step, 1.0 = posisi terbaru
+
+        Returns:
+            tuple: Posisi asli, wajib dikembalikan dengan restore_positions()
+        """
+        current = (
+            [(ball.get_x(), ball.get_y()) for ball in self.balls],
+            self.paddle1.get_y(),
+            self.paddle2.get_y()
+        )
+        if alpha >= 1.0:
+            return current
+
+        previous_balls, previous_y1, previous_y2 = self.__previous_positions
+        for ball, (x0, y0), (x1, y1) in zip(self.balls, previous_balls, current[0]):
+            ball.set_x(x0 + (x1 - x0) * alpha)
+            ball.set_y(y0 + (y1 - y0) * alpha)
+        self.paddle1.set_y(previous_y1 + (current[1] - previous_y1) * alpha)
+        self.paddle2.set_y(previous_y2 + (current[2] - previous_y2) * alpha)
+        return current
+
+    def restore_positions(self, positions):
+        """
+        Kembalikan posisi asli setelah apply_interpolation()
+
+        Args:
+            positions (tuple): Nilai yang dikembalikan apply_interpolation()
+        """
+        for ball, (x, y) in zip(self.balls, positions[0]):
+            ball.set_x(x)
+            ball.set_y(y)
+        self.paddle1.set_y(positions[1])
+        self.paddle2.set_y(positions[2])
+
+    def _apply_input(self, paddle, direction):
+        """Terjemahkan input menjadi gerakan paddle"""
+        if direction < 0:
+            paddle.move_up()
+        elif direction > 0:
+            paddle.move_down()
+        else:
+            paddle.stop()
+
+    def _emit_particles(self, x, y, color, count):
+        """Emit particles jika efek particle diaktifkan"""
+        if self.__particles_enabled:
+            self.particle_system.emit(x, y, color, count=count)
+
+    def _check_collisions(self):
+        """
+        Collision bola dengan dinding, paddle dan power-up
+        Paddle dan power-up dimasukkan ke grid, lalu setiap bola hanya
+        dicek terhadap objek di sel yang sama dengan bola tersebut
+        """
+        grid = self.__grid
+        grid.clear()
+        grid.insert(self.paddle1, self.paddle1.get_bounds())
+        grid.insert(self.paddle2, self.paddle2.get_bounds())
+        for powerup in self.__powerups:
+            if powerup.is_active():
+                grid.insert(powerup, powerup.get_bounds())
+
+        for ball in self.balls:
+            if not ball.is_active():
+                continue
+
+            self._check_wall_collision(ball)
+
+            for other in grid.query(ball.get_bounds()):
+                if not ball.collides_with(other):
+                    continue
+                if other is self.paddle1:
+                    if ball.get_velocity_x() < 0:
+                        self._bounce_off_paddle(ball, self.paddle1, self.paddle1.get_x() + self.paddle1.get_width(), self.PLAYER1_COLOR)
+                elif other is self.paddle2:
+                    if ball.get_velocity_x() > 0:
+                        self._bounce_off_paddle(ball, self.paddle2, self.paddle2.get_x(), self.PLAYER2_COLOR)
+                elif other.is_active():
+                    self._collect_powerup(ball, other)
+
+        # Power-up yang diambil atau habis dibuang agar slot bisa diisi lagi
+        self.__powerups = [powerup for powerup in self.__powerups if powerup.is_active()]
+
+    def _check_wall_collision(self, ball):
+        """Cek collision satu bola dengan dinding atas/bawah"""
+        ball_y = ball.get_y()
+        ball_radius = ball.get_radius()
+
+        if ball_y - ball_radius < 0:
+            ball.set_y(ball_radius)
+            ball.reverse_y()
+            self.__events.append(self.EVENT_WALL_HIT)
+            self._emit_particles(ball.get_x(), 0, self.ACCENT_COLOR, 8)
+        elif ball_y + ball_radius > self.HEIGHT:
+            ball.set_y(self.HEIGHT - ball_radius)
+            ball.reverse_y()
+            self.__events.append(self.EVENT_WALL_HIT)
+            self._emit_particles(ball.get_x(), self.HEIGHT, self.ACCENT_COLOR, 8)
+
+    def _bounce_off_paddle(self, ball, paddle, particle_x, color):
+        """Pantulkan bola dari paddle beserta event dan particle"""
+        ball.bounce_off_paddle(paddle)
+        self.__events.append(self.EVENT_PADDLE_HIT)
+        self._emit_particles(particle_x, ball.get_y(), color, 10)
+
+    def _check_ball_collisions(self):
+        """
+        Tabrakan antar bola (lingkaran, massa sama)
+        Kandidat pasangan diambil dari grid bola, lalu dicek jarak pusatnya
+        """
+        grid = self.__ball_grid
+        grid.clear()
+        for ball in self.balls:
+            if ball.is_active():
+                grid.insert(ball, ball.get_bounds())
+
+        for ball_a, ball_b in grid.candidate_pairs():
+            dx = ball_b.get_x() - ball_a.get_x()
+            dy = ball_b.get_y() - ball_a.get_y()
+            min_distance = ball_a.get_radius() + ball_b.get_radius()
+            distance_squared = dx * dx + dy * dy
+            if distance_squared >= min_distance * min_distance or distance_squared == 0:
+                continue
+
+            distance = math.sqrt(distance_squared)
+            normal_x = dx / distance
+            normal_y = dy / distance
+
+            # Pisahkan kedua bola agar tidak saling menempel
+            push = (min_distance - distance) / 2
+            ball_a.set_x(ball_a.get_x() - normal_x * push)
+            ball_a.set_y(ball_a.get_y() - normal_y * push)
+            ball_b.set_x(ball_b.get_x() + normal_x * push)
+            ball_b.set_y(ball_b.get_y() + normal_y * push)
+
+            # Hanya pantulkan jika kedua bola saling mendekat
+            approach = (
+                (ball_b.get_velocity_x() - ball_a.get_velocity_x()) * normal_x
+                + (ball_b.get_velocity_y() - ball_a.get_velocity_y()) * normal_y
+            )
+            if approach >= 0:
+                continue
+
+            # Massa sama: komponen velocity searah normal saling ditukar
+            ball_a.set_velocity_x(ball_a.get_velocity_x() + approach * normal_x)
+            ball_a.set_velocity_y(ball_a.get_velocity_y() + approach * normal_y)
+            ball_b.set_velocity_x(ball_b.get_velocity_x() - approach * normal_x)
+            ball_b.set_velocity_y(ball_b.get_velocity_y() - approach * normal_y)
+            self._limit_bounce_angle(ball_a)
+            self._limit_bounce_angle(ball_b)
+            self.__events.append(self.EVENT_BALL_HIT)
+
+    def _limit_bounce_angle(self, ball):
+        """
+        Kembalikan kecepatan bola ke speed-nya dan batasi sudut terhadap
+        sumbu horizontal agar bola tidak terjebak bergerak vertikal
+        """
+        vx = ball.get_velocity_x()
+        vy = ball.get_velocity_y()
+        direction = 1 if vx >= 0 else -1
+        angle = math.atan2(vy, abs(vx))
+        angle = max(-self.MAX_BOUNCE_ANGLE, min(self.MAX_BOUNCE_ANGLE, angle))
+        speed = ball.get_speed()
+        ball.set_velocity_x(direction * speed * math.cos(angle))
+        ball.set_velocity_y(speed * math.sin(angle))
+
+    def _collect_powerup(self, ball, powerup):
+        """
+        Bola mengambil power-up; pemain ditentukan dari arah bola
+        seperti PongSimulation
+
+        Args:
+            ball (Ball): Bola yang mengambil
+            powerup (PowerUp): Power-up yang diambil
+        """
+        powerup.collect()
+        self.__events.append(self.EVENT_POWERUP_COLLECT)
+
+        player = 2 if ball.get_velocity_x() > 0 else 1
+        if powerup.get_type() == PowerUp.SPEED_BOOST:
+            ball.set_speed_boost(1.5)
+            self.__boosted_balls[player - 1].append(ball)
+        elif powerup.get_type() == PowerUp.SIZE_BOOST:
+            paddle = self.paddle2 if player == 2 else self.paddle1
+            paddle.set_size_boost(1.5)
+        self.__powerup_timers[player - 1] = self.POWERUP_DURATION
+
+        self._emit_particles(powerup.get_x(), powerup.get_y(), powerup.get_color(), 20)
+
+    def _update_powerup_effects(self):
+        """Hitung mundur efek power-up per pemain dan reset jika habis"""
+        for index in range(2):
+            if self.__powerup_timers[index] > 0:
+                self.__powerup_timers[index] -= 1
+                if self.__powerup_timers[index] == 0:
+                    paddle = self.paddle1 if index == 0 else self.paddle2
+                    paddle.reset_size_boost()
+                    for ball in self.__boosted_balls[index]:
+                        ball.reset_speed_boost()
+                    self.__boosted_balls[index].clear()
+
+    def _spawn_powerups(self):
+        """Spawn power-up baru secara random selama slot masih tersedia"""
+        self.__powerups = [powerup for powerup in self.__powerups if powerup.is_active()]
+        if len(self.__powerups) < self.__max_powerups and self.__rng.random() < self.POWERUP_SPAWN_CHANCE:
+            self.__powerups.append(PowerUp.spawn_random(self.WIDTH, self.HEIGHT, rng=self.__rng))
+
+    def _check_scoring(self):
+        """Cek bola yang keluar layar kiri/kanan"""
+        scored = False
+        for index, ball in enumerate(self.balls):
+            if not ball.is_active():
+                continue
+
+            ball_x = ball.get_x()
+            if ball_x < 0:
+                self.__player2_score += 1
+                self._emit_particles(0, ball.get_y(), self.PLAYER2_COLOR, 30)
+            elif ball_x > self.WIDTH:
+                self.__player1_score += 1
+                self._emit_particles(self.WIDTH, ball.get_y(), self.PLAYER1_COLOR, 30)
+            else:
+                continue
+
+            self.__events.append(self.EVENT_SCORE)
+            self._respawn_ball(index)
+            scored = True
+
+        if scored:
+            self._check_game_over()
+
+    def _respawn_ball(self, index):
+        """Pindahkan bola ke garis tengah dan tunggu BALL_RESPAWN_DELAY step"""
+        ball = self.balls[index]
+        ball.reset_position(
+            self.WIDTH / 2,
+            self.__rng.uniform(self.HEIGHT * 0.2, self.HEIGHT * 0.8)
+        )
+        ball.set_active(False)
+        self.__respawn_timers[index] = self.BALL_RESPAWN_DELAY
+
+        # Bola berpindah tempat, jangan diinterpolasi dari posisi lama
+        self.__previous_positions[0][index] = (ball.get_x(), ball.get_y())
+
+    def _update_ball_respawn(self):
+        """Aktifkan kembali bola yang jeda skornya sudah selesai"""
+        timers = self.__respawn_timers
+        for index, timer in enumerate(timers):
+            if timer > 0:
+                timers[index] = timer - 1
+                if timer == 1:
+                    self.balls[index].set_active(True)
+
+    def _check_game_over(self):
+        """Cek apakah salah satu pemain mencapai winning score"""
+        if self.__player1_score >= self.__winning_score:
+            self.__winner = 1
+        elif self.__player2_score >= self.__winning_score:
+            self.__winner = 2
+
+        if self.__winner is not None:
+            self.__events.append(self.EVENT_GAME_OVER)
@@ -0,0 +1,423 @@
+"""
+Client Pong online (UDP, asyncio)
+Client mengirim input paddle ke server dan menggambar state yang diterima
+dengan interpolasi, sehingga gerakan tetap halus walaupun state datang
+lebih jarang dari frame rate dan sebagian paket hilang
+
+Jalankan dengan: python net_client.py --port 9999 --match 1
+"""
+
+import argparse
+import asyncio
+import struct
+from collections import deque
+
+from simulation import PongSimulation
+from ball import Ball
+from paddle import Paddle
+from powerup import PowerUp
+from renderer import CanvasRenderer
+from net_protocol import (
+    PACKET_JOIN, PACKET_JOINED, PACKET_INPUT, PACKET_STATE, PACKET_LEAVE,
+    JOIN, JOINED, INPUT, LEAVE, decode_state, SimulatedNetwork
+)
+
+
+class ClientProtocol(asyncio.DatagramProtocol):
+    """Protocol asyncio yang meneruskan paket ke PongClient"""
+
+    def __init__(self, client):
+        """
+        Constructor untuk ClientProtocol
+
+        Args:
+            client (PongClient): Client penerima paket
+        """
+        self.__client = client
+
+    def datagram_received(self, data, addr):
+        """Paket UDP diterima"""
+        self.__client.handle_packet(data)
+
+
+class PongClient:
+    """
+    Client jaringan untuk satu player
+    State dari server disimpan di buffer kecil; get_render_state() mengambil
+    state pada waktu (sekarang - interpolation_delay) dengan interpolasi
+    linear antara dua state yang mengapitnya.
+    """
+
+    JOIN_RETRY = 0.25  # Detik antar pengiriman ulang JOIN
+    BUFFER_SIZE = 32
+
+    def __init__(self, match_id, server_address, interpolation_delay=0.1,
+                 latency=0.0, jitter=0.0, loss=0.0, seed=None):
+        """
+        Constructor untuk PongClient
+
+        Args:
+            match_id (int): Id pertandingan yang diikuti
+            server_address (tuple): (host, port) server
+            interpolation_delay (float): Jarak waktu render di belakang state
+                terbaru (detik); cukup besar untuk menutupi paket yang hilang
+            latency (float): Latency simulasi untuk paket keluar (detik)
+            jitter (float): Jitter simulasi untuk paket keluar (detik)
+            loss (float): Packet loss simulasi untuk paket keluar (0.0 - 1.0)
+            seed (int): Seed jaringan simulasi
+        """
+        self.__match_id = match_id
+        self.__server_address = server_address
+        self.__interpolation_delay = interpolation_delay
+        self.__network_options = (latency, jitter, loss, seed)
+
+        self.__transport = None
+        self.__loop = None
+        self.__player = None
+        self.__tick_rate = PongSimulation.FPS
+        self.__joined = None
+
+        self.__input = PongSimulation.STOP
+        self.__sequence = 0
+
+        # (waktu server, StateMessage), urut berdasarkan frame
+        self.__states = deque(maxlen=self.BUFFER_SIZE)
+        # Selisih jam lokal dan jam server (minimum = paket tercepat)
+        self.__clock_offset = None
+
+    def get_player(self):
+        """Mengambil nomor player (1 atau 2), None jika belum bergabung"""
+        return self.__player
+
+    def get_latest_state(self):
+        """Mengambil state terbaru dari server (atau None)"""
+        return self.__states[-1][1] if self.__states else None
+
+    def get_acked_sequence(self):
+        """Mengambil nomor urut input terakhir yang sudah diproses server"""
+        state = self.get_latest_state()
+        return state.ack if state is not None else 0
+
+    def set_input(self, direction):
+        """
+        Simpan input paddle (dikirim setiap tick oleh send_input)
+
+        Args:
+            direction (int): MOVE_UP, STOP atau MOVE_DOWN
+        """
+        self.__input = direction
+
+    async def connect(self, timeout=5.0):
+        """
+        Buka socket dan bergabung ke pertandingan
+        JOIN dikirim ulang sampai dijawab karena paket bisa hilang
+
+        Args:
+            timeout (float): Batas waktu bergabung (detik)
+
+        Returns:
+            int: Nomor player (1 atau 2)
+
+        Raises:
+            ConnectionError: Jika pertandingan penuh
+            asyncio.TimeoutError: Jika server tidak menjawab
+        """
+        loop = asyncio.get_running_loop()
+        self.__loop = loop
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: ClientProtocol(self),
+            remote_addr=self.__server_address
+        )
+        latency, jitter, loss, seed = self.__network_options
+        if latency > 0 or jitter > 0 or loss > 0:
+            transport = SimulatedNetwork(transport, loop, latency, jitter, loss, seed)
+        self.__transport = transport
+
+        self.__joined = loop.create_future()
+        packet = JOIN.pack(PACKET_JOIN, self.__match_id)
+
+        async def wait_joined():
+            while not self.__joined.done():
+                self.__transport.sendto(packet)
+                try:
+                    await asyncio.wait_for(asyncio.shield(self.__joined), self.JOIN_RETRY)
+                except asyncio.TimeoutError:
+                    pass
+            return self.__joined.result()
+
+        player = await asyncio.wait_for(wait_joined(), timeout)
+        if player == 0:
+            raise ConnectionError("Pertandingan sudah penuh")
+        return player
+
+    def close(self):
+        """Keluar dari pertandingan dan tutup socket"""
+        if self.__transport is None:
+            return
+        if self.__player:
+            self.__transport.sendto(LEAVE.pack(PACKET_LEAVE, self.__match_id, self.__player))
+        self.__transport.close()
+        self.__transport = None
+
+    def send_input(self):
+        """Kirim input saat ini (dipanggil sekali per tick client)"""
+        if self.__transport is None or not self.__player:
+            return
+        self.__sequence += 1
+        self.__transport.sendto(INPUT.pack(
+            PACKET_INPUT, self.__match_id, self.__player, self.__sequence, self.__input
+        ))
+
+    async def run_input_loop(self):
+        """Kirim input dengan tick rate server sampai task dibatalkan"""
+        interval = 1.0 / self.__tick_rate
+        while True:
+            self.send_input()
+            await asyncio.sleep(interval)
+
+    def handle_packet(self, data):
+        """
+        Proses satu paket dari server
+
+        Args:
+            data (bytes): Isi paket
+        """
+        if not data:
+            return
+
+        # Datagram rusak (ukuran salah) diabaikan
+        packet_type = data[0]
+        if packet_type == PACKET_STATE:
+            try:
+                state = decode_state(data)
+            except struct.error:
+                return
+            if state.match_id == self.__match_id:
+                self._add_state(state)
+        elif packet_type == PACKET_JOINED:
+            try:
+                _, match_id, player, tick_rate = JOINED.unpack(data)
+            except struct.error:
+                return
+            if match_id == self.__match_id and self.__joined is not None and not self.__joined.done():
+                self.__player = player
+                self.__tick_rate = tick_rate
+                self.__joined.set_result(player)
+
+    def _add_state(self, state):
+        """Simpan state ke buffer (state lama yang datang terlambat dibuang)"""
+        states = self.__states
+        if not state.is_started():
+            # Frame belum berjalan, cukup simpan state terbaru tanpa sinkron jam
+            states.clear()
+            states.append((0.0, state))
+            return
+        if states and state.frame <= states[-1][1].frame:
+            return
+
+        server_time = state.frame / self.__tick_rate
+        offset = self.__loop.time() - server_time
+        if self.__clock_offset is None or offset < self.__clock_offset:
+            self.__clock_offset = offset
+        states.append((server_time, state))
+
+    def get_render_state(self, now=None):
+        """
+        Hitung posisi untuk digambar pada waktu sekarang
+
+        Args:
+            now (float): Waktu lokal (default loop.time())
+
+        Returns:
+            dict: ball_x, ball_y, paddle1_y, paddle2_y hasil interpolasi dan
+                state (StateMessage) terdekat untuk data lain, atau None
+                jika belum ada state
+        """
+        states = self.__states
+        if not states:
+            return None
+        if self.__clock_offset is None:
+            # Pertandingan belum berjalan: tampilkan state terbaru
+            render_time = states[-1][0]
+        else:
+            if now is None:
+                now = self.__loop.time()
+            render_time = now - self.__clock_offset - self.__interpolation_delay
+
+        # Cari dua state yang mengapit render_time (paling baru di kanan)
+        newer_time, newer = states[-1]
+        older_time, older = newer_time, newer
+        for index in range(len(states) - 1, -1, -1):
+            older_time, older = states[index]
+            if older_time <= render_time:
+                break
+            newer_time, newer = older_time, older
+
+        if newer is older or newer_time <= older_time:
+            alpha = 1.0
+        else:
+            alpha = (render_time - older_time) / (newer_time - older_time)
+            alpha = max(0.0, min(1.0, alpha))
+
+        # Bola yang baru respawn tidak diinterpolasi dari posisi lama
+        ball_from = older if older.is_ball_active() == newer.is_ball_active() else newer
+        return {
+            "ball_x": ball_from.ball_x + (newer.ball_x - ball_from.ball_x) * alpha,
+            "ball_y": ball_from.ball_y + (newer.ball_y - ball_from.ball_y) * alpha,
+            "paddle1_y": older.paddle1_y + (newer.paddle1_y - older.paddle1_y) * alpha,
+            "paddle2_y": older.paddle2_y + (newer.paddle2_y - older.paddle2_y) * alpha,
+            "state": newer if alpha >= 0.5 else older
+        }
+
+
+class NetworkPongView:
+    """
+    Tampilan Tkinter untuk client online
+    Jendela Tk di-update dari task asyncio sehingga tidak perlu thread
+    """
+
+    BG_COLOR = "#0a0e27"
+
+    def __init__(self, root, client):
+        """
+        Constructor untuk NetworkPongView
+
+        Args:
+            root: Tkinter root window
+            client (PongClient): Client yang sudah terhubung
+        """
+        import tkinter as tk
+
+        self.root = root
+        self.client = client
+        self.root.title(f"PONG ONLINE - Player {client.get_player()}")
+        self.root.resizable(False, False)
+
+        self.canvas = tk.Canvas(
+            root,
+            width=PongSimulation.WIDTH,
+            height=PongSimulation.HEIGHT,
+            bg=self.BG_COLOR,
+            highlightthickness=0
+        )
+        self.canvas.pack()
+        self.renderer = CanvasRenderer(self.canvas)
+
+        # Objek lokal hanya untuk menggambar, posisinya diisi dari state server
+        self.ball = Ball(PongSimulation.WIDTH / 2, PongSimulation.HEIGHT / 2, 10, PongSimulation.ACCENT_COLOR, 5)
+        self.paddle1 = Paddle(30, 0, 15, 100, PongSimulation.PLAYER1_COLOR, 7)
+        self.paddle2 = Paddle(PongSimulation.WIDTH - 45, 0, 15, 100, PongSimulation.PLAYER2_COLOR, 7)
+        self.__powerup = None
+
+        self.status_text = self.canvas.create_text(
+            PongSimulation.WIDTH / 2, 50,
+            text="Menunggu lawan...",
+            font=("Arial", 36, "bold"),
+            fill="white"
+        )
+
+        # W/S dan panah atas/bawah menggerakkan paddle milik player ini
+        for key, direction in (("w", PongSimulation.MOVE_UP), ("s", PongSimulation.MOVE_DOWN),
+                               ("Up", PongSimulation.MOVE_UP), ("Down", PongSimulation.MOVE_DOWN)):
+            self.root.bind(f"<{key}>", lambda e, d=direction: client.set_input(d))
+            self.root.bind(f"<KeyRelease-{key}>", lambda e: client.set_input(PongSimulation.STOP))
+
+    def _sync_objects(self, render_state):
+        """Salin state hasil interpolasi ke objek lokal"""
+        state = render_state["state"]
+        self.ball.set_x(render_state["ball_x"])
+        self.ball.set_y(render_state["ball_y"])
+        self.ball.set_active(state.is_ball_active())
+        self.paddle1.set_y(render_state["paddle1_y"])
+        self.paddle1.set_height(state.paddle1_height)
+        self.paddle2.set_y(render_state["paddle2_y"])
+        self.paddle2.set_height(state.paddle2_height)
+
+        if state.has_powerup():
+            powerup_type = PowerUp.TYPES[state.powerup_type - 1]
+            powerup = self.__powerup
+            if powerup is None or powerup.get_type() != powerup_type:
+                powerup = PowerUp(state.powerup_x, state.powerup_y, 20, powerup_type)
+                self.__powerup = powerup
+            powerup.set_x(state.powerup_x)
+            powerup.set_y(state.powerup_y)
+        else:
+            self.__powerup = None
+
+    def render(self):
+        """Gambar state terbaru hasil interpolasi"""
+        render_state = self.client.get_render_state()
+        if render_state is None:
+            return
+
+        state = render_state["state"]
+        self._sync_objects(render_state)
+
+        renderer = self.renderer
+        renderer.begin_frame()
+        self.ball.draw(renderer)
+        self.paddle1.draw(renderer)
+        self.paddle2.draw(renderer)
+        if self.__powerup is not None:
+            self.__powerup.draw(renderer)
+        renderer.end_frame()
+
+        if state.winner:
+            status = f"PLAYER {state.winner} WINS!  {state.score1} - {state.score2}"
+        elif state.is_started():
+            status = f"{state.score1}   {state.score2}"
+        else:
+            status = "Menunggu lawan..."
+        self.canvas.itemconfig(self.status_text, text=status)
+
+    async def run(self):
+        """Loop tampilan: kirim input, gambar, dan proses event Tk"""
+        import tkinter as tk
+
+        input_task = asyncio.create_task(self.client.run_input_loop())
+        frame = 1.0 / PongSimulation.FPS
+        try:
+            while True:
+                self.render()
+                self.root.update()
+                await asyncio.sleep(frame)
+        except tk.TclError:
+            # Jendela ditutup
+            pass
+        finally:
+            input_task.cancel()
+            self.client.close()
+
+
+async def play(host, port, match_id, **options):
+    """Hubungkan ke server lalu buka jendela permainan"""
+    import tkinter as tk
+
+    client = PongClient(match_id, (host, port), **options)
+    player = await client.connect()
+    print(f"Bergabung ke match {match_id} sebagai player {player}")
+    view = NetworkPongView(tk.Tk(), client)
+    await view.run()
+
+
+def main(argv=None):
+    """Entry point command line"""
+    parser = argparse.ArgumentParser(description="Client Pong online (UDP)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9999)
+    parser.add_argument("--match", type=int, default=1, help="id pertandingan")
+    parser.add_argument("--delay", type=float, default=0.1, help="delay interpolasi (detik)")
+    parser.add_argument("--latency", type=float, default=0.0, help="latency simulasi (detik)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="jitter simulasi (detik)")
+    parser.add_argument("--loss", type=float, default=0.0, help="packet loss simulasi (0-1)")
+    args = parser.parse_args(argv)
+
+    asyncio.run(play(
+        args.host, args.port, args.match,
+        interpolation_delay=args.delay,
+        latency=args.latency, jitter=args.jitter, loss=args.loss
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Protokol jaringan untuk mode Pong online (UDP)
+Berisi format paket biner yang dipakai server dan client, serta
+SimulatedNetwork untuk menguji di loopback dengan latency dan packet loss
+"""
+
+import random
+import struct
+
+from powerup import PowerUp
+
+# Tipe paket (byte pertama setiap paket)
+PACKET_JOIN = 1
+PACKET_JOINED = 2
+PACKET_INPUT = 3
+PACKET_STATE = 4
+PACKET_LEAVE = 5
+
+# Client -> server: tipe, match id
+JOIN = struct.Struct("<BI")
+# Server -> client: tipe, match id, nomor player (0 = match penuh), tick rate
+JOINED = struct.Struct("<BIBH")
+# Client -> server: tipe, match id, player, nomor urut input, arah (-1, 0, 1)
+INPUT = struct.Struct("<BIBIb")
+# Client -> server: tipe, match id, player
+LEAVE = struct.Struct("<BIB")
+# Server -> client: tipe, match id, frame, flags, bola (x, y, vx, vy),
+# paddle 1 (y, tinggi), paddle 2 (y, tinggi), tipe power-up, power-up (x, y),
+# score 1, score 2, pemenang, nomor urut input terakhir yang diproses
+STATE = struct.Struct("<BIIBffffffffBffBBbI")
+
+# Bit pada field flags paket STATE
+FLAG_BALL_ACTIVE = 1
+FLAG_POWERUP = 2
+FLAG_STARTED = 4
+
+# Tipe power-up pada paket STATE (0 = tidak ada)
+POWERUP_NONE = 0
+
+
+class StateMessage:
+    """
+    State pertandingan yang dikirim server ke client
+    Hanya berisi data yang dibutuhkan untuk menggambar
+    """
+
+    __slots__ = (
+        "match_id", "frame", "flags", "ball_x", "ball_y", "ball_vx", "ball_vy",
+        "paddle1_y", "paddle1_height", "paddle2_y", "paddle2_height",
+        "powerup_type", "powerup_x", "powerup_y", "score1", "score2",
+        "winner", "ack"
+    )
+
+    def __init__(self, values):
+        """
+        Constructor untuk StateMessage
+
+        Args:
+            values (tuple): Hasil STATE.unpack() tanpa field tipe paket
+        """
+        (
+            self.match_id, self.frame, self.flags,
+            self.ball_x, self.ball_y, self.ball_vx, self.ball_vy,
+            self.paddle1_y, self.paddle1_height, self.paddle2_y, self.paddle2_height,
+            self.powerup_type, self.powerup_x, self.powerup_y,
+            self.score1, self.score2, self.winner, self.ack
+        ) = values
+
+    def is_started(self):
+        """Mengecek apakah kedua player sudah bergabung"""
+        return bool(self.flags & FLAG_STARTED)
+
+    def is_ball_active(self):
+        """Mengecek apakah bola sedang bergerak (tidak menunggu respawn)"""
+        return bool(self.flags & FLAG_BALL_ACTIVE)
+
+    def has_powerup(self):
+        """Mengecek apakah ada power-up di layar"""
+        return bool(self.flags & FLAG_POWERUP)
+
+
+def encode_state(match_id, simulation, started, ack):
+    """
+    Buat paket STATE dari PongSimulation
+
+    Args:
+        match_id (int): Id pertandingan
+        simulation (PongSimulation): Simulasi di server
+        started (bool): True jika kedua player sudah bergabung
+        ack (int): Nomor urut input terakhir player penerima yang sudah diproses
+
+    Returns:
+        bytes: Paket STATE
+    """
+    ball = simulation.ball
+    paddle1 = simulation.paddle1
+    paddle2 = simulation.paddle2
+
+    flags = 0
+    if ball.is_active():
+        flags |= FLAG_BALL_ACTIVE
+    if started:
+        flags |= FLAG_STARTED
+
+    powerup_type = POWERUP_NONE
+    powerup_x = powerup_y = 0.0
+    powerup = simulation.get_current_powerup()
+    if powerup is not None and powerup.is_active():
+        flags |= FLAG_POWERUP
+        powerup_type = PowerUp.TYPES.index(powerup.get_type()) + 1
+        powerup_x = powerup.get_x()
+        powerup_y = powerup.get_y()
+
+    score1, score2 = simulation.get_scores()
+    return STATE.pack(
+        PACKET_STATE, match_id, simulation.get_frame(), flags,
+        ball.get_x(), ball.get_y(), ball.get_velocity_x(), ball.get_velocity_y(),
+        paddle1.get_y(), paddle1.get_height(), paddle2.get_y(), paddle2.get_height(),
+        powerup_type, powerup_x, powerup_y,
+        score1, score2, simulation.get_winner() or 0, ack
+    )
+
+
+def decode_state(data):
+    """
+    Baca paket STATE
+
+    Args:
+        data (bytes): Paket dengan tipe PACKET_STATE
+
+    Returns:
+        StateMessage: State yang dibaca
+    """
+    return StateMessage(STATE.unpack(data)[1:])
+
+
+class SimulatedNetwork:
+    """
+    Pembungkus transport asyncio yang mensimulasikan jaringan buruk
+    Setiap paket keluar bisa dibuang (packet loss) atau ditunda
+    (latency + jitter), sehingga server dan client bisa diuji di loopback
+    """
+
+    def __init__(self, transport, loop, latency=0.0, jitter=0.0, loss=0.0, seed=None):
+        """
+        Constructor untuk SimulatedNetwork
+
+        Args:
+            transport (asyncio.DatagramTransport): Transport asli
+            loop (asyncio.AbstractEventLoop): Event loop untuk penundaan
+            latency (float): Penundaan satu arah dalam detik
+            jitter (float): Tambahan penundaan random maksimal dalam detik
+            loss (float): Peluang paket dibuang (0.0 - 1.0)
+            seed (int): Seed random untuk loss dan jitter
+        """
+        self.__transport = transport
+        self.__loop = loop
+        self.__latency = latency
+        self.__jitter = jitter
+        self.__loss = loss
+        self.__rng = random.Random(seed)
+        self.__sent = 0
+        self.__dropped = 0
+        self.__closing = False
+
+    def get_sent_count(self):
+        """Mengambil jumlah paket yang dikirim (termasuk yang dibuang)"""
+        return self.__sent
+
+    def get_dropped_count(self):
+        """Mengambil jumlah paket yang dibuang"""
+        return self.__dropped
+
+    def sendto(self, data, addr=None):
+        """Kirim paket melalui jaringan simulasi"""
+        self.__sent += 1
+        if self.__loss > 0 and self.__rng.random() < self.__loss:
+            self.__dropped += 1
+            return
+
+        delay = self.__latency
+        if self.__jitter > 0:
+            delay += self.__rng.uniform(0, self.__jitter)
+        if delay <= 0:
+            self.__transport.sendto(data, addr)
+        else:
+            self.__loop.call_later(delay, self._deliver, data, addr)
+
+    def _deliver(self, data, addr):
+        """Kirim paket yang ditunda (diabaikan jika transport sudah ditutup)"""
+        if not self.__transport.is_closing():
+            self.__transport.sendto(data, addr)
+
+    def get_extra_info(self, name, default=None):
+        """Informasi transport asli (misalnya sockname)"""
+        return self.__transport.get_extra_info(name, default)
+
+    def is_closing(self):
+        """Mengecek apakah transport sedang ditutup"""
+        return self.__closing or self.__transport.is_closing()
+
+    def close(self):
+        """Tutup transport setelah paket yang masih ditunda terkirim"""
+        if self.__closing:
+            return
+        self.__closing = True
+        delay = self.__latency + self.__jitter
+        if delay > 0:
+            self.__loop.call_later(delay, self.__transport.close)
+        else:
+            self.__transport.close()
@@ -0,0 +1,347 @@
+"""
+Server Pong online (authoritative, UDP, asyncio)
+Satu proses menjalankan banyak pertandingan sekaligus dalam satu event loop:
+satu task tick memajukan semua PongSimulation dengan tick rate tetap,
+tanpa thread per pertandingan
+
+Jalankan dengan: python net_server.py --port 9999
+"""
+
+import argparse
+import asyncio
+import random
+import struct
+
+from simulation import PongSimulation
+from net_protocol import (
+    PACKET_JOIN, PACKET_JOINED, PACKET_INPUT, PACKET_LEAVE,
+    JOIN, JOINED, INPUT, LEAVE, encode_state, SimulatedNetwork
+)
+from spectator import SpectatorBroadcaster
+
+
+class ServerMatch:
+    """
+    Satu pertandingan di server: simulasi headless dan dua slot player
+    """
+
+    def __init__(self, match_id, seed):
+        """
+        Constructor untuk ServerMatch
+
+        Args:
+            match_id (int): Id pertandingan
+            seed (int): Seed simulasi
+        """
+        self.match_id = match_id
+        self.simulation = PongSimulation(particles=False, seed=seed)
+        self.addresses = [None, None]
+        self.inputs = [PongSimulation.STOP, PongSimulation.STOP]
+        self.last_sequence = [0, 0]
+        self.last_seen = [0.0, 0.0]
+
+    def is_started(self):
+        """Pertandingan berjalan setelah kedua player bergabung"""
+        return self.addresses[0] is not None and self.addresses[1] is not None
+
+    def find_player(self, addr):
+        """
+        Cari nomor player untuk alamat client
+
+        Returns:
+            int: 1 atau 2, atau 0 jika alamat bukan player match ini
+        """
+        for index, address in enumerate(self.addresses):
+            if address == addr:
+                return index + 1
+        return 0
+
+    def assign_slot(self, index, addr):
+        """
+        Isi slot player dengan client baru (sequence dan input mulai dari awal)
+
+        Args:
+            index (int): Index slot (0 atau 1)
+            addr (tuple): Alamat client, atau None untuk mengosongkan slot
+        """
+        self.addresses[index] = addr
+        self.inputs[index] = PongSimulation.STOP
+        self.last_sequence[index] = 0
+
+    def free_slot(self, index):
+        """
+        Kosongkan slot player; paddle berhenti dan client berikutnya
+        mulai dari sequence 1
+
+        Args:
+            index (int): Index slot (0 atau 1)
+        """
+        self.assign_slot(index, None)
+
+
+class ServerProtocol(asyncio.DatagramProtocol):
+    """Protocol asyncio yang meneruskan paket ke PongServer"""
+
+    def __init__(self, server):
+        """
+        Constructor untuk ServerProtocol
+
+        Args:
+            server (PongServer): Server penerima paket
+        """
+        self.__server = server
+
+    def datagram_received(self, data, addr):
+        """Paket UDP diterima"""
+        self.__server.handle_packet(data, addr)
+
+
+class PongServer:
+    """
+    Server authoritative untuk banyak pertandingan
+    Client hanya mengirim input paddle; seluruh logika game berjalan di server
+    dan state dikirim balik ke kedua player setiap send interval.
+    """
+
+    def __init__(self, tick_rate=PongSimulation.FPS, send_rate=30, match_timeout=10.0,
+                 latency=0.0, jitter=0.0, loss=0.0, seed=None, spectators=None):
+        """
+        Constructor untuk PongServer
+
+        Args:
+            tick_rate (int): Step simulasi per detik
+            send_rate (int): Paket state per detik ke setiap client
+            match_timeout (float): Detik tanpa paket sebelum player dianggap keluar
+            latency (float): Latency simulasi untuk paket keluar (detik)
+            jitter (float): Jitter simulasi untuk paket keluar (detik)
+            loss (float): Packet loss simulasi untuk paket keluar (0.0 - 1.0)
+            seed (int): Seed untuk seed pertandingan dan jaringan simulasi
+            spectators (SpectatorBroadcaster): Siaran untuk penonton (opsional)
+        """
+        self.__tick_rate = tick_rate
+        self.__send_interval = max(1, round(tick_rate / send_rate))
+        self.__match_timeout = match_timeout
+        self.__network_options = (latency, jitter, loss)
+        self.__rng = random.Random(seed)
+        self.__matches = {}
+        self.__transport = None
+        self.__tick_task = None
+        self.__tick = 0
+        self.__spectators = spectators
+
+    def get_matches(self):
+        """Mengambil dictionary match_id -> ServerMatch"""
+        return self.__matches
+
+    def get_tick(self):
+        """Mengambil jumlah tick sejak server berjalan"""
+        return self.__tick
+
+    def get_address(self):
+        """Mengambil alamat (host, port) socket server"""
+        return self.__transport.get_extra_info("sockname")
+
+    async def start(self, host="127.0.0.1", port=9999):
+        """
+        Buka socket UDP dan mulai task tick
+
+        Args:
+            host (str): Alamat bind
+            port (int): Port bind (0 = port bebas)
+        """
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: ServerProtocol(self),
+            local_addr=(host, port)
+        )
+        latency, jitter, loss = self.__network_options
+        if latency > 0 or jitter > 0 or loss > 0:
+            transport = SimulatedNetwork(
+                transport, loop, latency, jitter, loss, seed=self.__rng.getrandbits(32)
+            )
+        self.__transport = transport
+        self.__tick_task = asyncio.create_task(self._tick_loop())
+
+    async def stop(self):
+        """Hentikan task tick dan tutup socket"""
+        if self.__tick_task is not None:
+            self.__tick_task.cancel()
+            try:
+                await self.__tick_task
+            except asyncio.CancelledError:
+                pass
+            self.__tick_task = None
+        if self.__transport is not None:
+            self.__transport.close()
+            self.__transport = None
+
+    def handle_packet(self, data, addr):
+        """
+        Proses satu paket dari client
+
+        Args:
+            data (bytes): Isi paket
+            addr (tuple): Alamat pengirim
+        """
+        if not data:
+            return
+
+        # Paket rusak atau dari versi lain (ukuran salah) diabaikan;
+        # error di handler tidak ditangkap agar bug tidak tersembunyi
+        packet_type = data[0]
+        try:
+            if packet_type == PACKET_INPUT:
+                _, match_id, player, sequence, direction = INPUT.unpack(data)
+            elif packet_type == PACKET_JOIN:
+                _, match_id = JOIN.unpack(data)
+            elif packet_type == PACKET_LEAVE:
+                _, match_id, player = LEAVE.unpack(data)
+            else:
+                return
+        except struct.error:
+            return
+
+        if packet_type == PACKET_INPUT:
+            self._handle_input(match_id, player, sequence, direction, addr)
+        elif packet_type == PACKET_JOIN:
+            self._handle_join(match_id, addr)
+        else:
+            self._handle_leave(match_id, player, addr)
+
+    def _handle_join(self, match_id, addr):
+        """Masukkan client ke slot kosong (JOIN yang diulang dijawab lagi)"""
+        match = self.__matches.get(match_id)
+        if match is None:
+            match = ServerMatch(match_id, self.__rng.getrandbits(63))
+            self.__matches[match_id] = match
+
+        player = match.find_player(addr)
+        if player == 0:
+            for index in range(2):
+                if match.addresses[index] is None:
+                    match.assign_slot(index, addr)
+                    player = index + 1
+                    break
+
+        if player:
+            match.last_seen[player - 1] = asyncio.get_running_loop().time()
+        self.__transport.sendto(JOINED.pack(PACKET_JOINED, match_id, player, self.__tick_rate), addr)
+
+    def _handle_input(self, match_id, player, sequence, direction, addr):
+        """Simpan input terbaru (paket lama yang datang terlambat diabaikan)"""
+        match = self.__matches.get(match_id)
+        if match is None or player not in (1, 2) or match.addresses[player - 1] != addr:
+            return
+
+        index = player - 1
+        match.last_seen[index] = asyncio.get_running_loop().time()
+        if sequence <= match.last_sequence[index]:
+            return
+        match.last_sequence[index] = sequence
+        match.inputs[index] = max(-1, min(1, direction))
+
+    def _handle_leave(self, match_id, player, addr):
+        """Kosongkan slot player yang keluar"""
+        match = self.__matches.get(match_id)
+        if match is None or player not in (1, 2) or match.addresses[player - 1] != addr:
+            return
+        match.free_slot(player - 1)
+        if match.addresses == [None, None]:
+            del self.__matches[match_id]
+
+    async def _tick_loop(self):
+        """
+        Jalankan tick dengan deadline absolut (tidak drift)
+        Jika tertinggal, maksimal 5 tick dikejar sekaligus
+        """
+        loop = asyncio.get_running_loop()
+        step_duration = 1.0 / self.__tick_rate
+        next_tick = loop.time()
+        while True:
+            now = loop.time()
+            steps = 0
+            while now >= next_tick and steps < 5:
+                self.tick()
+                next_tick += step_duration
+                steps += 1
+            if now >= next_tick:
+                # Terlalu tertinggal, buang sisa waktu
+                next_tick = now + step_duration
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+    def tick(self):
+        """Majukan semua pertandingan satu step dan kirim state bila waktunya"""
+        self.__tick += 1
+        send = self.__tick % self.__send_interval == 0
+        now = asyncio.get_running_loop().time()
+        transport = self.__transport
+
+        for match_id, match in list(self.__matches.items()):
+            self._drop_idle_players(match, now)
+            if match.addresses == [None, None]:
+                del self.__matches[match_id]
+                continue
+
+            started = match.is_started()
+            if started:
+                match.simulation.step(match.inputs)
+
+            if send:
+                for index, address in enumerate(match.addresses):
+                    if address is not None:
+                        packet = encode_state(match_id, match.simulation, started, match.last_sequence[index])
+                        transport.sendto(packet, address)
+                if self.__spectators is not None:
+                    self.__spectators.publish(match_id, match.simulation)
+
+    def _drop_idle_players(self, match, now):
+        """Keluarkan player yang tidak mengirim paket selama match_timeout"""
+        for index in range(2):
+            if match.addresses[index] is not None and now - match.last_seen[index] > self.__match_timeout:
+                match.free_slot(index)
+
+
+async def serve(host, port, spectator_port=None, **options):
+    """Jalankan server sampai dihentikan (Ctrl+C)"""
+    spectators = None
+    if spectator_port is not None:
+        spectators = SpectatorBroadcaster()
+        await spectators.start(host, spectator_port)
+        print(f"Siaran penonton di {host}:{spectators.get_address()[1]}")
+
+    server = PongServer(spectators=spectators, **options)
+    await server.start(host, port)
+    print(f"Pong server berjalan di {host}:{server.get_address()[1]}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+        if spectators is not None:
+            await spectators.stop()
+
+
+def main(argv=None):
+    """Entry point command line"""
+    parser = argparse.ArgumentParser(description="Server Pong online (UDP)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9999)
+    parser.add_argument("--tick-rate", type=int, default=PongSimulation.FPS)
+    parser.add_argument("--send-rate", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.0, help="latency simulasi (detik)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="jitter simulasi (detik)")
+    parser.add_argument("--loss", type=float, default=0.0, help="packet loss simulasi (0-1)")
+    parser.add_argument("--spectator-port", type=int, default=None, help="port TCP untuk penonton")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(
+            args.host, args.port, spectator_port=args.spectator_port,
+            tick_rate=args.tick_rate, send_rate=args.send_rate,
+            latency=args.latency, jitter=args.jitter, loss=args.loss
+        ))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
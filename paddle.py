@@ -11,6 +11,13 @@ class Paddle(GameObject):
     Menambahkan fitur khusus untuk paddle seperti movement dan size boost
     """
     
+    __slots__ = (
+        "__speed", "__base_height", "__velocity_y", "__size_boost", "__screen_height"
+    )
+    
+    # State GameObject + velocity_y, size_boost
+    STATE_SIZE = GameObject.STATE_SIZE + 2
+    
     def __init__(self, x, y, width, height, color, speed):
         """
         Constructor untuk Paddle
@@ -89,16 +96,20 @@ class Paddle(GameObject):
         """Hentikan gerakan paddle"""
         self.__velocity_y = 0
     
-    def update(self):
+    def update(self, dt=1):
         """
         Override method update dari GameObject (POLYMORPHISM)
         Update posisi paddle berdasarkan velocity dan boundary checking
+        
+        Args:
+            dt (float): Lama step dalam satuan frame (default 1 frame)
         """
-        if not self.is_active():
+        # Paddle diam tidak berpindah (posisinya selalu sudah di dalam layar)
+        if self.__velocity_y == 0 or not self.is_active():
             return
-        
+
         # Update posisi y berdasarkan velocity
-        new_y = self.get_y() + self.__velocity_y
+        new_y = self.get_y() + self.__velocity_y * dt
         
         # Boundary checking - pastikan paddle tidak keluar layar
         if new_y < 0:
@@ -108,13 +119,49 @@ class Paddle(GameObject):
         
         self.set_y(new_y)
     
-    def draw(self, canvas):
+    def advance(self, frames):
+        """
+        Majukan paddle beberapa frame sekaligus dengan velocity saat ini
+        Hasilnya sama dengan memanggil update() sebanyak frames kali
+        karena velocity konstan dan boundary hanya membatasi posisi
+        
+        Args:
+            frames (int): Jumlah frame
+        """
+        self.update(frames)
+    
+    def export_state(self, buffer, offset=0):
+        """
+        Tulis state paddle ke buffer datar (lihat GameObject.export_state)
+        
+        Returns:
+            int: Index setelah nilai terakhir yang ditulis
+        """
+        offset = super().export_state(buffer, offset)
+        buffer[offset] = self.__velocity_y
+        buffer[offset + 1] = self.__size_boost
+        return offset + 2
+    
+    def import_state(self, buffer, offset=0):
+        """
+        Baca state paddle dari buffer datar
+        
+        Returns:
+            int: Index setelah nilai terakhir yang dibaca
+        """
+        offset = super().import_state(buffer, offset)
+        self.__velocity_y = buffer[offset]
+        self.__size_boost = buffer[offset + 1]
+        return offset + 2
+    
+    def draw(self, canvas, detail=GameObject.DETAIL_FULL):
         """
         Override method draw dari GameObject (POLYMORPHISM)
         Menggambar paddle sebagai rectangle dengan efek gradasi
         
         Args:
             canvas: Tkinter canvas object
+            detail (int): Tingkat detail; highlight hanya di DETAIL_FULL
         """
         if not self.is_active():
             return
@@ -133,6 +180,9 @@ class Paddle(GameObject):
             tags="paddle"
         )
         
+        if detail < GameObject.DETAIL_FULL:
+            return
+        
         # Tambahkan highlight untuk efek 3D
         canvas.create_rectangle(
             x + 2, y + 2, x + width - 2, y + height / 2,
@@ -142,6 +192,27 @@ class Paddle(GameObject):
             tags="paddle"
         )
     
+    def draw_sprite(self, canvas, sprites, detail=GameObject.DETAIL_FULL):
+        """
+        Override method draw_sprite dari GameObject (POLYMORPHISM)
+        Menggambar paddle sebagai satu image pre-render (tanpa stipple)
+
+        Args:
+            canvas: Tkinter canvas object
+            sprites (SpriteCache): Cache sprite
+            detail (int): Tidak dipakai; highlight sudah ada di sprite tanpa biaya tambahan
+        """
+        if not self.is_active():
+            return
+
+        width = self.get_width()
+        height = self.get_height()
+        canvas.create_image(
+            self.get_x() + width / 2, self.get_y() + height / 2,
+            image=sprites.paddle(width, height, self.get_color()),
+            tags="paddle"
+        )
+
     def reset_position(self, x, y):
         """
         Reset posisi paddle ke koordinat tertentu
@@ -1,98 +1,91 @@
 """
-Class Particle untuk efek visual
+Class ParticleSystem untuk efek visual
 Tidak inherit dari GameObject karena lebih sederhana
+ParticleSystem menyimpan particle dalam array NumPy (struct-of-arrays)
 """
 
-import random
 import math
+import numpy as np
 
-class Particle:
+from game_object import GameObject
+
+class ParticleSystem:
     """
-    Class Particle untuk efek visual saat collision
+    Class untuk mengelola banyak particle sekaligus
+    State particle disimpan sebagai array NumPy yang dialokasikan sekali
+    (posisi, velocity, lifetime, ukuran, warna) dan di-update secara vektor.
+    Particle aktif selalu berada di index [0, count) dengan urutan dari yang
+    paling tua, sehingga saat kapasitas penuh particle tertua yang dibuang.
     """
     
-    def __init__(self, x, y, color):
+    GRAVITY = 0.2
+    DEFAULT_MAX_PARTICLES = 512
+    
+    def __init__(self, max_particles=DEFAULT_MAX_PARTICLES, seed=None):
         """
-        Constructor untuk Particle
+        Constructor untuk ParticleSystem
         
         Args:
-            x (float): Posisi x awal particle
-            y (float): Posisi y awal particle
-            color (str): Warna particle
+            max_particles (int): Jumlah maksimal particle yang hidup bersamaan
+            seed (int): Seed random untuk particle (None = random)
         """
-        self.__x = x
-        self.__y = y
-        self.__color = color
+        self.__capacity = max_particles
+        self.__count = 0
+        self.__emission_scale = 1.0  # Pengali jumlah particle per emit
+        self.__rng = np.random.default_rng(seed)
         
-        # Random velocity untuk setiap particle
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(2, 6)
-        self.__velocity_x = math.cos(angle) * speed
-        self.__velocity_y = math.sin(angle) * speed
+        # Struct-of-arrays, dialokasikan sekali
+        self.__x = np.zeros(max_particles)
+        self.__y = np.zeros(max_particles)
+        self.__velocity_x = np.zeros(max_particles)
+        self.__velocity_y = np.zeros(max_particles)
+        self.__lifetime = np.zeros(max_particles)
+        self.__max_lifetime = np.ones(max_particles)
+        self.__size = np.zeros(max_particles)
+        self.__color_index = np.zeros(max_particles, dtype=np.int32)
+        self.__arrays = (
+            self.__x, self.__y, self.__velocity_x, self.__velocity_y,
+            self.__lifetime, self.__max_lifetime, self.__size, self.__color_index
+        )
         
-        # Properties untuk fade out effect
-        self.__lifetime = random.randint(20, 40)  # Berapa frame particle bertahan
-        self.__max_lifetime = self.__lifetime
-        self.__size = random.uniform(2, 5)
-        self.__active = True
+        # Palet warna, particle hanya menyimpan index ke palet
+        self.__palette = []
+        self.__palette_index = {}
     
-    def is_active(self):
-        """Mengecek apakah particle masih aktif"""
-        return self.__active
+    def get_capacity(self):
+        """Mengambil jumlah maksimal particle"""
+        return self.__capacity
     
-    def update(self):
-        """Update posisi dan lifetime particle"""
-        if not self.__active:
-            return
-        
-        # Update posisi
-        self.__x += self.__velocity_x
-        self.__y += self.__velocity_y
-        
-        # Apply gravity (opsional, untuk efek lebih natural)
-        self.__velocity_y += 0.2
-        
-        # Kurangi lifetime
-        self.__lifetime -= 1
-        if self.__lifetime <= 0:
-            self.__active = False
+    def get_emission_scale(self):
+        """Mengambil pengali jumlah particle per emit"""
+        return self.__emission_scale
     
-    def draw(self, canvas):
+    def set_emission_scale(self, scale):
         """
-        Gambar particle di canvas
+        Atur pengali jumlah particle per emit (diturunkan di mesin lambat)
         
         Args:
-            canvas: Tkinter canvas object
+            scale (float): 1.0 = penuh, 0.0 = tidak ada particle baru
         """
-        if not self.__active:
-            return
+        self.__emission_scale = max(0.0, scale)
+    
+    def seed(self, seed):
+        """
+        Atur ulang seed random particle
         
-        # Hitung alpha (transparency) berdasarkan lifetime
-        alpha_ratio = self.__lifetime / self.__max_lifetime
-        
-        # Size yang mengecil seiring waktu
-        current_size = self.__size * alpha_ratio
-        
-        # Gambar particle sebagai oval kecil
-        canvas.create_oval(
-            self.__x - current_size,
-            self.__y - current_size,
-            self.__x + current_size,
-            self.__y + current_size,
-            fill=self.__color,
-            outline="",
-            tags="particle"
-        )
-
-
-class ParticleSystem:
-    """
-    Class untuk mengelola banyak particle sekaligus
-    """
+        Args:
+            seed (int): Seed baru (None = random)
+        """
+        self.__rng = np.random.default_rng(seed)
     
-    def __init__(self):
-        """Constructor untuk ParticleSystem"""
-        self.__particles = []
+    def _color_to_index(self, color):
+        """Ambil index palet untuk warna (tambahkan jika belum ada)"""
+        index = self.__palette_index.get(color)
+        if index is None:
+            index = len(self.__palette)
+            self.__palette.append(color)
+            self.__palette_index[color] = index
+        return index
     
     def emit(self, x, y, color, count=10):
         """
@@ -102,34 +95,102 @@ class ParticleSystem:
             x (float): Posisi x emisi
             y (float): Posisi y emisi
             color (str): Warna particles
-            count (int): Jumlah particles yang dikeluarkan
+            count (int): Jumlah particles yang dikeluarkan (sebelum emission scale)
         """
-        for _ in range(count):
-            particle = Particle(x, y, color)
-            self.__particles.append(particle)
+        scale = self.__emission_scale
+        if scale != 1.0 and count > 0:
+            # Minimal satu particle selama scale > 0 agar burst tetap terlihat
+            count = max(1, int(round(count * scale))) if scale > 0 else 0
+        count = min(count, self.__capacity)
+        if count <= 0:
+            return
+        
+        # Buang particle tertua jika kapasitas tidak cukup
+        overflow = self.__count + count - self.__capacity
+        if overflow > 0:
+            remaining = self.__count - overflow
+            for array in self.__arrays:
+                array[:remaining] = array[overflow:self.__count]
+            self.__count = remaining
+        
+        start = self.__count
+        end = start + count
+        rng = self.__rng
+        
+        # Random velocity untuk setiap particle
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(2, 6, count)
+        self.__x[start:end] = x
+        self.__y[start:end] = y
+        self.__velocity_x[start:end] = np.cos(angle) * speed
+        self.__velocity_y[start:end] = np.sin(angle) * speed
+        
+        # Properties untuk fade out effect
+        lifetime = rng.integers(20, 41, count)  # Berapa frame particle bertahan
+        self.__lifetime[start:end] = lifetime
+        self.__max_lifetime[start:end] = lifetime
+        self.__size[start:end] = rng.uniform(2, 5, count)
+        self.__color_index[start:end] = self._color_to_index(color)
+        
+        self.__count = end
     
     def update(self):
-        """Update semua particles"""
-        # Update dan hapus particle yang tidak aktif
-        self.__particles = [p for p in self.__particles if p.is_active()]
+        """Update semua particles dalam satu langkah vektor"""
+        n = self.__count
+        if n == 0:
+            return
         
-        for particle in self.__particles:
-            particle.update()
+        # Update posisi, gravity dan lifetime
+        self.__x[:n] += self.__velocity_x[:n]
+        self.__y[:n] += self.__velocity_y[:n]
+        self.__velocity_y[:n] += self.GRAVITY
+        self.__lifetime[:n] -= 1
+        
+        # Hapus particle yang mati dengan memadatkan array (urutan tetap)
+        alive = self.__lifetime[:n] > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count != n:
+            for array in self.__arrays:
+                array[:alive_count] = array[:n][alive]
+            self.__count = alive_count
     
-    def draw(self, canvas):
+    def draw(self, canvas, detail=GameObject.DETAIL_FULL):
         """
         Gambar semua particles
         
         Args:
             canvas: Tkinter canvas object
+            detail (int): Tingkat detail (GameObject.DETAIL_*); DETAIL_SIMPLE
+                menggambar kotak yang lebih murah daripada oval
         """
-        for particle in self.__particles:
-            particle.draw(canvas)
+        n = self.__count
+        if n == 0:
+            return
+        
+        # Size yang mengecil seiring waktu, dihitung sekaligus untuk semua particle
+        current_size = self.__size[:n] * (self.__lifetime[:n] / self.__max_lifetime[:n])
+        x = self.__x[:n]
+        y = self.__y[:n]
+        left = (x - current_size).tolist()
+        top = (y - current_size).tolist()
+        right = (x + current_size).tolist()
+        bottom = (y + current_size).tolist()
+        palette = self.__palette
+        colors = self.__color_index[:n].tolist()
+        create = canvas.create_rectangle if detail == GameObject.DETAIL_SIMPLE else canvas.create_oval
+        
+        for i in range(n):
+            create(
+                left[i], top[i], right[i], bottom[i],
+                fill=palette[colors[i]],
+                outline="",
+                tags="particle"
+            )
     
     def clear(self):
         """Hapus semua particles"""
-        self.__particles.clear()
+        self.__count = 0
     
     def get_particle_count(self):
         """Mengambil jumlah particles aktif"""
-        return len(self.__particles)
\ No newline at end of file
+        return self.__count
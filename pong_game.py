@@ -3,217 +3,307 @@ Pong Game Manager - Class utama yang mengelola seluruh game
 Demonstrasi penggunaan COMPOSITION dan orchestration berbagai class OOP
 """
 
-import tkinter as tk
-from ball import Ball
-from paddle import Paddle
-from powerup import PowerUp
-from particle import ParticleSystem
-from sound_manager import SoundManager
 import random
+import time
+from simulation import PongSimulation
+from multi_ball import MultiBallSimulation
+from fast_forward import FastForward
+from renderer import Renderer
+from game_loop import FixedTimestepLoop, ManualScheduler
+from profiler import FrameProfiler
+from quality import QualityController
+from replay import MatchRecorder
+from sound_manager import SoundManager
+from ai_player import AIController
 
 class PongGame:
     """
-    Main Game Manager yang mengatur semua komponen game
-    Menggunakan COMPOSITION: menggabungkan objek Ball, Paddle, PowerUp, dll
+    Main Game Manager yang mengatur tampilan, input dan menu game
+    Menggunakan COMPOSITION: seluruh logika game dijalankan oleh PongSimulation
     """
     
     # Konstanta game
-    WIDTH = 800
-    HEIGHT = 600
-    FPS = 60  # Frame per second
-    WINNING_SCORE = 5
-    POWERUP_SPAWN_CHANCE = 0.003  # 0.3% chance per frame
+    WIDTH = PongSimulation.WIDTH
+    HEIGHT = PongSimulation.HEIGHT
+    FPS = PongSimulation.FPS  # Frame per second
+    WINNING_SCORE = PongSimulation.WINNING_SCORE
+    MULTI_BALL_COUNT = 16  # Jumlah bola pada mode multi-ball
+    MIN_IDLE_FRAMES = 3  # Game loop hanya ditidurkan jika diam minimal sekian frame
+    CPU_LEVELS = (None, "easy", "medium", "hard")  # Urutan pilihan lawan CPU (tombol C)
     
     # Warna tema modern dengan gradasi
     BG_COLOR = "#0a0e27"
     ACCENT_COLOR = "#00d4ff"
     
-    def __init__(self, root):
+    def __init__(self, root=None, software_render=False, renderer=None, sound_manager=None):
         """
         Constructor untuk PongGame
         
         Args:
-            root: Tkinter root window
+            root: Tkinter root window. None untuk menjalankan game tanpa
+                display: waktu dimajukan lewat self.scheduler.advance() dan
+                input dikirim lewat press_key()/release_key()
+            software_render (bool): True untuk menggambar objek game ke
+                framebuffer NumPy yang ditampilkan sebagai satu image per frame
+            renderer (Renderer): Backend tampilan (default TkRenderer untuk
+                root, NullRenderer tanpa root)
+            sound_manager (SoundManager): Default dipilih otomatis; tanpa
+                root game berjalan tanpa suara
         """
         self.root = root
-        self.root.title("PONG GAME - OOP Project")
-        self.root.resizable(False, False)
-        
-        # Setup canvas dengan warna modern
-        self.canvas = tk.Canvas(
-            root,
-            width=self.WIDTH,
-            height=self.HEIGHT,
-            bg=self.BG_COLOR,
-            highlightthickness=0
-        )
-        self.canvas.pack()
+        if root is not None:
+            self.root.title("PONG GAME - OOP Project")
+            self.root.resizable(False, False)
+        
+        # Backend tampilan: semua gambar dan teks UI lewat interface Renderer
+        if renderer is None:
+            if root is not None:
+                from tk_renderer import TkRenderer
+                renderer = TkRenderer(root, self.WIDTH, self.HEIGHT, self.BG_COLOR, software_render)
+            else:
+                from renderer import NullRenderer
+                renderer = NullRenderer()
+        self.renderer = renderer
         
         # Game state
         self.__game_state = "MENU"  # MENU, PLAYING, PAUSED, GAME_OVER
-        self.__player1_score = 0
-        self.__player2_score = 0
-        self.__winner = None
+        self.__multi_ball = False  # Mode party dengan banyak bola
+        self.__ai = None  # AIController untuk player 2 (None = dua pemain)
+        
+        # Kualitas efek adaptif: turun di mesin lambat agar 60 FPS tetap terjaga
+        self.quality = QualityController(self.FPS, on_change=self._apply_quality)
         
         # Inisialisasi game objects
         self._init_game_objects()
         
         # Sound manager
-        self.sound_manager = SoundManager()
+        if sound_manager is None:
+            sound_manager = SoundManager(autodetect=root is not None)
+        self.sound_manager = sound_manager
         
-        # Particle system untuk efek visual
-        self.particle_system = ParticleSystem()
+        # Input paddle saat ini (dikirim ke simulasi setiap frame)
+        self.__inputs = [PongSimulation.STOP, PongSimulation.STOP]
         
-        # Power-up system
-        self.__current_powerup = None
-        self.__powerup_timer = 0
-        self.__powerup_duration = 180  # 3 detik (60 fps * 3)
-        self.__powerup_active_player = None  # 1 atau 2
+        # Rekaman seed + input setiap pertandingan (F9 untuk menyimpan)
+        self.recorder = MatchRecorder()
         
         # Key bindings
         self._setup_controls()
         
         # UI Elements
         self._create_ui()
+        self._show_menu()
+        
+        # Game loop dengan fixed timestep (logika selalu 60 step per detik);
+        # tanpa root, jadwal frame memakai waktu virtual ManualScheduler
+        if root is not None:
+            self.scheduler = root
+            clock = time.perf_counter
+        else:
+            self.scheduler = ManualScheduler()
+            clock = self.scheduler.time
+        self.game_loop = FixedTimestepLoop(
+            self.scheduler,
+            self._step,
+            self._render,
+            steps_per_second=self.FPS,
+            clock=clock,
+            skip_callback=self._skip_steps
+        )
+        self.game_loop.set_frame_listener(self.quality.frame)
         
-        # Game loop
-        self.__game_running = False
-        self.__update_id = None
+        # Profiling per fase (mati secara default, F3 untuk HUD)
+        self.profiler = FrameProfiler()
+        self.profiler.subscribe(self._update_profiler_hud)
+        self.__profiling = False
     
     def _init_game_objects(self):
-        """Inisialisasi semua game objects (Ball dan Paddle)"""
-        # Buat Ball di tengah layar
-        self.ball = Ball(
-            x=self.WIDTH / 2,
-            y=self.HEIGHT / 2,
-            radius=10,
-            color=self.ACCENT_COLOR,
-            speed=5
-        )
+        """Inisialisasi simulasi game beserta objek-objeknya"""
+        if self.__multi_ball:
+            self.simulation = MultiBallSimulation(
+                num_balls=self.MULTI_BALL_COUNT,
+                ball_collisions=True
+            )
+        else:
+            self.simulation = PongSimulation()
+        
+        # Alias ke objek milik simulasi untuk kebutuhan rendering
+        self.ball = self.simulation.get_balls()[0]
+        self.paddle1 = self.simulation.paddle1
+        self.paddle2 = self.simulation.paddle2
+        self.particle_system = self.simulation.particle_system
+        
+        # Prediksi event untuk menidurkan game loop (hanya mode klasik)
+        self.fast_forward = None if self.__multi_ball else FastForward(self.simulation)
+        self._apply_quality(self.quality)
+    
+    def _apply_quality(self, quality):
+        """
+        Terapkan tingkat kualitas ke particle dan renderer
+        (callback QualityController, juga dipanggil saat simulasi dibuat ulang)
         
-        # Buat Paddle 1 (kiri)
-        self.paddle1 = Paddle(
-            x=30,
-            y=self.HEIGHT / 2 - 50,
-            width=15,
-            height=100,
-            color="#FF6B6B",
-            speed=7
-        )
-        self.paddle1.set_screen_height(self.HEIGHT)
-        
-        # Buat Paddle 2 (kanan)
-        self.paddle2 = Paddle(
-            x=self.WIDTH - 45,
-            y=self.HEIGHT / 2 - 50,
-            width=15,
-            height=100,
-            color="#4ECDC4",
-            speed=7
-        )
-        self.paddle2.set_screen_height(self.HEIGHT)
+        Args:
+            quality (QualityController): Pengatur kualitas
+        """
+        self.particle_system.set_emission_scale(quality.get_particle_scale())
+        self.renderer.set_detail(quality.get_detail())
     
     def _setup_controls(self):
         """Setup keyboard controls untuk kedua pemain"""
-        # Player 1 controls (W/S) - support both lowercase and uppercase
-        self.root.bind('<w>', lambda e: self.paddle1.move_up())
-        self.root.bind('<W>', lambda e: self.paddle1.move_up())
-        self.root.bind('<s>', lambda e: self.paddle1.move_down())
-        self.root.bind('<S>', lambda e: self.paddle1.move_down())
-        self.root.bind('<KeyRelease-w>', lambda e: self.paddle1.stop())
-        self.root.bind('<KeyRelease-W>', lambda e: self.paddle1.stop())
-        self.root.bind('<KeyRelease-s>', lambda e: self.paddle1.stop())
-        self.root.bind('<KeyRelease-S>', lambda e: self.paddle1.stop())
-        
-        # Player 2 controls (Up/Down arrows)
-        self.root.bind('<Up>', lambda e: self.paddle2.move_up())
-        self.root.bind('<Down>', lambda e: self.paddle2.move_down())
-        self.root.bind('<KeyRelease-Up>', lambda e: self.paddle2.stop())
-        self.root.bind('<KeyRelease-Down>', lambda e: self.paddle2.stop())
-        
-        # Game controls
-        self.root.bind('<space>', lambda e: self._toggle_pause())
-        self.root.bind('<Return>', lambda e: self._handle_enter())
-        self.root.bind('<Escape>', lambda e: self._back_to_menu())
-        self.root.bind('<m>', lambda e: self.sound_manager.toggle())
+        up = PongSimulation.MOVE_UP
+        down = PongSimulation.MOVE_DOWN
+        stop = PongSimulation.STOP
+        
+        # Tabel keysym -> aksi, dipakai binding Tkinter dan press_key()
+        self.__key_press = {
+            # Player 1 controls (W/S) - support both lowercase and uppercase
+            'w': lambda: self._set_input(0, up),
+            'W': lambda: self._set_input(0, up),
+            's': lambda: self._set_input(0, down),
+            'S': lambda: self._set_input(0, down),
+            # Player 2 controls (Up/Down arrows)
+            'Up': lambda: self._set_input(1, up),
+            'Down': lambda: self._set_input(1, down),
+            # Game controls
+            'space': self._toggle_pause,
+            'Return': self._handle_enter,
+            'Escape': self._back_to_menu,
+            'm': lambda: self.sound_manager.toggle(),
+            'b': self.toggle_multi_ball,
+            'B': self.toggle_multi_ball,
+            'c': self.cycle_cpu_opponent,
+            'C': self.cycle_cpu_opponent,
+            'F3': self.toggle_profiler_hud,
+            'F9': self.save_replay,
+        }
+        self.__key_release = {
+            'w': lambda: self._set_input(0, stop),
+            'W': lambda: self._set_input(0, stop),
+            's': lambda: self._set_input(0, stop),
+            'S': lambda: self._set_input(0, stop),
+            'Up': lambda: self._set_input(1, stop),
+            'Down': lambda: self._set_input(1, stop),
+        }
+        
+        if self.root is not None:
+            self.root.bind('<KeyPress>', lambda e: self.press_key(e.keysym))
+            self.root.bind('<KeyRelease>', lambda e: self.release_key(e.keysym))
+    
+    def press_key(self, keysym):
+        """
+        Tangani tombol yang ditekan (juga untuk input tanpa display)
+        
+        Args:
+            keysym (str): Nama tombol Tkinter, misalnya 'w', 'Up', 'Return'
+        """
+        action = self.__key_press.get(keysym)
+        if action is not None:
+            action()
+    
+    def release_key(self, keysym):
+        """
+        Tangani tombol yang dilepas
+        
+        Args:
+            keysym (str): Nama tombol Tkinter
+        """
+        action = self.__key_release.get(keysym)
+        if action is not None:
+            action()
+    
+    def _set_input(self, player_index, direction):
+        """
+        Simpan input paddle dari keyboard
+        
+        Args:
+            player_index (int): 0 untuk player 1, 1 untuk player 2
+            direction (int): MOVE_UP, STOP atau MOVE_DOWN
+        """
+        # Paddle player 2 dikendalikan CPU jika lawan CPU aktif
+        if player_index == 1 and self.__ai is not None:
+            return
+        self.__inputs[player_index] = direction
+        
+        # Input membangunkan game loop yang sedang tidur
+        self.game_loop.wake()
     
     def _create_ui(self):
-        """Buat UI elements (scores, menu, dll)"""
+        """Buat UI elements (scores, menu, dll) sebagai label renderer"""
+        renderer = self.renderer
+        
         # Title untuk menu
-        self.title_text = self.canvas.create_text(
+        renderer.create_label(
+            "title", Renderer.LAYER_MENU,
             self.WIDTH / 2, 150,
             text="PONG",
             font=("Arial", 80, "bold"),
-            fill=self.ACCENT_COLOR,
-            tags="menu"
+            fill=self.ACCENT_COLOR
         )
         
         # Subtitle
-        self.subtitle_text = self.canvas.create_text(
+        renderer.create_label(
+            "subtitle", Renderer.LAYER_MENU,
             self.WIDTH / 2, 250,
             text="Player vs Player",
             font=("Arial", 24),
-            fill="white",
-            tags="menu"
+            fill="white"
         )
         
         # Instructions
-        self.instructions_text = self.canvas.create_text(
+        renderer.create_label(
+            "instructions", Renderer.LAYER_MENU,
             self.WIDTH / 2, 350,
-            text="Player 1: W/S | Player 2: ↑/↓\n\nPress ENTER to Start\nSPACE to Pause | ESC to Menu | M to Toggle Sound",
+            text="Player 1: W/S | Player 2: ↑/↓\n\nPress ENTER to Start | B for Multi-ball | C for CPU\nSPACE to Pause | ESC to Menu | M to Toggle Sound",
             font=("Arial", 16),
             fill="gray",
-            justify="center",
-            tags="menu"
+            justify="center"
         )
         
         # Score displays (hidden di menu)
-        self.score1_text = self.canvas.create_text(
+        renderer.create_label(
+            "score1", Renderer.LAYER_SCORE,
             self.WIDTH / 4, 50,
             text="0",
             font=("Arial", 48, "bold"),
-            fill="#FF6B6B",
-            state="hidden"
+            fill="#FF6B6B"
         )
         
-        self.score2_text = self.canvas.create_text(
+        renderer.create_label(
+            "score2", Renderer.LAYER_SCORE,
             self.WIDTH * 3 / 4, 50,
             text="0",
             font=("Arial", 48, "bold"),
-            fill="#4ECDC4",
-            state="hidden"
+            fill="#4ECDC4"
         )
         
-        # Center line
-        for i in range(0, self.HEIGHT, 20):
-            self.canvas.create_rectangle(
-                self.WIDTH / 2 - 2, i,
-                self.WIDTH / 2 + 2, i + 10,
-                fill="white",
-                outline="",
-                stipple="gray50",
-                tags="game_ui"
-            )
-        self.canvas.itemconfig("game_ui", state="hidden")
-        
         # Pause text
-        self.pause_text = self.canvas.create_text(
+        renderer.create_label(
+            "pause", Renderer.LAYER_PAUSE,
             self.WIDTH / 2, self.HEIGHT / 2,
             text="PAUSED\n\nPress SPACE to Resume",
             font=("Arial", 36, "bold"),
             fill="white",
-            justify="center",
-            state="hidden"
+            justify="center"
+        )
+        
+        # HUD profiling (F3)
+        renderer.create_label(
+            "profiler", Renderer.LAYER_PROFILER,
+            10, 10,
+            text="",
+            font=("Courier", 10),
+            fill="#9fe870",
+            anchor="nw"
         )
         
         # Game over text
-        self.gameover_text = self.canvas.create_text(
+        renderer.create_label(
+            "gameover", Renderer.LAYER_GAME_OVER,
             self.WIDTH / 2, self.HEIGHT / 2,
             text="",
             font=("Arial", 32, "bold"),  # Diperkecil dari 48 jadi 32
             fill=self.ACCENT_COLOR,
-            justify="center",
-            state="hidden"
+            justify="center"
         )
     
     def _handle_enter(self):
@@ -223,334 +313,316 @@ class PongGame:
         elif self.__game_state == "GAME_OVER":
             self._reset_game()
             self.__game_state = "PLAYING"
-            self.__game_running = True
             self._hide_menu()
-            self.canvas.itemconfig(self.gameover_text, state="hidden")
+            self.renderer.set_layer_visible(Renderer.LAYER_GAME_OVER, False)
             self.sound_manager.play_game_start()
-            self._game_loop()  # Restart game loop
+            self.game_loop.start()  # Restart game loop
+    
+    def toggle_multi_ball(self):
+        """Ganti mode klasik / multi-ball (hanya dari menu)"""
+        if self.__game_state != "MENU":
+            return
+        
+        self.__multi_ball = not self.__multi_ball
+        self._init_game_objects()
+        self.simulation.set_profiler(self.profiler if self.__profiling else None)
+        self._update_subtitle()
+    
+    def cycle_cpu_opponent(self):
+        """Ganti lawan CPU player 2: mati -> easy -> medium -> hard (hanya dari menu)"""
+        if self.__game_state != "MENU":
+            return
+        
+        current = self.__ai.get_difficulty() if self.__ai is not None else None
+        level = self.CPU_LEVELS[(self.CPU_LEVELS.index(current) + 1) % len(self.CPU_LEVELS)]
+        self.__ai = AIController(2, level) if level is not None else None
+        self._update_subtitle()
+    
+    def _update_subtitle(self):
+        """Tampilkan mode dan lawan yang dipilih pada menu"""
+        opponent = f"CPU ({self.__ai.get_difficulty().title()})" if self.__ai is not None else "Player"
+        subtitle = f"Player vs {opponent}"
+        if self.__multi_ball:
+            subtitle = f"Multi-ball Party - {subtitle}"
+        self.renderer.update_label("subtitle", text=subtitle)
+    
+    def set_profiling(self, enabled):
+        """
+        Aktifkan atau matikan pengukuran waktu per fase
+        Profiler eksternal bisa subscribe ke self.profiler lalu memanggil ini
+        
+        Args:
+            enabled (bool): True untuk mulai mengukur
+        """
+        self.__profiling = enabled
+        profiler = self.profiler if enabled else None
+        self.simulation.set_profiler(profiler)
+        self.game_loop.set_profiler(profiler)
+        if not enabled:
+            self.profiler.reset()
+    
+    def toggle_profiler_hud(self):
+        """Tampilkan/sembunyikan HUD timing per fase"""
+        visible = not self.__profiling
+        self.set_profiling(visible)
+        self.renderer.update_label("profiler", text="")
+        self.renderer.set_layer_visible(Renderer.LAYER_PROFILER, visible)
+    
+    def _update_profiler_hud(self, timings):
+        """Hook profiler: perbarui teks HUD setiap 30 frame"""
+        if self.profiler.get_frame_count() % 30 == 0:
+            text = self.profiler.format_stats() + "\nquality: " + self.quality.get_level_name()
+            self.renderer.update_label("profiler", text=text)
+    
+    def save_replay(self, path=None):
+        """
+        Simpan rekaman pertandingan terakhir ke file
+        
+        Args:
+            path (str): Nama file (default: pong_replay_<waktu>.bin)
+        
+        Returns:
+            str: Nama file yang ditulis, atau None jika belum ada rekaman
+        """
+        recording = self.recorder.get_recording()
+        if recording is None or recording.frame_count == 0:
+            return None
+        
+        if path is None:
+            path = time.strftime("pong_replay_%Y%m%d_%H%M%S.bin")
+        recording.save(path)
+        return path
     
     def _toggle_pause(self):
         """Toggle pause game"""
         if self.__game_state == "PLAYING":
+            # Selama pause tidak ada yang bergerak: game loop dihentikan
+            # setelah frame terakhir digambar, bukan terus dijadwalkan
             self.__game_state = "PAUSED"
-            self.canvas.itemconfig(self.pause_text, state="normal")
+            self.game_loop.stop()
+            self.renderer.set_layer_visible(Renderer.LAYER_PAUSE, True)
+            self._render()
         elif self.__game_state == "PAUSED":
             self.__game_state = "PLAYING"
-            self.canvas.itemconfig(self.pause_text, state="hidden")
+            self.renderer.set_layer_visible(Renderer.LAYER_PAUSE, False)
+            self.game_loop.start()
     
     def _back_to_menu(self):
         """Kembali ke menu utama"""
-        self.__game_running = False
-        if self.__update_id:
-            self.root.after_cancel(self.__update_id)
+        self.game_loop.stop()
         self.__game_state = "MENU"
         self._reset_game()
         self._show_menu()
     
     def _show_menu(self):
         """Tampilkan menu utama"""
-        self.canvas.itemconfig("menu", state="normal")
-        self.canvas.itemconfig("game_ui", state="hidden")
-        self.canvas.itemconfig(self.score1_text, state="hidden")
-        self.canvas.itemconfig(self.score2_text, state="hidden")
-        self.canvas.itemconfig(self.pause_text, state="hidden")
-        self.canvas.itemconfig(self.gameover_text, state="hidden")
+        renderer = self.renderer
+        renderer.hide_all()
+        renderer.set_layer_visible(Renderer.LAYER_MENU, True)
+        renderer.set_layer_visible(Renderer.LAYER_ARENA, False)
+        renderer.set_layer_visible(Renderer.LAYER_SCORE, False)
+        renderer.set_layer_visible(Renderer.LAYER_PAUSE, False)
+        renderer.set_layer_visible(Renderer.LAYER_GAME_OVER, False)
     
     def _hide_menu(self):
         """Sembunyikan menu utama"""
-        self.canvas.itemconfig("menu", state="hidden")
-        self.canvas.itemconfig("game_ui", state="normal")
-        self.canvas.itemconfig(self.score1_text, state="normal")
-        self.canvas.itemconfig(self.score2_text, state="normal")
+        renderer = self.renderer
+        renderer.set_layer_visible(Renderer.LAYER_MENU, False)
+        renderer.set_layer_visible(Renderer.LAYER_ARENA, True)
+        renderer.set_layer_visible(Renderer.LAYER_SCORE, True)
     
     def start_game(self):
         """Mulai game"""
+        self._reset_game()
         self.__game_state = "PLAYING"
-        self.__game_running = True
         self._hide_menu()
         self.sound_manager.play_game_start()
-        self._game_loop()
+        self.game_loop.start()
     
     def _reset_game(self):
         """Reset game ke kondisi awal"""
-        # Cancel existing game loop jika ada
-        if self.__update_id:
-            self.root.after_cancel(self.__update_id)
-            self.__update_id = None
-        
-        self.__player1_score = 0
-        self.__player2_score = 0
-        self.__winner = None
-        
-        # Reset ball position
-        self.ball.reset_position(self.WIDTH / 2, self.HEIGHT / 2)
-        
-        # Reset paddle positions
-        self.paddle1.reset_position(30, self.HEIGHT / 2 - 50)
-        self.paddle2.reset_position(self.WIDTH - 45, self.HEIGHT / 2 - 50)
+        # Hentikan game loop jika masih berjalan
+        self.game_loop.stop()
         
-        # Clear power-up
-        self.__current_powerup = None
-        self.__powerup_timer = 0
-        self.__powerup_active_player = None
-        
-        # Clear particles
-        self.particle_system.clear()
+        # Setiap pertandingan memakai seed baru yang ikut direkam
+        seed = random.getrandbits(63)
+        self.simulation.reset(seed)
+        self.recorder.start(seed)
+        self.__inputs = [PongSimulation.STOP, PongSimulation.STOP]
+        if self.__ai is not None:
+            self.__ai.reset()
         
         # Update score display
         self._update_score_display()
     
-    def _reset_ball(self):
-        """Reset ball ke tengah setelah score"""
-        self.ball.reset_position(self.WIDTH / 2, self.HEIGHT / 2)
-        # Set ball inactive sementara
-        self.ball.set_active(False)
-        
-        # Pause sebentar sebelum ball bergerak lagi (tapi loop tetap jalan)
-        def reactivate_ball():
-            self.ball.set_active(True)
-        
-        self.root.after(1000, reactivate_ball)
-    
     def _update_score_display(self):
         """Update tampilan score"""
-        self.canvas.itemconfig(self.score1_text, text=str(self.__player1_score))
-        self.canvas.itemconfig(self.score2_text, text=str(self.__player2_score))
-    
-    def _check_scoring(self):
-        """Cek apakah ada yang score"""
-        ball_x = self.ball.get_x()
-        
-        # Player 2 scores (ball keluar kiri)
-        if ball_x < 0:
-            self.__player2_score += 1
-            self._update_score_display()
-            self.sound_manager.play_score()
-            self._create_score_particles(0, self.HEIGHT / 2, "#4ECDC4")
-            self._reset_ball()
-            self._check_game_over()
-            return True
-        
-        # Player 1 scores (ball keluar kanan)
-        if ball_x > self.WIDTH:
-            self.__player1_score += 1
-            self._update_score_display()
-            self.sound_manager.play_score()
-            self._create_score_particles(self.WIDTH, self.HEIGHT / 2, "#FF6B6B")
-            self._reset_ball()
-            self._check_game_over()
-            return True
-        
-        return False
-    
-    def _check_game_over(self):
-        """Cek apakah game sudah selesai"""
-        if self.__player1_score >= self.WINNING_SCORE:
-            self.__winner = 1
-            self._game_over()
-        elif self.__player2_score >= self.WINNING_SCORE:
-            self.__winner = 2
-            self._game_over()
+        player1_score, player2_score = self.simulation.get_scores()
+        self.renderer.update_label("score1", text=str(player1_score))
+        self.renderer.update_label("score2", text=str(player2_score))
     
     def _game_over(self):
         """Handle game over"""
         self.__game_state = "GAME_OVER"
-        self.__game_running = False
         
-        winner_color = "#FF6B6B" if self.__winner == 1 else "#4ECDC4"
+        winner = self.simulation.get_winner()
+        player1_score, player2_score = self.simulation.get_scores()
+        self.recorder.finish((player1_score, player2_score))
+        winner_color = "#FF6B6B" if winner == 1 else "#4ECDC4"
         
         # Text yang lebih compact dengan line spacing yang baik
-        game_over_message = f"PLAYER {self.__winner} WINS!\n\n"
-        game_over_message += f"Final Score: {self.__player1_score} - {self.__player2_score}\n\n"
+        game_over_message = f"PLAYER {winner} WINS!\n\n"
+        game_over_message += f"Final Score: {player1_score} - {player2_score}\n\n"
         game_over_message += "Press ENTER to Play Again\n"
         game_over_message += "Press ESC for Menu"
         
-        self.canvas.itemconfig(
-            self.gameover_text,
-            text=game_over_message,
-            fill=winner_color,
-            state="normal"
-        )
+        self.renderer.update_label("gameover", text=game_over_message, fill=winner_color)
+        self.renderer.set_layer_visible(Renderer.LAYER_GAME_OVER, True)
         
         self.sound_manager.play_game_over()
-    
-    def _create_score_particles(self, x, y, color):
-        """Buat particle effect saat score"""
-        self.particle_system.emit(x, y, color, count=30)
-    
-    def _check_wall_collision(self):
-        """Cek collision dengan dinding atas/bawah"""
-        ball_y = self.ball.get_y()
-        ball_radius = self.ball.get_radius()
-        
-        # Collision dengan dinding atas
-        if ball_y - ball_radius < 0:
-            self.ball.set_y(ball_radius)
-            self.ball.reverse_y()
-            self.sound_manager.play_wall_hit()
-            self.particle_system.emit(self.ball.get_x(), 0, self.ACCENT_COLOR, count=8)
-            return True
-        
-        # Collision dengan dinding bawah
-        if ball_y + ball_radius > self.HEIGHT:
-            self.ball.set_y(self.HEIGHT - ball_radius)
-            self.ball.reverse_y()
-            self.sound_manager.play_wall_hit()
-            self.particle_system.emit(self.ball.get_x(), self.HEIGHT, self.ACCENT_COLOR, count=8)
-            return True
-        
-        return False
-    
-    def _check_paddle_collision(self):
-        """Cek collision dengan paddle"""
-        # Collision dengan paddle 1
-        if self.ball.collides_with(self.paddle1) and self.ball.get_velocity_x() < 0:
-            self.ball.bounce_off_paddle(self.paddle1)
-            self.sound_manager.play_paddle_hit()
-            self.particle_system.emit(
-                self.paddle1.get_x() + self.paddle1.get_width(),
-                self.ball.get_y(),
-                "#FF6B6B",
-                count=10
-            )
-            return True
-        
-        # Collision dengan paddle 2
-        if self.ball.collides_with(self.paddle2) and self.ball.get_velocity_x() > 0:
-            self.ball.bounce_off_paddle(self.paddle2)
-            self.sound_manager.play_paddle_hit()
-            self.particle_system.emit(
-                self.paddle2.get_x(),
-                self.ball.get_y(),
-                "#4ECDC4",
-                count=10
-            )
-            return True
         
-        return False
+        # Tampilkan frame terakhir lalu hentikan game loop
+        self._render()
+        self.game_loop.stop()
     
-    def _spawn_powerup(self):
-        """Spawn power-up secara random"""
-        # Spawn power-up jika tidak ada yang aktif atau yang sebelumnya sudah tidak aktif
-        if (self.__current_powerup is None or not self.__current_powerup.is_active()) and random.random() < self.POWERUP_SPAWN_CHANCE:
-            self.__current_powerup = PowerUp.spawn_random(self.WIDTH, self.HEIGHT)
+    def _handle_events(self, events):
+        """
+        Tanggapi event dari simulasi (suara dan tampilan)
+        
+        Args:
+            events (list): Event yang dikembalikan PongSimulation.step()
+        """
+        # Banyak bola bisa memicu event yang sama berkali-kali dalam satu step
+        for event in dict.fromkeys(events):
+            if event == PongSimulation.EVENT_WALL_HIT or event == MultiBallSimulation.EVENT_BALL_HIT:
+                self.sound_manager.play_wall_hit()
+            elif event == PongSimulation.EVENT_PADDLE_HIT:
+                self.sound_manager.play_paddle_hit()
+            elif event == PongSimulation.EVENT_POWERUP_COLLECT:
+                self.sound_manager.play_powerup_collect()
+            elif event == PongSimulation.EVENT_SCORE:
+                self._update_score_display()
+                self.sound_manager.play_score()
+            elif event == PongSimulation.EVENT_GAME_OVER:
+                self._game_over()
     
-    def _check_powerup_collection(self):
-        """Cek apakah ada yang mengambil power-up"""
-        if self.__current_powerup is None or not self.__current_powerup.is_active():
+    def _step(self):
+        """Satu step logika game, dipanggil game loop dengan interval tetap"""
+        # Jika paused atau state lain, simulasi tidak maju
+        if self.__game_state != "PLAYING":
             return
         
-        # Cek collision dengan ball
-        if self.ball.collides_with(self.__current_powerup):
-            powerup_type = self.__current_powerup.get_type()
-            
-            # Simpan posisi untuk particle effect
-            powerup_x = self.__current_powerup.get_x()
-            powerup_y = self.__current_powerup.get_y()
-            powerup_color = self.__current_powerup.get_color()
-            
-            # Collect power-up
-            self.__current_powerup.collect()
-            self.sound_manager.play_powerup_collect()
-            
-            # Tentukan siapa yang dapat power-up berdasarkan arah bola
-            if self.ball.get_velocity_x() > 0:
-                # Bola ke kanan, player 2 dapat power-up
-                self.__powerup_active_player = 2
-                if powerup_type == PowerUp.SPEED_BOOST:
-                    self.ball.set_speed_boost(1.5)
-                elif powerup_type == PowerUp.SIZE_BOOST:
-                    self.paddle2.set_size_boost(1.5)
-            else:
-                # Bola ke kiri, player 1 dapat power-up
-                self.__powerup_active_player = 1
-                if powerup_type == PowerUp.SPEED_BOOST:
-                    self.ball.set_speed_boost(1.5)
-                elif powerup_type == PowerUp.SIZE_BOOST:
-                    self.paddle1.set_size_boost(1.5)
-            
-            self.__powerup_timer = self.__powerup_duration
-            
-            # Particle effect
-            self.particle_system.emit(
-                powerup_x,
-                powerup_y,
-                powerup_color,
-                count=20
-            )
-            
-            # Set current_powerup ke None agar bisa spawn lagi
-            self.__current_powerup = None
-    
-    def _update_powerup(self):
-        """Update power-up timer dan reset jika habis"""
-        if self.__powerup_timer > 0:
-            self.__powerup_timer -= 1
-            if self.__powerup_timer == 0:
-                # Reset power-up effects
-                self.ball.reset_speed_boost()
-                self.paddle1.reset_size_boost()
-                self.paddle2.reset_size_boost()
-                self.__powerup_active_player = None
-    
-    def _game_loop(self):
-        """Main game loop yang berjalan setiap frame"""
-        # Cek apakah game masih running dan dalam state PLAYING
-        if not self.__game_running:
+        # Input CPU dihitung dari state terbaru, sama seperti tombol ditekan
+        if self.__ai is not None:
+            self.__inputs[1] = self.__ai.get_input(self.simulation)
+        
+        # Jalankan satu step logika game (input mode klasik ikut direkam)
+        if not self.__multi_ball:
+            self.recorder.record(self.__inputs)
+        events = self.simulation.step(self.__inputs)
+        self._handle_events(events)
+        self._suspend_if_idle()
+    
+    def _suspend_if_idle(self):
+        """
+        Tidurkan game loop selama tidak ada yang bergerak (misalnya bola
+        menunggu respawn setelah skor) sampai event berikutnya atau input
+        """
+        if self.__game_state != "PLAYING" or self.fast_forward is None:
             return
-            
-        if self.__game_state != "PLAYING":
-            # Jika paused atau state lain, schedule ulang dan return
-            self.__update_id = self.root.after(1000 // self.FPS, self._game_loop)
+        if self.__inputs[0] != PongSimulation.STOP or self.__inputs[1] != PongSimulation.STOP:
             return
         
-        # Update game objects
-        self.ball.update()
-        self.paddle1.update()
-        self.paddle2.update()
+        # Bola bergerak atau power-up berdenyut perlu digambar setiap frame
+        simulation = self.simulation
+        if simulation.ball.is_active():
+            return
+        powerup = simulation.get_current_powerup()
+        if powerup is not None and powerup.is_active():
+            return
         
-        # Update power-up
-        if self.__current_powerup and self.__current_powerup.is_active():
-            self.__current_powerup.update()
-            # Jika lifetime habis, set ke None agar bisa spawn lagi
-            if not self.__current_powerup.is_active():
-                self.__current_powerup = None
+        # Particle aktif dan timer yang hampir habis membuat idle_frames kecil
+        frames = self.fast_forward.idle_frames(self.FPS * 60)
+        if frames >= self.MIN_IDLE_FRAMES:
+            self.game_loop.suspend(frames / self.FPS)
+    
+    def _skip_steps(self, steps):
+        """
+        Jalankan step yang tertunda selama game loop tidur sekaligus
+        (dipanggil game loop saat bangun oleh timer atau input)
         
-        self._update_powerup()
-        self._spawn_powerup()
-        self._check_powerup_collection()
+        Args:
+            steps (int): Jumlah step yang tertunda
+        """
+        if self.__game_state != "PLAYING":
+            return
         
-        # Update particle system
-        self.particle_system.update()
+        inputs = tuple(self.__inputs)
+        start = self.simulation.get_frame()
+        if self.fast_forward is not None:
+            events = self.fast_forward.advance(inputs, steps)
+        else:
+            events = []
+            for _ in range(steps):
+                events.extend(self.simulation.step(inputs))
+        
+        # Frame yang dilompati tetap direkam agar replay identik
+        if not self.__multi_ball:
+            for _ in range(self.simulation.get_frame() - start):
+                self.recorder.record(inputs)
+        self._handle_events(events)
+    
+    def _render(self, alpha=1.0):
+        """
+        Render semua objek lewat renderer
         
-        # Check collisions
-        self._check_wall_collision()
-        self._check_paddle_collision()
-        self._check_scoring()
+        Args:
+            alpha (float): Interpolasi antara state sebelumnya (0.0) dan
+                state terbaru (1.0) agar gerakan tetap halus
+        """
+        # Saat simulasi tidak maju (pause), tampilkan state terbaru apa adanya
+        if self.__game_state != "PLAYING":
+            alpha = 1.0
         
-        # Render everything
-        self._render()
+        # Posisi objek diinterpolasi sementara selama menggambar
+        profiler = self.profiler if self.__profiling else None
+        if profiler is not None:
+            profiler.skip()
+        saved_positions = self.simulation.apply_interpolation(alpha)
         
-        # Schedule next frame
-        self.__update_id = self.root.after(1000 // self.FPS, self._game_loop)
-    
-    def _render(self):
-        """Render semua objek ke canvas"""
-        # Clear canvas (hapus semua objek game, kecuali UI)
-        self.canvas.delete("ball", "paddle", "powerup", "particle")
+        # Item canvas dari frame sebelumnya dipakai ulang, bukan dihapus
+        renderer = self.renderer
+        renderer.begin_frame()
         
-        # Draw game objects
-        self.ball.draw(self.canvas)
-        self.paddle1.draw(self.canvas)
-        self.paddle2.draw(self.canvas)
+        # Draw game objects (backend memilih sprite atau bentuk biasa)
+        for ball in self.simulation.get_balls():
+            renderer.draw(ball)
+        renderer.draw(self.paddle1)
+        renderer.draw(self.paddle2)
         
         # Draw power-up
-        if self.__current_powerup and self.__current_powerup.is_active():
-            self.__current_powerup.draw(self.canvas)
+        for powerup in self.simulation.get_powerups():
+            renderer.draw(powerup)
         
         # Draw particles
-        self.particle_system.draw(self.canvas)
+        renderer.draw(self.particle_system)
+        
+        # Sembunyikan item yang tidak terpakai (particle mati, power-up hilang)
+        renderer.end_frame()
+        
+        self.simulation.restore_positions(saved_positions)
+        if profiler is not None:
+            profiler.lap(profiler.PHASE_RENDER)
+    
+    def close(self):
+        """Tutup jendela beserta worker audio"""
+        self.game_loop.stop()
+        self.sound_manager.close()
+        self.renderer.close()
+        if self.root is not None:
+            self.root.destroy()
     
     def run(self):
         """Jalankan aplikasi"""
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         self.root.mainloop()
\ No newline at end of file
@@ -12,6 +12,8 @@ class PowerUp(GameObject):
     Menambahkan fitur khusus untuk power-up seperti tipe dan durasi
     """
     
+    __slots__ = ("__type", "__size", "__rotation", "__pulse", "__lifetime", "__collected")
+    
     # Tipe-tipe power-up yang tersedia
     SPEED_BOOST = "speed_boost"  # Mempercepat bola
     SIZE_BOOST = "size_boost"    # Memperbesar paddle
@@ -22,6 +24,12 @@ class PowerUp(GameObject):
         SIZE_BOOST: "#4ECDC4"    # Cyan untuk size
     }
     
+    # Urutan tipe untuk export_state (tipe disimpan sebagai index)
+    TYPES = (SPEED_BOOST, SIZE_BOOST)
+    
+    # State GameObject + tipe, rotation, pulse, lifetime, collected
+    STATE_SIZE = GameObject.STATE_SIZE + 5
+    
     def __init__(self, x, y, size, powerup_type):
         """
         Constructor untuk PowerUp
@@ -88,13 +96,64 @@ class PowerUp(GameObject):
         if self.__lifetime <= 0:
             self.set_active(False)
     
-    def draw(self, canvas):
+    def advance(self, frames):
+        """
+        Majukan animasi dan lifetime beberapa frame sekaligus
+        Setara dengan update() sebanyak frames kali
+        
+        Args:
+            frames (int): Jumlah frame
+        """
+        if not self.is_active() or self.__collected:
+            return
+        
+        self.__rotation = (self.__rotation + 2 * frames) % 360
+        self.__pulse += 0.1 * frames
+        self.__lifetime -= frames
+        if self.__lifetime <= 0:
+            self.set_active(False)
+    
+    def export_state(self, buffer, offset=0):
+        """
+        Tulis state power-up ke buffer datar (lihat GameObject.export_state)
+        
+        Returns:
+            int: Index setelah nilai terakhir yang ditulis
+        """
+        offset = super().export_state(buffer, offset)
+        buffer[offset] = self.TYPES.index(self.__type)
+        buffer[offset + 1] = self.__rotation
+        buffer[offset + 2] = self.__pulse
+        buffer[offset + 3] = self.__lifetime
+        buffer[offset + 4] = 1.0 if self.__collected else 0.0
+        return offset + 5
+    
+    def import_state(self, buffer, offset=0):
+        """
+        Baca state power-up dari buffer datar (tipe dan warna ikut berubah)
+        
+        Returns:
+            int: Index setelah nilai terakhir yang dibaca
+        """
+        offset = super().import_state(buffer, offset)
+        self.__type = self.TYPES[int(buffer[offset])]
+        self.set_color(self.COLORS[self.__type])
+        self.__size = self.get_width()
+        self.__rotation = buffer[offset + 1]
+        self.__pulse = buffer[offset + 2]
+        self.__lifetime = buffer[offset + 3]
+        self.__collected = buffer[offset + 4] != 0.0
+        return offset + 5
+    
+    def draw(self, canvas, detail=GameObject.DETAIL_FULL):
         """
         Override method draw dari GameObject (POLYMORPHISM)
         Menggambar power-up dengan animasi
         
         Args:
             canvas: Tkinter canvas object
+            detail (int): Tingkat detail; DETAIL_SIMPLE hanya menggambar
+                diamond diam tanpa pulse, highlight dan icon
         """
         if not self.is_active() or self.__collected:
             return
@@ -106,7 +165,10 @@ class PowerUp(GameObject):
         size = self.__size
         
         # Hitung scale dari pulse effect
-        pulse_scale = 1.0 + math.sin(self.__pulse) * 0.2
+        if detail > GameObject.DETAIL_SIMPLE:
+            pulse_scale = 1.0 + math.sin(self.__pulse) * 0.2
+        else:
+            pulse_scale = 1.0
         current_size = size * pulse_scale
         
         # Gambar power-up sebagai diamond (rotated square)
@@ -130,8 +192,26 @@ class PowerUp(GameObject):
             tags="powerup"
         )
         
+        if detail == GameObject.DETAIL_SIMPLE:
+            return
+        
         # Inner highlight
-        inner_size = half_size * 0.5
+        if detail >= GameObject.DETAIL_FULL:
+            self._draw_highlight(canvas, x, y, half_size * 0.5)
+        
+        # Gambar icon sesuai tipe
+        self._draw_icon(canvas, x, y, size * 0.4)
+    
+    def _draw_highlight(self, canvas, x, y, inner_size):
+        """
+        Gambar highlight stipple di tengah diamond
+        
+        Args:
+            canvas: Tkinter canvas object
+            x (float): Posisi x center
+            y (float): Posisi y center
+            inner_size (float): Setengah lebar diamond highlight
+        """
         inner_points = [
             x, y - inner_size,
             x + inner_size, y,
@@ -145,9 +225,6 @@ class PowerUp(GameObject):
             stipple="gray50",
             tags="powerup"
         )
-        
-        # Gambar icon sesuai tipe
-        self._draw_icon(canvas, x, y, size * 0.4)
     
     def _draw_icon(self, canvas, x, y, size):
         """
@@ -178,8 +255,37 @@ class PowerUp(GameObject):
                 tags="powerup"
             )
     
+    def draw_sprite(self, canvas, sprites, detail=GameObject.DETAIL_FULL):
+        """
+        Override method draw_sprite dari GameObject (POLYMORPHISM)
+        Diamond, highlight dan icon digabung dalam satu image pre-render;
+        ukuran pulse dibulatkan ke bucket oleh SpriteCache
+
+        Args:
+            canvas: Tkinter canvas object
+            sprites (SpriteCache): Cache sprite
+            detail (int): Tingkat detail; DETAIL_SIMPLE mematikan pulse
+                sehingga image tidak berganti setiap frame
+        """
+        if not self.is_active() or self.__collected:
+            return
+
+        import math
+
+        size = self.__size
+        if detail > GameObject.DETAIL_SIMPLE:
+            current_size = size * (1.0 + math.sin(self.__pulse) * 0.2)
+        else:
+            current_size = size
+        icon = "speed" if self.__type == self.SPEED_BOOST else "size"
+        canvas.create_image(
+            self.get_x(), self.get_y(),
+            image=sprites.powerup(icon, current_size, size * 0.4, self.get_color()),
+            tags="powerup"
+        )
+
     @staticmethod
-    def spawn_random(canvas_width, canvas_height, size=20):
+    def spawn_random(canvas_width, canvas_height, size=20, rng=None):
         """
         Static method untuk spawn power-up random
         
@@ -187,15 +293,19 @@ class PowerUp(GameObject):
             canvas_width (float): Lebar canvas
             canvas_height (float): Tinggi canvas
             size (float): Ukuran power-up
+            rng (random.Random): Sumber random (None = modul random global)
             
         Returns:
             PowerUp: Objek PowerUp baru dengan posisi dan tipe random
         """
+        if rng is None:
+            rng = random
+        
         # Random posisi di tengah layar (hindari tepi)
-        x = random.randint(int(canvas_width * 0.3), int(canvas_width * 0.7))
-        y = random.randint(int(canvas_height * 0.2), int(canvas_height * 0.8))
+        x = rng.randint(int(canvas_width * 0.3), int(canvas_width * 0.7))
+        y = rng.randint(int(canvas_height * 0.2), int(canvas_height * 0.8))
         
         # Random tipe
-        powerup_type = random.choice([PowerUp.SPEED_BOOST, PowerUp.SIZE_BOOST])
+        powerup_type = rng.choice([PowerUp.SPEED_BOOST, PowerUp.SIZE_BOOST])
         
         return PowerUp(x, y, size, powerup_type)
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""
+FrameProfiler - Pengukur waktu per fase untuk setiap frame game
+Menyimpan statistik bergulir (mean, p95, p99, max) dan menyediakan hook
+agar profiler eksternal bisa menerima timing setiap frame
+"""
+
+from collections import deque
+import time
+
+class FrameProfiler:
+    """
+    Class untuk mengukur durasi setiap fase game loop
+    Pemakaian dalam satu frame:
+        begin_frame() -> lap("fase") berkali-kali -> end_frame()
+    skip() dipakai untuk mengabaikan waktu di luar fase yang diukur.
+    Kode yang diukur cukup menyimpan referensi profiler atau None, sehingga
+    saat profiling mati biayanya hanya satu pengecekan None.
+    """
+
+    # Nama fase standar game loop
+    PHASE_OBJECTS = "objects"
+    PHASE_POWERUP = "powerup"
+    PHASE_PARTICLES = "particles"
+    PHASE_COLLISIONS = "collisions"
+    PHASE_RENDER = "render"
+    PHASE_TOTAL = "total"
+
+    PHASES = (PHASE_OBJECTS, PHASE_POWERUP, PHASE_PARTICLES, PHASE_COLLISIONS, PHASE_RENDER)
+
+    def __init__(self, window=120, clock=time.perf_counter):
+        """
+        Constructor untuk FrameProfiler
+
+        Args:
+            window (int): Jumlah frame terakhir yang dipakai untuk statistik
+            clock: Fungsi waktu dalam detik
+        """
+        self.__clock = clock
+        self.__window = window
+        self.__samples = {}  # fase -> deque durasi (detik)
+        self.__hooks = []
+        self.__frame_times = {}
+        self.__frame_start = 0.0
+        self.__last_time = 0.0
+        self.__frame_count = 0
+
+    def get_frame_count(self):
+        """Mengambil jumlah frame yang sudah diukur"""
+        return self.__frame_count
+
+    def subscribe(self, callback):
+        """
+        Daftarkan hook yang dipanggil setiap akhir frame
+
+        Args:
+            callback: Fungsi callback(timings), timings adalah dict
+                nama fase -> durasi dalam detik (termasuk PHASE_TOTAL)
+        """
+        self.__hooks.append(callback)
+
+    def unsubscribe(self, callback):
+        """Hapus hook yang sudah didaftarkan"""
+        if callback in self.__hooks:
+            self.__hooks.remove(callback)
+
+    def begin_frame(self):
+        """Mulai pengukuran frame baru"""
+        now = self.__clock()
+        self.__frame_start = now
+        self.__last_time = now
+        self.__frame_times = {}
+
+    def lap(self, phase):
+        """
+        Catat waktu sejak lap sebelumnya sebagai bagian dari fase
+
+        Args:
+            phase (str): Nama fase (boleh dipanggil beberapa kali per frame)
+        """
+        now = self.__clock()
+        times = self.__frame_times
+        times[phase] = times.get(phase, 0.0) + (now - self.__last_time)
+        self.__last_time = now
+
+    def skip(self):
+        """Abaikan waktu sejak lap terakhir (tidak masuk fase mana pun)"""
+        self.__last_time = self.__clock()
+
+    def end_frame(self):
+        """Selesaikan frame, simpan ke statistik dan panggil semua hook"""
+        times = self.__frame_times
+        times[self.PHASE_TOTAL] = self.__clock() - self.__frame_start
+        self.__frame_count += 1
+
+        for phase, duration in times.items():
+            samples = self.__samples.get(phase)
+            if samples is None:
+                samples = self.__samples[phase] = deque(maxlen=self.__window)
+            samples.append(duration)
+
+        for hook in self.__hooks:
+            hook(times)
+
+    def get_stats(self, phase):
+        """
+        Hitung statistik bergulir untuk satu fase
+
+        Args:
+            phase (str): Nama fase
+
+        Returns:
+            dict: mean, p95, p99 dan max dalam milidetik (None jika belum ada data)
+        """
+        samples = self.__samples.get(phase)
+        if not samples:
+            return None
+
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return {
+            "mean": sum(ordered) / len(ordered) * 1000,
+            "p95": ordered[int(last * 0.95)] * 1000,
+            "p99": ordered[int(last * 0.99)] * 1000,
+            "max": ordered[last] * 1000
+        }
+
+    def format_stats(self):
+        """
+        Susun statistik semua fase menjadi teks untuk HUD
+
+        Returns:
+            str: Satu baris per fase
+        """
+        lines = ["phase        mean   p95   p99   max (ms)"]
+        for phase in self.PHASES + (self.PHASE_TOTAL,):
+            stats = self.get_stats(phase)
+            if stats is None:
+                continue
+            lines.append("{:<11}{:>6.2f}{:>6.2f}{:>6.2f}{:>6.2f}".format(
+                phase, stats["mean"], stats["p95"], stats["p99"], stats["max"]
+            ))
+        return "\n".join(lines)
+
+    def reset(self):
+        """Hapus semua statistik yang terkumpul"""
+        self.__samples.clear()
+        self.__frame_count = 0
@@ -0,0 +1,161 @@
+"""
+QualityController - Kualitas grafis adaptif berdasarkan waktu frame
+Mengamati waktu frame dari FixedTimestepLoop terhadap budget 60 FPS lalu
+menurunkan kualitas efek bertahap (jumlah particle, highlight, animasi
+power-up) di mesin lambat, dan menaikkannya kembali dengan hysteresis
+saat ada ruang. Hanya efek visual yang berubah; simulasi tidak terpengaruh.
+"""
+
+from game_object import GameObject
+
+
+class QualityController:
+    """
+    Pengatur tingkat kualitas dengan hysteresis
+    - Turun satu tingkat jika frame terlambat (interval rata-rata melewati
+      budget) atau kerja frame hampir menghabiskan budget selama DEGRADE_FRAMES
+    - Naik satu tingkat hanya jika kerja frame jauh di bawah budget selama
+      restore_frames (jauh lebih lama dari DEGRADE_FRAMES)
+    - Jika kualitas harus turun lagi tak lama setelah naik, restore_frames
+      digandakan agar tidak bolak-balik (flapping) setiap beberapa detik
+    """
+
+    # (nama, pengali jumlah particle, tingkat detail gambar), dari tertinggi
+    LEVELS = (
+        ("high", 1.0, GameObject.DETAIL_FULL),
+        ("medium", 0.5, GameObject.DETAIL_FULL),
+        ("low", 0.5, GameObject.DETAIL_NO_HIGHLIGHT),
+        ("minimal", 0.25, GameObject.DETAIL_SIMPLE),
+    )
+
+    # Batas relatif terhadap budget frame (1 / fps)
+    DEGRADE_INTERVAL = 1.2  # Interval rata-rata > 1.2 budget = frame terlewat
+    DEGRADE_WORK = 0.85     # Kerja frame > 85% budget = hampir terlambat
+    RESTORE_INTERVAL = 1.05
+    RESTORE_WORK = 0.5      # Naik hanya jika kerja frame < 50% budget
+
+    DEGRADE_FRAMES = 30       # ~0.5 detik di atas batas sebelum turun
+    RESTORE_FRAMES = 180      # ~3 detik di bawah batas sebelum naik
+    MAX_RESTORE_FRAMES = 1800  # Batas backoff (~30 detik)
+    SMOOTHING = 0.1           # Bobot sampel baru pada rata-rata eksponensial
+
+    def __init__(self, fps=60, on_change=None):
+        """
+        Constructor untuk QualityController
+
+        Args:
+            fps (int): Target frame per detik (budget = 1 / fps)
+            on_change: Fungsi on_change(controller) yang dipanggil setiap
+                tingkat kualitas berubah
+        """
+        self.__budget = 1.0 / fps
+        self.__on_change = on_change
+        self.__level = 0
+        self.__restore_frames = self.RESTORE_FRAMES
+        self.reset()
+
+    def reset(self):
+        """Kembali ke kualitas tertinggi dan hapus semua pengukuran"""
+        changed = self.__level != 0
+        self.__level = 0
+        self.__restore_frames = self.RESTORE_FRAMES
+        self.__last_change_was_restore = False
+        self._clear_measurements()
+        if changed and self.__on_change is not None:
+            self.__on_change(self)
+
+    def _clear_measurements(self):
+        """Mulai pengukuran baru (setelah tingkat berubah)"""
+        self.__interval = None   # Rata-rata eksponensial interval frame (detik)
+        self.__work = None       # Rata-rata eksponensial kerja frame (detik)
+        self.__over_frames = 0   # Frame berturut-turut di atas batas turun
+        self.__under_frames = 0  # Frame berturut-turut di bawah batas naik
+        self.__frames_since_change = 0
+
+    # GETTER methods
+    def get_level(self):
+        """Mengambil index tingkat kualitas (0 = tertinggi)"""
+        return self.__level
+
+    def get_level_name(self):
+        """Mengambil nama tingkat kualitas"""
+        return self.LEVELS[self.__level][0]
+
+    def get_particle_scale(self):
+        """Mengambil pengali jumlah particle untuk tingkat saat ini"""
+        return self.LEVELS[self.__level][1]
+
+    def get_detail(self):
+        """Mengambil tingkat detail gambar (GameObject.DETAIL_*)"""
+        return self.LEVELS[self.__level][2]
+
+    def get_restore_frames(self):
+        """Mengambil jumlah frame tenang yang dibutuhkan untuk naik tingkat"""
+        return self.__restore_frames
+
+    def get_average_interval(self):
+        """Mengambil rata-rata interval frame dalam detik (None jika belum ada)"""
+        return self.__interval
+
+    def get_average_work(self):
+        """Mengambil rata-rata kerja frame dalam detik (None jika belum ada)"""
+        return self.__work
+
+    def frame(self, interval, work):
+        """
+        Catat satu frame (dipasang sebagai frame listener FixedTimestepLoop)
+
+        Args:
+            interval (float): Jarak dari awal frame sebelumnya (detik)
+            work (float): Lama kerja frame ini, step + render (detik)
+        """
+        if self.__interval is None:
+            self.__interval = interval
+            self.__work = work
+        else:
+            smoothing = self.SMOOTHING
+            self.__interval += (interval - self.__interval) * smoothing
+            self.__work += (work - self.__work) * smoothing
+        self.__frames_since_change += 1
+
+        budget = self.__budget
+        if self.__interval > budget * self.DEGRADE_INTERVAL or self.__work > budget * self.DEGRADE_WORK:
+            self.__over_frames += 1
+            self.__under_frames = 0
+        elif self.__interval < budget * self.RESTORE_INTERVAL and self.__work < budget * self.RESTORE_WORK:
+            self.__under_frames += 1
+            self.__over_frames = 0
+        else:
+            self.__over_frames = 0
+            self.__under_frames = 0
+
+        if self.__over_frames >= self.DEGRADE_FRAMES:
+            self._degrade()
+        elif self.__under_frames >= self.__restore_frames:
+            self._restore()
+
+    def _degrade(self):
+        """Turun satu tingkat kualitas (jika belum paling rendah)"""
+        if self.__level == len(self.LEVELS) - 1:
+            self.__over_frames = 0
+            return
+
+        # Baru saja naik lalu terlalu berat lagi: tunggu lebih lama sebelum naik berikutnya
+        if self.__last_change_was_restore and self.__frames_since_change < self.__restore_frames:
+            self.__restore_frames = min(self.__restore_frames * 2, self.MAX_RESTORE_FRAMES)
+        self._set_level(self.__level + 1, restored=False)
+
+    def _restore(self):
+        """Naik satu tingkat kualitas (jika belum paling tinggi)"""
+        if self.__level == 0:
+            self.__under_frames = 0
+            return
+        self._set_level(self.__level - 1, restored=True)
+
+    def _set_level(self, level, restored):
+        """Ganti tingkat kualitas lalu panggil on_change"""
+        self.__level = level
+        self.__last_change_was_restore = restored
+        self._clear_measurements()
+        if self.__on_change is not None:
+            self.__on_change(self)
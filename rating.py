@@ -0,0 +1,146 @@
+"""
+Rating bot dari hasil pertandingan: Elo dan Glicko-1
+Hasil satu pertandingan adalah tuple (player_a, player_b, score_a) dengan
+score_a 1.0 (a menang), 0.5 (seri) atau 0.0 (a kalah)
+"""
+
+import math
+import random
+
+INITIAL_RATING = 1500.0
+ELO_K = 16.0
+
+GLICKO_INITIAL_RD = 350.0
+GLICKO_MIN_RD = 30.0
+_GLICKO_Q = math.log(10) / 400
+
+# Z untuk selang kepercayaan 95%
+CONFIDENCE_Z = 1.96
+
+
+def expected_score(rating_a, rating_b):
+    """
+    Peluang menang a terhadap b menurut Elo
+
+    Args:
+        rating_a (float): Rating a
+        rating_b (float): Rating b
+
+    Returns:
+        float: Expected score a (0.0 - 1.0)
+    """
+    return 1.0 / (1.0 + 10 ** ((rating_b - rating_a) / 400))
+
+
+def elo_ratings(results, players, k=ELO_K, initial=INITIAL_RATING):
+    """
+    Hitung rating Elo dengan memproses hasil secara berurutan
+
+    Args:
+        results (list): Daftar (player_a, player_b, score_a)
+        players (list): Semua nama player
+        k (float): Faktor K
+        initial (float): Rating awal
+
+    Returns:
+        dict: Nama player -> rating
+    """
+    ratings = dict.fromkeys(players, initial)
+    for player_a, player_b, score_a in results:
+        expected = expected_score(ratings[player_a], ratings[player_b])
+        change = k * (score_a - expected)
+        ratings[player_a] += change
+        ratings[player_b] -= change
+    return ratings
+
+
+def bootstrap_elo(results, players, samples=200, seed=0, k=ELO_K, initial=INITIAL_RATING):
+    """
+    Rating Elo dengan selang kepercayaan 95% dari bootstrap
+    Hasil pertandingan di-resample (dengan pengembalian) lalu Elo dihitung
+    ulang; selang diambil dari persentil 2.5% dan 97.5%
+
+    Args:
+        results (list): Daftar (player_a, player_b, score_a)
+        players (list): Semua nama player
+        samples (int): Jumlah resample
+        seed (int): Seed resample (hasil selalu sama untuk data yang sama)
+
+    Returns:
+        dict: Nama player -> (rating, batas bawah, batas atas)
+    """
+    ratings = elo_ratings(results, players, k, initial)
+    if not results:
+        return {player: (rating, rating, rating) for player, rating in ratings.items()}
+
+    rng = random.Random(seed)
+    count = len(results)
+    sampled = {player: [] for player in players}
+    for _ in range(samples):
+        resample = [results[rng.randrange(count)] for _ in range(count)]
+        for player, rating in elo_ratings(resample, players, k, initial).items():
+            sampled[player].append(rating)
+
+    intervals = {}
+    for player in players:
+        values = sorted(sampled[player])
+        low = values[int(0.025 * (samples - 1))]
+        high = values[int(math.ceil(0.975 * (samples - 1)))]
+        intervals[player] = (ratings[player], low, high)
+    return intervals
+
+
+def _glicko_g(rd):
+    """Faktor pengurang pengaruh lawan dengan RD besar"""
+    return 1.0 / math.sqrt(1.0 + 3.0 * (_GLICKO_Q * rd) ** 2 / math.pi ** 2)
+
+
+def glicko_ratings(periods, players, initial=INITIAL_RATING, initial_rd=GLICKO_INITIAL_RD):
+    """
+    Hitung rating Glicko-1 per rating period
+
+    Args:
+        periods (list): Daftar rating period, masing-masing daftar
+            (player_a, player_b, score_a)
+        players (list): Semua nama player
+
+    Returns:
+        dict: Nama player -> (rating, batas bawah, batas atas) dengan
+            selang 95% dari rating deviation (RD)
+    """
+    ratings = {player: [initial, initial_rd] for player in players}
+
+    for results in periods:
+        # Setiap player melihat lawannya dengan rating di awal period
+        games = {player: [] for player in players}
+        for player_a, player_b, score_a in results:
+            games[player_a].append((player_b, score_a))
+            games[player_b].append((player_a, 1.0 - score_a))
+
+        updated = {}
+        for player, played in games.items():
+            rating, rd = ratings[player]
+            if not played:
+                updated[player] = [rating, rd]
+                continue
+
+            variance_sum = 0.0
+            delta_sum = 0.0
+            for opponent, score in played:
+                opponent_rating, opponent_rd = ratings[opponent]
+                g = _glicko_g(opponent_rd)
+                expected = 1.0 / (1.0 + 10 ** (-g * (rating - opponent_rating) / 400))
+                variance_sum += g * g * expected * (1.0 - expected)
+                delta_sum += g * (score - expected)
+
+            d_squared = 1.0 / (_GLICKO_Q ** 2 * variance_sum)
+            denominator = 1.0 / rd ** 2 + 1.0 / d_squared
+            new_rating = rating + _GLICKO_Q / denominator * delta_sum
+            new_rd = max(GLICKO_MIN_RD, math.sqrt(1.0 / denominator))
+            updated[player] = [new_rating, new_rd]
+        ratings = updated
+
+    return {
+        player: (rating, rating - CONFIDENCE_Z * rd, rating + CONFIDENCE_Z * rd)
+        for player, (rating, rd) in ratings.items()
+    }
@@ -0,0 +1,394 @@
+"""
+Renderer - Interface tampilan untuk PongGame beserta backend tanpa Tkinter
+- Renderer: base class (bentuk, label UI, layer menu/pause/game over, score)
+- NullRenderer: tidak menggambar apa pun (server dan CI)
+- RecordingRenderer: mencatat semua pemanggilan untuk testing
+- CanvasRenderer: rendering retained-mode di atas Tkinter Canvas, item
+  canvas dibuat sekali lalu dipindahkan dengan coords/itemconfig
+Backend Tkinter untuk game (TkRenderer) ada di tk_renderer.py
+"""
+
+from game_object import GameObject
+
+
+class Renderer:
+    """
+    Base class renderer yang dipakai PongGame (POLYMORPHISM)
+    - Objek game digambar lewat draw(obj), yang memanggil obj.draw(renderer);
+      renderer menyediakan create_oval/create_rectangle/create_polygon/
+      create_text/create_image seperti Tkinter Canvas
+    - Teks UI adalah label bernama yang dikelompokkan per layer; satu layer
+      ditampilkan atau disembunyikan sekaligus
+    - Tingkat detail (GameObject.DETAIL_*) diteruskan ke setiap draw objek
+    Semua method di sini tidak melakukan apa pun dan di-OVERRIDE oleh backend
+    """
+
+    # Layer UI yang dipakai PongGame
+    LAYER_MENU = "menu"
+    LAYER_ARENA = "game_ui"      # Garis tengah / arena
+    LAYER_SCORE = "score"
+    LAYER_PAUSE = "pause"
+    LAYER_GAME_OVER = "game_over"
+    LAYER_PROFILER = "profiler"
+
+    def __init__(self):
+        """Constructor untuk Renderer"""
+        self.__detail = GameObject.DETAIL_FULL
+
+    def get_detail(self):
+        """Mengambil tingkat detail gambar objek game"""
+        return self.__detail
+
+    def set_detail(self, detail):
+        """
+        Atur tingkat detail gambar objek game
+
+        Args:
+            detail (int): GameObject.DETAIL_FULL, DETAIL_NO_HIGHLIGHT atau DETAIL_SIMPLE
+        """
+        self.__detail = detail
+
+    def begin_frame(self):
+        """Mulai frame baru objek game"""
+        pass
+
+    def end_frame(self):
+        """Selesaikan frame dan tampilkan hasilnya"""
+        pass
+
+    def hide_all(self):
+        """Sembunyikan seluruh objek game (misalnya saat kembali ke menu)"""
+        pass
+
+    def draw(self, drawable):
+        """
+        Gambar objek yang memiliki method draw(canvas, detail)
+
+        Args:
+            drawable: GameObject atau ParticleSystem
+        """
+        drawable.draw(self, self.__detail)
+
+    def create_oval(self, *coords, **options):
+        """Gambar oval"""
+        pass
+
+    def create_rectangle(self, *coords, **options):
+        """Gambar rectangle"""
+        pass
+
+    def create_polygon(self, *coords, **options):
+        """Gambar polygon"""
+        pass
+
+    def create_text(self, *coords, **options):
+        """Gambar text"""
+        pass
+
+    def create_image(self, *coords, **options):
+        """Gambar image"""
+        pass
+
+    def create_label(self, name, layer, x, y, **options):
+        """
+        Buat label teks UI
+
+        Args:
+            name (str): Nama unik label
+            layer (str): Layer pemilik label (LAYER_*)
+            x (float): Posisi x
+            y (float): Posisi y
+            **options: Style teks ala Tkinter (text, font, fill, justify, anchor)
+        """
+        pass
+
+    def update_label(self, name, **options):
+        """
+        Ubah teks atau style label
+
+        Args:
+            name (str): Nama label
+            **options: Option yang diubah (misalnya text, fill)
+        """
+        pass
+
+    def set_layer_visible(self, layer, visible):
+        """
+        Tampilkan atau sembunyikan satu layer UI
+
+        Args:
+            layer (str): Nama layer (LAYER_*)
+            visible (bool): True untuk menampilkan
+        """
+        pass
+
+    def close(self):
+        """Lepaskan resource renderer"""
+        pass
+
+
+class NullRenderer(Renderer):
+    """
+    Renderer tanpa output: objek game tidak digambar sama sekali, sehingga
+    game lengkap (termasuk state machine UI) berjalan tanpa biaya rendering
+    """
+
+    def draw(self, drawable):
+        """Override: tidak memanggil draw() milik objek"""
+        pass
+
+
+class RecordingRenderer(Renderer):
+    """
+    Renderer yang mencatat pemanggilan untuk testing
+    Bentuk yang digambar dicatat per frame sebagai (jenis, coords, options);
+    label dan visibilitas layer disimpan sebagai state yang bisa diperiksa
+    """
+
+    def __init__(self):
+        """Constructor untuk RecordingRenderer"""
+        super().__init__()
+        self.__frame_calls = []  # Bentuk pada frame yang sedang digambar
+        self.__last_frame = []   # Bentuk pada frame terakhir yang selesai
+        self.__frame_count = 0
+        self.__labels = {}       # nama -> dict (layer, x, y, options)
+        self.__layers = {}       # layer -> visible
+        self.__events = []       # Log perubahan UI (jenis, argumen...)
+
+    def get_frame_count(self):
+        """Mengambil jumlah frame yang sudah selesai digambar"""
+        return self.__frame_count
+
+    def get_frame_calls(self):
+        """
+        Mengambil bentuk yang digambar pada frame terakhir
+
+        Returns:
+            list: Daftar (jenis, coords, options)
+        """
+        return list(self.__last_frame)
+
+    def get_events(self):
+        """Mengambil log perubahan UI (label dan layer)"""
+        return list(self.__events)
+
+    def get_label(self, name):
+        """
+        Mengambil option label
+
+        Returns:
+            dict: Option label (text, fill, ...) atau None jika tidak ada
+        """
+        label = self.__labels.get(name)
+        return dict(label["options"]) if label is not None else None
+
+    def is_layer_visible(self, layer):
+        """Mengecek apakah layer sedang ditampilkan"""
+        return self.__layers.get(layer, False)
+
+    def is_label_visible(self, name):
+        """Mengecek apakah label terlihat (layer pemiliknya ditampilkan)"""
+        label = self.__labels.get(name)
+        return label is not None and self.is_layer_visible(label["layer"])
+
+    def clear_events(self):
+        """Kosongkan log perubahan UI"""
+        self.__events.clear()
+
+    def begin_frame(self):
+        """Mulai mencatat frame baru"""
+        self.__frame_calls = []
+
+    def end_frame(self):
+        """Simpan bentuk frame ini sebagai frame terakhir"""
+        self.__last_frame = self.__frame_calls
+        self.__frame_calls = []
+        self.__frame_count += 1
+
+    def hide_all(self):
+        """Objek game disembunyikan: frame terakhir menjadi kosong"""
+        self.__frame_calls = []
+        self.__last_frame = []
+        self.__events.append(("hide_all",))
+
+    def _record(self, kind, coords, options):
+        """Catat satu bentuk pada frame saat ini"""
+        if len(coords) == 1:
+            coords = tuple(coords[0])
+        self.__frame_calls.append((kind, coords, options))
+
+    def create_oval(self, *coords, **options):
+        """Catat oval"""
+        self._record("oval", coords, options)
+
+    def create_rectangle(self, *coords, **options):
+        """Catat rectangle"""
+        self._record("rectangle", coords, options)
+
+    def create_polygon(self, *coords, **options):
+        """Catat polygon"""
+        self._record("polygon", coords, options)
+
+    def create_text(self, *coords, **options):
+        """Catat text"""
+        self._record("text", coords, options)
+
+    def create_image(self, *coords, **options):
+        """Catat image"""
+        self._record("image", coords, options)
+
+    def create_label(self, name, layer, x, y, **options):
+        """Simpan label baru"""
+        self.__labels[name] = {"layer": layer, "x": x, "y": y, "options": dict(options)}
+        self.__layers.setdefault(layer, False)
+        self.__events.append(("create_label", name, layer))
+
+    def update_label(self, name, **options):
+        """Ubah option label yang tersimpan"""
+        self.__labels[name]["options"].update(options)
+        self.__events.append(("update_label", name, options))
+
+    def set_layer_visible(self, layer, visible):
+        """Simpan visibilitas layer"""
+        self.__layers[layer] = bool(visible)
+        self.__events.append(("set_layer_visible", layer, bool(visible)))
+
+
+class CanvasRenderer:
+    """
+    Pengganti canvas untuk method draw() milik objek game
+    Menyediakan create_oval/create_rectangle/create_polygon/create_text/create_image dengan
+    signature yang sama seperti Tkinter Canvas, tetapi setiap pemanggilan
+    memakai ulang item dari pool (dikelompokkan per jenis item dan tags).
+    Item yang tidak terpakai pada suatu frame disembunyikan, bukan dihapus.
+    """
+
+    def __init__(self, canvas):
+        """
+        Constructor untuk CanvasRenderer
+
+        Args:
+            canvas: Tkinter canvas object
+        """
+        self.__canvas = canvas
+        self.__pools = {}        # (jenis, tags) -> list item id
+        self.__used = {}         # (jenis, tags) -> jumlah item terpakai frame ini
+        self.__item_coords = {}  # item id -> coords terakhir
+        self.__item_options = {} # item id -> options terakhir
+        self.__hidden = set()    # item id yang sedang disembunyikan
+        self.__draw_order = []   # urutan tags pertama kali digambar
+        self.__order_dirty = False
+
+    def get_canvas(self):
+        """Mengambil Tkinter canvas yang dibungkus"""
+        return self.__canvas
+
+    def get_item_count(self):
+        """Mengambil jumlah item canvas yang dimiliki pool"""
+        return sum(len(pool) for pool in self.__pools.values())
+
+    def begin_frame(self):
+        """Mulai frame baru, semua item pool siap dipakai ulang"""
+        for key in self.__used:
+            self.__used[key] = 0
+
+    def end_frame(self):
+        """Sembunyikan item yang tidak dipakai pada frame ini"""
+        canvas = self.__canvas
+        for key, pool in self.__pools.items():
+            for item in pool[self.__used[key]:]:
+                if item not in self.__hidden:
+                    canvas.itemconfigure(item, state="hidden")
+                    self.__hidden.add(item)
+
+        # Jaga urutan tumpukan sesuai urutan gambar saat pool bertambah
+        if self.__order_dirty:
+            for tags in self.__draw_order:
+                canvas.tag_raise(tags)
+            self.__order_dirty = False
+
+    def hide_all(self):
+        """Sembunyikan seluruh item game (misalnya saat kembali ke menu)"""
+        self.begin_frame()
+        self.end_frame()
+
+    def create_oval(self, *coords, **options):
+        """Gambar oval menggunakan item dari pool"""
+        return self._draw("oval", coords, options)
+
+    def create_rectangle(self, *coords, **options):
+        """Gambar rectangle menggunakan item dari pool"""
+        return self._draw("rectangle", coords, options)
+
+    def create_polygon(self, *coords, **options):
+        """Gambar polygon menggunakan item dari pool"""
+        return self._draw("polygon", coords, options)
+
+    def create_text(self, *coords, **options):
+        """Gambar text menggunakan item dari pool"""
+        return self._draw("text", coords, options)
+
+    def create_image(self, *coords, **options):
+        """Gambar image (sprite) menggunakan item dari pool"""
+        return self._draw("image", coords, options)
+
+    def _draw(self, kind, coords, options):
+        """
+        Ambil item berikutnya dari pool lalu perbarui posisi dan style-nya
+
+        Args:
+            kind (str): Jenis item canvas (oval, rectangle, polygon, text, image)
+            coords (tuple): Koordinat item (boleh berupa satu list)
+            options (dict): Options Tkinter untuk item
+
+        Returns:
+            int: Id item canvas yang dipakai
+        """
+        if len(coords) == 1:
+            coords = tuple(coords[0])
+
+        tags = options.get("tags", "")
+        key = (kind, tags)
+        pool = self.__pools.get(key)
+        if pool is None:
+            pool = self.__pools[key] = []
+            self.__used[key] = 0
+            if tags not in self.__draw_order:
+                self.__draw_order.append(tags)
+
+        index = self.__used[key]
+        self.__used[key] = index + 1
+        canvas = self.__canvas
+
+        # Pool habis, buat item baru (hanya terjadi saat pool bertambah)
+        if index == len(pool):
+            item = getattr(canvas, "create_" + kind)(*coords, **options)
+            pool.append(item)
+            self.__item_coords[item] = coords
+            self.__item_options[item] = options
+            self.__order_dirty = True
+            return item
+
+        item = pool[index]
+        if self.__item_coords[item] != coords:
+            canvas.coords(item, *coords)
+            self.__item_coords[item] = coords
+
+        previous = self.__item_options[item]
+        if previous != options:
+            # Option yang dipakai pemakai item sebelumnya tetapi tidak ada
+            # sekarang (misalnya stipple highlight) dikembalikan ke default
+            missing = [name for name in previous if name not in options]
+            if missing:
+                reset = {name: canvas.itemconfigure(item, name)[3] for name in missing}
+                reset.update(options)
+                canvas.itemconfigure(item, **reset)
+            else:
+                canvas.itemconfigure(item, **options)
+            self.__item_options[item] = options
+
+        if item in self.__hidden:
+            canvas.itemconfigure(item, state="normal")
+            self.__hidden.discard(item)
+
+        return item
@@ -0,0 +1,230 @@
+"""
+Rekaman dan replay pertandingan
+Rekaman hanya berisi seed RNG dan bitmask input kedua paddle per frame,
+sehingga pertandingan bisa disimulasikan ulang secara headless dan identik
+"""
+
+import struct
+
+from simulation import PongSimulation
+
+# Bit input per frame (4 bit, dua frame per byte)
+P1_UP = 1
+P1_DOWN = 2
+P2_UP = 4
+P2_DOWN = 8
+
+
+def _direction_bits(direction, up_bit, down_bit):
+    """Ubah arah input (-1, 0, 1) menjadi bit"""
+    if direction < 0:
+        return up_bit
+    if direction > 0:
+        return down_bit
+    return 0
+
+
+def _bits_direction(mask, up_bit, down_bit):
+    """Ubah bit menjadi arah input (-1, 0, 1)"""
+    if mask & up_bit:
+        return PongSimulation.MOVE_UP
+    if mask & down_bit:
+        return PongSimulation.MOVE_DOWN
+    return PongSimulation.STOP
+
+
+# Tabel decode bitmask -> (input_player1, input_player2)
+_DECODE = tuple(
+    (_bits_direction(mask, P1_UP, P1_DOWN), _bits_direction(mask, P2_UP, P2_DOWN))
+    for mask in range(16)
+)
+
+
+class MatchRecording:
+    """
+    Data rekaman satu pertandingan: seed, input per frame dan hasil akhir
+    Format biner: header tetap lalu input 4 bit per frame
+    """
+
+    MAGIC = b"PONG"
+    VERSION = 1
+    # magic, versi, seed, jumlah frame, score player 1, score player 2
+    HEADER = struct.Struct("<4sBQIbb")
+
+    def __init__(self, seed, frames=None, frame_count=0, final_scores=None):
+        """
+        Constructor untuk MatchRecording
+
+        Args:
+            seed (int): Seed pertandingan (0 .. 2**64 - 1)
+            frames (bytearray): Input terkompresi, dua frame per byte
+            frame_count (int): Jumlah frame yang terekam
+            final_scores (tuple): Score akhir (player1, player2) atau None
+        """
+        self.seed = seed
+        self.frames = frames if frames is not None else bytearray()
+        self.frame_count = frame_count
+        self.final_scores = final_scores
+
+    def append(self, mask):
+        """
+        Tambahkan satu frame input
+
+        Args:
+            mask (int): Bitmask input (kombinasi P1_UP, P1_DOWN, P2_UP, P2_DOWN)
+        """
+        if self.frame_count % 2 == 0:
+            self.frames.append(mask)
+        else:
+            self.frames[-1] |= mask << 4
+        self.frame_count += 1
+
+    def iter_inputs(self):
+        """
+        Iterasi input per frame
+
+        Yields:
+            tuple: (input_player1, input_player2)
+        """
+        decode = _DECODE
+        remaining = self.frame_count
+        for byte in self.frames:
+            yield decode[byte & 0x0F]
+            if remaining == 1:
+                return
+            yield decode[byte >> 4]
+            remaining -= 2
+
+    def to_bytes(self):
+        """
+        Serialisasi rekaman ke bytes
+
+        Returns:
+            bytes: Header diikuti data input
+        """
+        score1, score2 = self.final_scores if self.final_scores else (-1, -1)
+        header = self.HEADER.pack(
+            self.MAGIC, self.VERSION, self.seed, self.frame_count, score1, score2
+        )
+        return header + bytes(self.frames)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Baca rekaman dari bytes
+
+        Args:
+            data (bytes): Hasil to_bytes()
+
+        Returns:
+            MatchRecording: Rekaman yang dibaca
+
+        Raises:
+            ValueError: Jika data bukan rekaman yang valid
+        """
+        if len(data) < cls.HEADER.size:
+            raise ValueError("Data rekaman terlalu pendek")
+
+        magic, version, seed, frame_count, score1, score2 = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Format rekaman tidak dikenal")
+
+        frames = bytearray(data[cls.HEADER.size:])
+        if len(frames) != (frame_count + 1) // 2:
+            raise ValueError("Jumlah frame tidak sesuai dengan data")
+
+        final_scores = (score1, score2) if score1 >= 0 else None
+        return cls(seed, frames, frame_count, final_scores)
+
+    def save(self, path):
+        """Simpan rekaman ke file"""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Baca rekaman dari file"""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class MatchRecorder:
+    """
+    Perekam input pertandingan
+    Panggil start(seed) saat pertandingan dimulai (bersamaan dengan
+    PongSimulation.reset(seed)), record(inputs) setiap step, dan finish()
+    saat pertandingan selesai
+    """
+
+    def __init__(self):
+        """Constructor untuk MatchRecorder"""
+        self.__recording = None
+
+    def get_recording(self):
+        """Mengambil rekaman terakhir (atau None)"""
+        return self.__recording
+
+    def start(self, seed):
+        """
+        Mulai rekaman baru
+
+        Args:
+            seed (int): Seed yang dipakai untuk PongSimulation.reset(seed)
+        """
+        self.__recording = MatchRecording(seed)
+
+    def record(self, inputs):
+        """
+        Rekam input satu step
+
+        Args:
+            inputs (tuple): (input_player1, input_player2) yang dikirim ke step()
+        """
+        mask = _direction_bits(inputs[0], P1_UP, P1_DOWN) | _direction_bits(inputs[1], P2_UP, P2_DOWN)
+        self.__recording.append(mask)
+
+    def finish(self, final_scores):
+        """
+        Tandai rekaman selesai dengan score akhir
+
+        Args:
+            final_scores (tuple): Score akhir (player1, player2)
+
+        Returns:
+            MatchRecording: Rekaman yang sudah lengkap
+        """
+        self.__recording.final_scores = tuple(final_scores)
+        return self.__recording
+
+
+def replay_match(recording, particles=False):
+    """
+    Simulasikan ulang pertandingan dari rekaman secara headless
+
+    Args:
+        recording (MatchRecording): Rekaman pertandingan
+        particles (bool): True jika efek particle ikut disimulasikan
+
+    Returns:
+        PongSimulation: Simulasi dalam state setelah frame terakhir
+    """
+    simulation = PongSimulation(particles=particles)
+    simulation.reset(recording.seed)
+    step = simulation.step
+    for inputs in recording.iter_inputs():
+        step(inputs)
+    return simulation
+
+
+def verify_recording(recording):
+    """
+    Cek apakah replay menghasilkan score akhir yang sama dengan rekaman
+
+    Args:
+        recording (MatchRecording): Rekaman dengan final_scores
+
+    Returns:
+        bool: True jika score akhir replay sama
+    """
+    simulation = replay_match(recording)
+    return simulation.get_scores() == tuple(recording.final_scores)
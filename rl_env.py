@@ -0,0 +1,390 @@
+"""
+PongEnv - Environment reinforcement learning dengan API ala Gym
+Agent mengendalikan satu paddle pada PongSimulation (fisika game yang sama
+persis, termasuk sudut pantulan paddle dan power-up). Observasi ditulis ke
+buffer NumPy yang dialokasikan sekali, sehingga step() tidak membuat array baru.
+"""
+
+from array import array
+
+import numpy as np
+
+from simulation import PongSimulation
+from powerup import PowerUp
+
+
+class PongEnv:
+    """
+    Environment satu agent melawan paddle lawan yang dikendalikan program
+    API mengikuti Gymnasium: reset() -> (obs, info) dan
+    step(action) -> (obs, reward, terminated, truncated, info)
+
+    Observasi selalu dari sudut pandang agent: untuk player 2 sumbu x
+    dicerminkan, sehingga agent yang sama bisa dilatih di kedua sisi.
+    Array observasi yang dikembalikan adalah buffer yang sama setiap step;
+    salin (np.copy) jika perlu menyimpannya.
+    """
+
+    # Aksi diskrit: 0 = naik, 1 = diam, 2 = turun
+    ACTIONS = (PongSimulation.MOVE_UP, PongSimulation.STOP, PongSimulation.MOVE_DOWN)
+    ACTION_COUNT = len(ACTIONS)
+
+    OBSERVATION_VECTOR = "vector"
+    OBSERVATION_PIXELS = "pixels"
+    OBSERVATION_BOTH = "both"
+
+    # Isi observasi vektor (semua dinormalisasi ke kira-kira -1..1)
+    VECTOR_FIELDS = (
+        "ball_x", "ball_y", "ball_vx", "ball_vy", "ball_active",
+        "paddle_y", "paddle_height", "opponent_y", "opponent_height",
+        "powerup_active", "powerup_x", "powerup_y", "powerup_type",
+        "boost_owner", "boost_timer", "score_diff"
+    )
+    VECTOR_SIZE = len(VECTOR_FIELDS)
+
+    # Bobot reward; field yang tidak diberikan memakai nilai default ini
+    DEFAULT_REWARDS = {
+        "score": 1.0,       # Agent mencetak poin
+        "concede": -1.0,    # Lawan mencetak poin
+        "hit": 0.0,         # Agent memantulkan bola
+        "powerup": 0.0,     # Agent mendapat power-up
+        "tracking": 0.0,    # Per step, dikali jarak paddle-bola (0..1) saat bola datang
+        "win": 0.0,         # Tambahan saat agent memenangkan pertandingan
+        "lose": 0.0,        # Tambahan saat agent kalah
+    }
+
+    # Nilai pixel pada observasi gambar
+    PIXEL_PADDLE = 255
+    PIXEL_BALL = 255
+    PIXEL_POWERUP = 128
+    # Nilai pixel per objek sesuai urutan gambar (paddle 1, paddle 2, power-up, bola)
+    PIXEL_VALUES = (PIXEL_PADDLE, PIXEL_PADDLE, PIXEL_POWERUP, PIXEL_BALL)
+
+    MAX_VELOCITY = 16.0  # Normalisasi velocity bola
+
+    def __init__(self, player=1, opponent=None, observation="vector", pixel_scale=10,
+                 rewards=None, max_frames=None, frame_skip=1, seed=None):
+        """
+        Constructor untuk PongEnv
+
+        Args:
+            player (int): Paddle yang dikendalikan agent (1 = kiri, 2 = kanan)
+            opponent: Pengendali paddle lawan: None (mengikuti bola),
+                objek dengan get_input(simulation) seperti AIController,
+                atau fungsi f(simulation) -> MOVE_UP/STOP/MOVE_DOWN
+            observation (str): "vector", "pixels" atau "both"
+            pixel_scale (int): Faktor downsample observasi gambar
+                (10 = 80x60 dari layar 800x600)
+            rewards (dict): Bobot reward yang menimpa DEFAULT_REWARDS
+            max_frames (int): Batas frame per episode (truncated), None = tanpa batas
+            frame_skip (int): Jumlah frame simulasi per step (aksi diulang)
+            seed (int): Seed pertandingan pertama
+        """
+        if observation not in (self.OBSERVATION_VECTOR, self.OBSERVATION_PIXELS, self.OBSERVATION_BOTH):
+            raise ValueError(f"Observasi tidak dikenal: {observation}")
+        unknown = set(rewards or ()) - set(self.DEFAULT_REWARDS)
+        if unknown:
+            raise ValueError(f"Reward tidak dikenal: {sorted(unknown)}")
+
+        self.simulation = PongSimulation(particles=False, seed=seed)
+        self.__player = player
+        self.__mirror = player == 2
+        if player == 1:
+            self.__paddle, self.__opponent_paddle = self.simulation.paddle1, self.simulation.paddle2
+        else:
+            self.__paddle, self.__opponent_paddle = self.simulation.paddle2, self.simulation.paddle1
+
+        if opponent is None:
+            self.__opponent = self._track_ball
+        elif hasattr(opponent, "get_input"):
+            self.__opponent = opponent.get_input
+        else:
+            self.__opponent = opponent
+        self.__opponent_controller = opponent
+
+        weights = dict(self.DEFAULT_REWARDS)
+        weights.update(rewards or {})
+        self.__rewards = weights
+        self.__tracking_weight = weights["tracking"] / PongSimulation.HEIGHT
+        self.__max_frames = max_frames
+        self.__frame_skip = frame_skip
+        self.__inputs = [PongSimulation.STOP, PongSimulation.STOP]
+
+        # Buffer observasi: array('f') ditulis per elemen (cepat dari Python)
+        # dan dibaca agent lewat view NumPy pada memori yang sama
+        self.__vector_buffer = array("f", bytes(4 * self.VECTOR_SIZE))
+        self.__vector = np.frombuffer(self.__vector_buffer, dtype=np.float32)
+        self.__scale_y = 1.0 / PongSimulation.HEIGHT
+        if self.__mirror:
+            self.__scale_x, self.__offset_x = -1.0 / PongSimulation.WIDTH, 1.0
+            self.__scale_velocity_x = -1.0 / self.MAX_VELOCITY
+        else:
+            self.__scale_x, self.__offset_x = 1.0 / PongSimulation.WIDTH, 0.0
+            self.__scale_velocity_x = 1.0 / self.MAX_VELOCITY
+        self.__pixel_scale = pixel_scale
+        self.__pixels = np.zeros(
+            (PongSimulation.HEIGHT // pixel_scale, PongSimulation.WIDTH // pixel_scale),
+            dtype=np.uint8
+        )
+        self.__rows, self.__columns = self.__pixels.shape
+        # Sel yang sedang tergambar per objek (untuk menggambar ulang sebagian)
+        self.__rects = [None] * len(self.PIXEL_VALUES)
+        self.__drawn = [None] * len(self.PIXEL_VALUES)
+        self.__observation_mode = observation
+        if observation == self.OBSERVATION_VECTOR:
+            self.__observation = self.__vector
+        elif observation == self.OBSERVATION_PIXELS:
+            self.__observation = self.__pixels
+        else:
+            self.__observation = (self.__vector, self.__pixels)
+
+        # Info dictionary dipakai ulang setiap step
+        self.__info = {"frame": 0, "scores": (0, 0), "events": ()}
+        self.__scores = (0, 0)
+
+    # GETTER methods
+    def get_player(self):
+        """Mengambil nomor player yang dikendalikan agent"""
+        return self.__player
+
+    def get_rewards(self):
+        """Mengambil bobot reward yang dipakai"""
+        return dict(self.__rewards)
+
+    def get_observation_shape(self):
+        """
+        Mengambil bentuk observasi
+
+        Returns:
+            tuple: Shape array observasi (atau tuple shape untuk mode "both")
+        """
+        if self.__observation_mode == self.OBSERVATION_BOTH:
+            return (self.__vector.shape, self.__pixels.shape)
+        return self.__observation.shape
+
+    def reset(self, seed=None):
+        """
+        Mulai episode baru
+
+        Args:
+            seed (int): Seed pertandingan (None = lanjutkan RNG sebelumnya)
+
+        Returns:
+            tuple: (observasi, info)
+        """
+        self.simulation.reset(seed)
+        self.__inputs[0] = self.__inputs[1] = PongSimulation.STOP
+        if hasattr(self.__opponent_controller, "reset"):
+            self.__opponent_controller.reset()
+        self.__scores = (0, 0)
+
+        info = self.__info
+        info["frame"] = 0
+        info["scores"] = self.__scores
+        info["events"] = ()
+        self.__pixels.fill(0)
+        self.__drawn[:] = [None] * len(self.PIXEL_VALUES)
+        self._write_observation()
+        return self.__observation, info
+
+    def step(self, action):
+        """
+        Jalankan aksi agent selama frame_skip frame
+
+        Args:
+            action (int): Indeks aksi (0 = naik, 1 = diam, 2 = turun)
+
+        Returns:
+            tuple: (observasi, reward, terminated, truncated, info)
+        """
+        simulation = self.simulation
+        agent_index = self.__player - 1
+        opponent_index = 1 - agent_index
+        direction = self.ACTIONS[action]
+        inputs = self.__inputs
+        tracking_weight = self.__tracking_weight
+        reward = 0.0
+        events = ()
+
+        for _ in range(self.__frame_skip):
+            inputs[agent_index] = direction
+            inputs[opponent_index] = self.__opponent(simulation)
+            events = simulation.step(inputs)
+
+            if events:
+                reward += self._event_reward(events)
+            if tracking_weight and self._ball_approaching():
+                paddle = self.__paddle
+                reward += tracking_weight * abs(paddle.get_y() + paddle.get_height() / 2 - simulation.ball.get_y())
+            if simulation.get_winner() is not None:
+                break
+
+        terminated = simulation.get_winner() is not None
+        if terminated:
+            rewards = self.__rewards
+            reward += rewards["win"] if simulation.get_winner() == self.__player else rewards["lose"]
+        frame = simulation.get_frame()
+        truncated = not terminated and self.__max_frames is not None and frame >= self.__max_frames
+
+        info = self.__info
+        info["frame"] = frame
+        info["scores"] = self.__scores
+        info["events"] = events
+        self._write_observation()
+        return self.__observation, reward, terminated, truncated, info
+
+    def _event_reward(self, events):
+        """Hitung reward dari event simulasi satu frame"""
+        simulation = self.simulation
+        rewards = self.__rewards
+        reward = 0.0
+
+        if PongSimulation.EVENT_SCORE in events:
+            scores = simulation.get_scores()
+            agent_index = self.__player - 1
+            if scores[agent_index] > self.__scores[agent_index]:
+                reward += rewards["score"]
+            else:
+                reward += rewards["concede"]
+            self.__scores = scores
+
+        if PongSimulation.EVENT_PADDLE_HIT in events and not self._ball_approaching():
+            reward += rewards["hit"]
+        if PongSimulation.EVENT_POWERUP_COLLECT in events and simulation.get_powerup_active_player() == self.__player:
+            reward += rewards["powerup"]
+        return reward
+
+    def _ball_approaching(self):
+        """Mengecek apakah bola bergerak ke arah paddle agent"""
+        velocity_x = self.simulation.ball.get_velocity_x()
+        return velocity_x > 0 if self.__mirror else velocity_x < 0
+
+    def _track_ball(self, simulation):
+        """Lawan default: gerakkan tengah paddle mengikuti posisi y bola"""
+        paddle = self.__opponent_paddle
+        distance = simulation.ball.get_y() - (paddle.get_y() + paddle.get_height() / 2)
+        if distance > paddle.get_speed():
+            return PongSimulation.MOVE_DOWN
+        if distance < -paddle.get_speed():
+            return PongSimulation.MOVE_UP
+        return PongSimulation.STOP
+
+    def _write_observation(self):
+        """Tulis observasi ke buffer yang sudah dialokasikan"""
+        mode = self.__observation_mode
+        if mode != self.OBSERVATION_PIXELS:
+            self._write_vector()
+        if mode != self.OBSERVATION_VECTOR:
+            self._write_pixels()
+
+    def _write_vector(self):
+        """Isi observasi vektor (urutan sesuai VECTOR_FIELDS)"""
+        simulation = self.simulation
+        ball = simulation.ball
+        paddle = self.__paddle
+        opponent = self.__opponent_paddle
+        buffer = self.__vector_buffer
+        # Skala 1/ukuran layar; x dan vx dibalik untuk player 2
+        scale_x = self.__scale_x
+        scale_y = self.__scale_y
+        offset_x = self.__offset_x
+        scale_velocity = 1.0 / self.MAX_VELOCITY
+
+        buffer[0] = offset_x + ball.get_x() * scale_x
+        buffer[1] = ball.get_y() * scale_y
+        buffer[2] = ball.get_velocity_x() * self.__scale_velocity_x
+        buffer[3] = ball.get_velocity_y() * scale_velocity
+        buffer[4] = 1.0 if ball.is_active() else 0.0
+        buffer[5] = paddle.get_y() * scale_y
+        buffer[6] = paddle.get_height() * scale_y
+        buffer[7] = opponent.get_y() * scale_y
+        buffer[8] = opponent.get_height() * scale_y
+
+        powerup = simulation.get_current_powerup()
+        if powerup is not None and powerup.is_active():
+            buffer[9] = 1.0
+            buffer[10] = offset_x + powerup.get_x() * scale_x
+            buffer[11] = powerup.get_y() * scale_y
+            buffer[12] = 1.0 if powerup.get_type() == PowerUp.SPEED_BOOST else -1.0
+        elif buffer[9]:
+            buffer[9] = buffer[10] = buffer[11] = buffer[12] = 0.0
+
+        timer = simulation.get_powerup_timer()
+        if timer > 0:
+            buffer[13] = 1.0 if simulation.get_powerup_active_player() == self.__player else -1.0
+            buffer[14] = timer / PongSimulation.POWERUP_DURATION
+        elif buffer[14]:
+            buffer[13] = buffer[14] = 0.0
+
+        score1, score2 = self.__scores
+        difference = score1 - score2 if self.__player == 1 else score2 - score1
+        buffer[15] = difference / PongSimulation.WINNING_SCORE
+
+    def _write_pixels(self):
+        """
+        Gambar paddle, power-up dan bola ke buffer gambar yang di-downsample
+        Hanya digambar ulang jika ada objek yang berpindah sel pixel
+        """
+        simulation = self.simulation
+        rects = self.__rects
+        pixel_rect = self._pixel_rect
+        rects[0] = pixel_rect(simulation.paddle1.get_bounds())
+        rects[1] = pixel_rect(simulation.paddle2.get_bounds())
+
+        powerup = simulation.get_current_powerup()
+        rects[2] = pixel_rect(powerup.get_bounds()) if powerup is not None and powerup.is_active() else None
+
+        ball = simulation.ball
+        if ball.is_active():
+            # Bola digambar dengan x, y sebagai pusat (sama seperti renderer)
+            radius = ball.get_radius()
+            x, y = ball.get_x(), ball.get_y()
+            rects[3] = pixel_rect((x - radius, y - radius, x + radius, y + radius))
+        else:
+            rects[3] = None
+
+        drawn = self.__drawn
+        if rects == drawn:
+            return
+
+        pixels = self.__pixels
+        for old, new in zip(drawn, rects):
+            if old is not None and old != new:
+                pixels[old[0]:old[1], old[2]:old[3]] = 0
+        # Gambar ulang semua objek (urutan tetap: bola paling atas)
+        for rect, value in zip(rects, self.PIXEL_VALUES):
+            if rect is not None:
+                pixels[rect[0]:rect[1], rect[2]:rect[3]] = value
+        drawn[:] = rects
+
+    def _pixel_rect(self, bounds):
+        """
+        Ubah persegi koordinat layar menjadi rentang sel buffer gambar
+
+        Args:
+            bounds (tuple): (left, top, right, bottom) dalam pixel layar
+
+        Returns:
+            tuple: (baris awal, baris akhir, kolom awal, kolom akhir) atau
+                None jika persegi di luar layar
+        """
+        scale = self.__pixel_scale
+        left, top, right, bottom = bounds
+        if self.__mirror:
+            left, right = PongSimulation.WIDTH - right, PongSimulation.WIDTH - left
+
+        column_start = int(left // scale)
+        column_end = int(-(-right // scale))
+        row_start = int(top // scale)
+        row_end = int(-(-bottom // scale))
+        if column_start < 0:
+            column_start = 0
+        if row_start < 0:
+            row_start = 0
+        if column_end > self.__columns:
+            column_end = self.__columns
+        if row_end > self.__rows:
+            row_end = self.__rows
+        if column_start >= column_end or row_start >= row_end:
+            return None
+        return (row_start, row_end, column_start, column_end)
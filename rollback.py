@@ -0,0 +1,462 @@
+"""
+Rollback netcode (gaya GGPO) untuk main online tanpa menunggu server
+Setiap peer menjalankan PongSimulation sendiri: input lawan yang belum datang
+ditebak (diulang dari input terakhir yang diketahui), dan saat input asli
+datang berbeda, simulasi dikembalikan ke snapshot frame tersebut lalu
+disimulasikan ulang sampai frame sekarang
+
+Jalankan dua peer dengan seed yang sama:
+    python rollback.py --player 1 --port 9001 --remote-port 9002 --seed 42
+    python rollback.py --player 2 --port 9002 --remote-port 9001 --seed 42
+"""
+
+import argparse
+import asyncio
+import struct
+import zlib
+
+from simulation import PongSimulation
+from snapshot import take_snapshot, restore_snapshot, SNAPSHOT_SIZE
+from net_protocol import SimulatedNetwork
+
+
+class RollbackSession:
+    """
+    Sinkronisasi dua simulasi deterministik dengan prediksi dan rollback
+    Snapshot setiap frame disimpan di ring buffer berukuran tetap
+    (max_rollback + 2), sehingga rollback tidak mengalokasikan memori.
+    Simulasi tidak boleh lebih dari max_rollback frame di depan input lawan
+    yang sudah pasti; jika sudah, advance() menunggu (stall).
+    """
+
+    def __init__(self, simulation, local_player, max_rollback=8, input_delay=0):
+        """
+        Constructor untuk RollbackSession
+
+        Args:
+            simulation (PongSimulation): Simulasi lokal yang sudah di-reset
+                dengan seed yang sama di kedua peer (sebaiknya particles=False,
+                karena particle tidak ikut snapshot)
+            local_player (int): 1 atau 2
+            max_rollback (int): Jumlah frame prediksi maksimal
+            input_delay (int): Frame penundaan input lokal (mengurangi rollback)
+        """
+        self.simulation = simulation
+        self.__local_player = local_player
+        self.__max_rollback = max_rollback
+        self.__input_delay = input_delay
+
+        size = max_rollback + 2
+        self.__snapshots = [bytearray(SNAPSHOT_SIZE) for _ in range(size)]
+        self.__ring_size = size
+
+        self.__frame = simulation.get_frame()
+        self.__confirmed_frame = self.__frame
+        self.__pending_rollback = None
+
+        self.__local_inputs = {}
+        self.__remote_inputs = {self.__frame: PongSimulation.STOP}
+        self.__predicted = {}
+        self.__last_local = PongSimulation.STOP
+
+        self.__rollback_count = 0
+        self.__resimulated_frames = 0
+
+    # GETTER methods
+    def get_frame(self):
+        """Mengambil frame simulasi saat ini"""
+        return self.__frame
+
+    def get_confirmed_frame(self):
+        """Mengambil frame terakhir yang input lawannya sudah pasti"""
+        return self.__confirmed_frame
+
+    def get_local_player(self):
+        """Mengambil nomor player lokal"""
+        return self.__local_player
+
+    def get_rollback_count(self):
+        """Mengambil jumlah rollback yang sudah terjadi"""
+        return self.__rollback_count
+
+    def get_resimulated_frames(self):
+        """Mengambil total frame yang disimulasikan ulang"""
+        return self.__resimulated_frames
+
+    def get_local_input(self, frame):
+        """
+        Mengambil input lokal untuk frame tertentu (untuk dikirim ke lawan)
+
+        Returns:
+            int: Arah input, atau None jika frame belum diisi
+        """
+        return self.__local_inputs.get(frame)
+
+    def get_latest_local_frame(self):
+        """Mengambil frame terakhir yang input lokalnya sudah ditentukan"""
+        return self.__frame + self.__input_delay
+
+    def get_checksum(self):
+        """
+        Checksum state simulasi saat ini (untuk mendeteksi desync)
+
+        Returns:
+            int: CRC32 dari export_state()
+        """
+        return zlib.crc32(self.simulation.export_state().tobytes())
+
+    def can_advance(self):
+        """Mengecek apakah prediksi masih dalam batas max_rollback"""
+        return self.__frame - self.__confirmed_frame < self.__max_rollback
+
+    def advance(self, local_direction):
+        """
+        Tambahkan input lokal lalu majukan simulasi satu frame
+
+        Args:
+            local_direction (int): MOVE_UP, STOP atau MOVE_DOWN
+
+        Returns:
+            list: Event frame baru, atau None jika harus menunggu input lawan
+        """
+        self.synchronize()
+        if not self.can_advance():
+            return None
+
+        frame = self.__frame + 1
+        self.__local_inputs[frame + self.__input_delay] = local_direction
+        events = self._simulate_frame(frame)
+        self._prune()
+        return events
+
+    def add_remote_input(self, frame, direction):
+        """
+        Terima input asli lawan untuk satu frame
+        Jika berbeda dari prediksi, rollback dijadwalkan ke frame tersebut
+
+        Args:
+            frame (int): Nomor frame input
+            direction (int): Arah input lawan
+        """
+        if frame <= self.__confirmed_frame or frame in self.__remote_inputs:
+            return
+
+        self.__remote_inputs[frame] = direction
+        while self.__confirmed_frame + 1 in self.__remote_inputs:
+            self.__confirmed_frame += 1
+
+        if frame <= self.__frame and self.__predicted.get(frame) != direction:
+            if self.__pending_rollback is None or frame < self.__pending_rollback:
+                self.__pending_rollback = frame
+
+    def synchronize(self):
+        """
+        Jalankan rollback yang tertunda: pulihkan snapshot sebelum frame
+        yang salah prediksi lalu simulasikan ulang sampai frame sekarang
+
+        Returns:
+            int: Jumlah frame yang disimulasikan ulang
+        """
+        start = self.__pending_rollback
+        if start is None:
+            return 0
+        self.__pending_rollback = None
+
+        target = self.__frame
+        restore_snapshot(self.simulation, self.__snapshots[(start - 1) % self.__ring_size])
+        self.__frame = start - 1
+        for frame in range(start, target + 1):
+            self._simulate_frame(frame)
+
+        count = target - start + 1
+        self.__rollback_count += 1
+        self.__resimulated_frames += count
+        return count
+
+    def _simulate_frame(self, frame):
+        """
+        Simpan snapshot lalu jalankan satu frame dengan input yang diketahui
+        atau hasil prediksi
+
+        Args:
+            frame (int): Frame yang dijalankan (selalu get_frame() + 1)
+
+        Returns:
+            list: Event dari PongSimulation.step()
+        """
+        take_snapshot(self.simulation, self.__snapshots[(frame - 1) % self.__ring_size])
+
+        local = self.__local_inputs.get(frame)
+        if local is None:
+            local = self.__last_local
+        else:
+            self.__last_local = local
+
+        remote = self.__remote_inputs.get(frame)
+        if remote is None:
+            # Prediksi: lawan mengulang input terakhir yang sudah pasti
+            remote = self.__remote_inputs[self.__confirmed_frame]
+            self.__predicted[frame] = remote
+        else:
+            self.__predicted.pop(frame, None)
+
+        if self.__local_player == 1:
+            inputs = (local, remote)
+        else:
+            inputs = (remote, local)
+
+        events = self.simulation.step(inputs)
+        self.__frame = frame
+        return events
+
+    def _prune(self):
+        """Buang input dan prediksi yang sudah tidak mungkin di-rollback"""
+        oldest = self.__confirmed_frame - 1
+        for inputs in (self.__remote_inputs, self.__predicted):
+            for frame in [frame for frame in inputs if frame < oldest]:
+                del inputs[frame]
+
+        # Input lokal disimpan lebih lama karena dikirim ulang ke lawan
+        oldest_local = self.__frame - 4 * self.__max_rollback
+        for frame in [frame for frame in self.__local_inputs if frame < oldest_local]:
+            del self.__local_inputs[frame]
+
+
+# Paket input peer: tipe, frame pertama, frame terakhir yang sudah pasti
+# dari input lawan (ack), jumlah input; diikuti satu byte per input
+PACKET_INPUTS = 10
+INPUTS_HEADER = struct.Struct("<BIIB")
+MAX_INPUTS_PER_PACKET = 32
+
+
+class RollbackPeer(asyncio.DatagramProtocol):
+    """
+    Transport UDP untuk RollbackSession
+    Setiap paket berisi semua input lokal yang belum di-ack lawan
+    (maksimal 32), sehingga paket yang hilang tertutup paket berikutnya.
+    Setelah game over, input tetap dikirim dan rollback tetap dijalankan
+    sampai game over itu sudah pasti (semua input lawan sampai frame
+    tersebut diterima), sehingga kedua peer berakhir di state yang sama.
+    """
+
+    # Tick maksimal menunggu ack lawan setelah game over yang sudah pasti
+    FINISH_LINGER_FRAMES = 60
+
+    def __init__(self, session):
+        """
+        Constructor untuk RollbackPeer
+
+        Args:
+            session (RollbackSession): Session yang menerima input lawan
+        """
+        self.session = session
+        self.__transport = None
+        self.__remote_address = None
+        self.__remote_ack = session.get_frame()
+        self.__finished_ticks = 0  # Tick sejak game over yang sudah pasti
+
+    async def open(self, local_address, remote_address, latency=0.0, jitter=0.0, loss=0.0, seed=None):
+        """
+        Buka socket UDP
+
+        Args:
+            local_address (tuple): (host, port) lokal
+            remote_address (tuple): (host, port) lawan
+            latency (float): Latency simulasi paket keluar (detik)
+            jitter (float): Jitter simulasi paket keluar (detik)
+            loss (float): Packet loss simulasi paket keluar (0.0 - 1.0)
+            seed (int): Seed jaringan simulasi
+        """
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(lambda: self, local_addr=local_address)
+        if latency > 0 or jitter > 0 or loss > 0:
+            transport = SimulatedNetwork(transport, loop, latency, jitter, loss, seed)
+        self.connect(transport, remote_address)
+
+    def connect(self, transport, remote_address):
+        """
+        Pakai transport yang sudah ada (misalnya transport simulasi untuk testing)
+
+        Args:
+            transport: Objek dengan sendto(data, addr) dan close()
+            remote_address (tuple): (host, port) lawan
+        """
+        self.__transport = transport
+        self.__remote_address = remote_address
+
+    def close(self):
+        """Tutup socket"""
+        if self.__transport is not None:
+            self.__transport.close()
+            self.__transport = None
+
+    def send_inputs(self):
+        """Kirim input lokal yang belum di-ack lawan"""
+        if self.__transport is None:
+            return
+
+        session = self.session
+        last = session.get_latest_local_frame()
+        first = max(self.__remote_ack + 1, last - MAX_INPUTS_PER_PACKET + 1)
+        directions = []
+        for frame in range(first, last + 1):
+            direction = session.get_local_input(frame)
+            directions.append(PongSimulation.STOP if direction is None else direction)
+
+        header = INPUTS_HEADER.pack(PACKET_INPUTS, first, session.get_confirmed_frame(), len(directions))
+        self.__transport.sendto(header + struct.pack(f"<{len(directions)}b", *directions), self.__remote_address)
+
+    def datagram_received(self, data, addr):
+        """Terima input lawan"""
+        if len(data) < INPUTS_HEADER.size or data[0] != PACKET_INPUTS:
+            return
+
+        _, first, ack, count = INPUTS_HEADER.unpack_from(data)
+        directions = struct.unpack_from(f"<{count}b", data, INPUTS_HEADER.size)
+        if ack > self.__remote_ack:
+            self.__remote_ack = ack
+
+        add_remote_input = self.session.add_remote_input
+        for index, direction in enumerate(directions):
+            add_remote_input(first + index, direction)
+
+    def tick(self, local_direction):
+        """
+        Satu tick: jalankan rollback yang tertunda, majukan session selama
+        pertandingan belum selesai, lalu kirim input
+
+        Args:
+            local_direction (int): Input lokal untuk frame berikutnya
+
+        Returns:
+            list: Event frame baru (kosong saat menunggu input lawan atau
+                setelah game over)
+        """
+        session = self.session
+        # Rollback harus tetap jalan setelah game over: game over bisa saja
+        # hasil tebakan input lawan yang salah
+        session.synchronize()
+
+        events = None
+        if not session.simulation.is_game_over():
+            events = session.advance(local_direction)
+        self.send_inputs()
+
+        if self._is_game_over_confirmed():
+            self.__finished_ticks += 1
+        else:
+            self.__finished_ticks = 0
+        return events or []
+
+    def _is_game_over_confirmed(self):
+        """Game over dan semua input lawan sampai frame game over sudah diterima"""
+        simulation = self.session.simulation
+        return simulation.is_game_over() and self.session.get_confirmed_frame() >= simulation.get_frame()
+
+    def is_finished(self):
+        """
+        Mengecek apakah pertandingan selesai untuk peer ini: game over sudah
+        pasti dan lawan sudah meng-ack input lokal sampai frame game over
+        (atau sudah ditunggu FINISH_LINGER_FRAMES tick)
+        """
+        if not self._is_game_over_confirmed():
+            return False
+        return (self.__remote_ack >= self.session.simulation.get_frame()
+                or self.__finished_ticks >= self.FINISH_LINGER_FRAMES)
+
+    async def run(self, input_source, frames=None, on_frame=None, tick_rate=PongSimulation.FPS):
+        """
+        Loop 60 fps: ambil input lokal, majukan session, kirim input
+        Berhenti setelah is_finished() atau setelah frame tertentu
+
+        Args:
+            input_source: Fungsi input_source(frame) -> arah input lokal
+            frames (int): Berhenti setelah frame ini (None = sampai pertandingan selesai)
+            on_frame: Callback on_frame(events) setiap tick
+            tick_rate (float): Jumlah tick per detik
+        """
+        interval = 1.0 / tick_rate
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        session = self.session
+        while frames is None or session.get_frame() < frames:
+            events = self.tick(input_source(session.get_frame() + 1))
+            if on_frame is not None:
+                # Tetap dipanggil saat menunggu input lawan (events kosong)
+                on_frame(events)
+            if self.is_finished():
+                break
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+
+async def play(player, port, remote_host, remote_port, seed, **options):
+    """Buka jendela permainan rollback untuk satu player"""
+    import tkinter as tk
+    from renderer import CanvasRenderer
+
+    simulation = PongSimulation(particles=False, seed=seed)
+    session = RollbackSession(simulation, player)
+    peer = RollbackPeer(session)
+    await peer.open(("0.0.0.0", port), (remote_host, remote_port), **options)
+
+    root = tk.Tk()
+    root.title(f"PONG ROLLBACK - Player {player}")
+    canvas = tk.Canvas(root, width=simulation.WIDTH, height=simulation.HEIGHT, bg="#0a0e27", highlightthickness=0)
+    canvas.pack()
+    renderer = CanvasRenderer(canvas)
+    score_text = canvas.create_text(simulation.WIDTH / 2, 50, text="0   0", font=("Arial", 36, "bold"), fill="white")
+
+    direction = [PongSimulation.STOP]
+    for key, value in (("w", PongSimulation.MOVE_UP), ("s", PongSimulation.MOVE_DOWN),
+                       ("Up", PongSimulation.MOVE_UP), ("Down", PongSimulation.MOVE_DOWN)):
+        root.bind(f"<{key}>", lambda e, v=value: direction.__setitem__(0, v))
+        root.bind(f"<KeyRelease-{key}>", lambda e: direction.__setitem__(0, PongSimulation.STOP))
+
+    def render(events):
+        renderer.begin_frame()
+        for ball in simulation.get_balls():
+            ball.draw(renderer)
+        simulation.paddle1.draw(renderer)
+        simulation.paddle2.draw(renderer)
+        for powerup in simulation.get_powerups():
+            powerup.draw(renderer)
+        renderer.end_frame()
+        score1, score2 = simulation.get_scores()
+        canvas.itemconfig(score_text, text=f"{score1}   {score2}")
+        root.update()
+
+    try:
+        await peer.run(lambda frame: direction[0], on_frame=render)
+        # Tampilkan hasil akhir sampai jendela ditutup
+        while True:
+            root.update()
+            await asyncio.sleep(0.05)
+    except tk.TclError:
+        # Jendela ditutup
+        pass
+    finally:
+        peer.close()
+
+
+def main(argv=None):
+    """Entry point command line"""
+    parser = argparse.ArgumentParser(description="Pong online dengan rollback netcode")
+    parser.add_argument("--player", type=int, choices=(1, 2), required=True)
+    parser.add_argument("--port", type=int, required=True, help="port UDP lokal")
+    parser.add_argument("--remote-host", default="127.0.0.1")
+    parser.add_argument("--remote-port", type=int, required=True)
+    parser.add_argument("--seed", type=int, required=True, help="seed yang sama di kedua peer")
+    parser.add_argument("--latency", type=float, default=0.0, help="latency simulasi (detik)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="jitter simulasi (detik)")
+    parser.add_argument("--loss", type=float, default=0.0, help="packet loss simulasi (0-1)")
+    args = parser.parse_args(argv)
+
+    asyncio.run(play(
+        args.player, args.port, args.remote_host, args.remote_port, args.seed,
+        latency=args.latency, jitter=args.jitter, loss=args.loss
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,728 @@
+"""
+PongSimulation - Inti logika game Pong tanpa Tkinter (headless)
+Semua aturan permainan (gerak, collision, scoring, power-up) ada di sini
+sehingga bisa dijalankan dalam loop cepat tanpa rendering dan tanpa timer
+"""
+
+from ball import Ball
+from paddle import Paddle
+from powerup import PowerUp
+from particle import ParticleSystem
+from collision import swept_aabb
+from array import array
+import random
+
+class PongSimulation:
+    """
+    Simulasi game Pong yang tidak bergantung pada Tkinter
+    Menggunakan COMPOSITION: memiliki Ball, dua Paddle, PowerUp dan ParticleSystem
+    PongGame hanya menjadi tampilan (view) di atas class ini
+    """
+
+    # Konstanta game
+    WIDTH = 800
+    HEIGHT = 600
+    FPS = 60  # Jumlah step simulasi per detik game
+    WINNING_SCORE = 5
+    POWERUP_SPAWN_CHANCE = 0.003  # 0.3% chance per step
+    POWERUP_DURATION = 180  # 3 detik (60 fps * 3)
+    BALL_RESPAWN_DELAY = 60  # Bola diam 1 detik setelah skor
+
+    # Warna
+    ACCENT_COLOR = "#00d4ff"
+    PLAYER1_COLOR = "#FF6B6B"
+    PLAYER2_COLOR = "#4ECDC4"
+
+    # Input paddle untuk step()
+    MOVE_UP = -1
+    STOP = 0
+    MOVE_DOWN = 1
+
+    # Event yang dikembalikan oleh step()
+    EVENT_WALL_HIT = "wall_hit"
+    EVENT_PADDLE_HIT = "paddle_hit"
+    EVENT_SCORE = "score"
+    EVENT_POWERUP_COLLECT = "powerup_collect"
+    EVENT_GAME_OVER = "game_over"
+
+    # Layout export_state(): bola, paddle 1, paddle 2, flag + power-up,
+    # 7 nilai status (powerup_timer, powerup_active_player, score 1, score 2,
+    # winner, ball_respawn_timer, frame) dan 4 posisi sebelum step
+    STATE_SIZE = Ball.STATE_SIZE + 2 * Paddle.STATE_SIZE + 1 + PowerUp.STATE_SIZE + 7 + 4
+
+    def __init__(self, particles=True, seed=None):
+        """
+        Constructor untuk PongSimulation
+
+        Args:
+            particles (bool): False untuk mematikan efek particle
+                (berguna untuk simulasi massal yang tidak dirender)
+            seed (int): Seed RNG pertandingan (None = random). Dengan seed dan
+                input yang sama, pertandingan selalu berjalan identik.
+        """
+        self.__particles_enabled = particles
+
+        # RNG per pertandingan, dipakai bola dan spawn power-up
+        self.__seed = seed
+        self.__rng = random.Random(seed)
+
+        # Inisialisasi game objects
+        self.ball = Ball(
+            x=self.WIDTH / 2,
+            y=self.HEIGHT / 2,
+            radius=10,
+            color=self.ACCENT_COLOR,
+            speed=5,
+            rng=self.__rng
+        )
+
+        self.paddle1 = Paddle(
+            x=30,
+            y=self.HEIGHT / 2 - 50,
+            width=15,
+            height=100,
+            color=self.PLAYER1_COLOR,
+            speed=7
+        )
+        self.paddle1.set_screen_height(self.HEIGHT)
+
+        self.paddle2 = Paddle(
+            x=self.WIDTH - 45,
+            y=self.HEIGHT / 2 - 50,
+            width=15,
+            height=100,
+            color=self.PLAYER2_COLOR,
+            speed=7
+        )
+        self.paddle2.set_screen_height(self.HEIGHT)
+
+        # Particle system untuk efek visual
+        self.particle_system = ParticleSystem(seed=seed)
+
+        # Power-up system
+        self.__current_powerup = None
+        self.__powerup_timer = 0
+        self.__powerup_active_player = None  # 1 atau 2
+
+        # Score dan status
+        self.__player1_score = 0
+        self.__player2_score = 0
+        self.__winner = None
+        self.__ball_respawn_timer = 0
+        self.__frame = 0
+
+        # Event yang terjadi pada step saat ini
+        self.__events = []
+
+        # Posisi sebelum step terakhir, untuk interpolasi rendering
+        self.__previous_positions = None
+        self._save_previous_positions()
+
+        # FrameProfiler opsional (None = profiling mati)
+        self.__profiler = None
+
+        # Lama step yang sedang berjalan (dalam frame)
+        self.__dt = 1
+
+    # GETTER methods
+    def get_scores(self):
+        """Mengambil score kedua pemain sebagai tuple (player1, player2)"""
+        return (self.__player1_score, self.__player2_score)
+
+    def get_winner(self):
+        """Mengambil pemenang (1 atau 2), None jika belum ada"""
+        return self.__winner
+
+    def is_game_over(self):
+        """Mengecek apakah sudah ada pemenang"""
+        return self.__winner is not None
+
+    def get_current_powerup(self):
+        """Mengambil power-up yang sedang muncul (atau None)"""
+        return self.__current_powerup
+
+    def get_balls(self):
+        """Mengambil semua bola (satu bola pada mode klasik)"""
+        return [self.ball]
+
+    def get_powerups(self):
+        """Mengambil power-up yang sedang muncul sebagai list"""
+        powerup = self.__current_powerup
+        if powerup is not None and powerup.is_active():
+            return [powerup]
+        return []
+
+    def get_powerup_timer(self):
+        """Mengambil sisa durasi efek power-up (dalam step)"""
+        return self.__powerup_timer
+
+    def get_powerup_active_player(self):
+        """Mengambil pemain yang sedang mendapat efek power-up"""
+        return self.__powerup_active_player
+
+    def get_ball_respawn_timer(self):
+        """Mengambil sisa step sebelum bola bergerak lagi setelah skor"""
+        return self.__ball_respawn_timer
+
+    def get_seed(self):
+        """Mengambil seed pertandingan (None jika tidak di-seed)"""
+        return self.__seed
+
+    def get_rng(self):
+        """Mengambil RNG pertandingan (random.Random)"""
+        return self.__rng
+
+    def get_frame(self):
+        """Mengambil jumlah step yang sudah dijalankan sejak reset"""
+        return self.__frame
+
+    def set_profiler(self, profiler):
+        """
+        Pasang FrameProfiler untuk mengukur fase setiap step
+
+        Args:
+            profiler (FrameProfiler): Profiler, atau None untuk mematikan
+        """
+        self.__profiler = profiler
+
+    def reset(self, seed=None):
+        """
+        Reset simulasi ke kondisi awal pertandingan
+
+        Args:
+            seed (int): Seed baru untuk pertandingan berikutnya
+                (None = lanjutkan RNG yang sedang dipakai)
+        """
+        if seed is not None:
+            self.__seed = seed
+            self.__rng.seed(seed)
+            self.particle_system.seed(seed)
+
+        self.__player1_score = 0
+        self.__player2_score = 0
+        self.__winner = None
+        self.__ball_respawn_timer = 0
+        self.__frame = 0
+
+        # Reset ball position
+        self.ball.reset_position(self.WIDTH / 2, self.HEIGHT / 2)
+        self.ball.set_active(True)
+
+        # Reset paddle positions
+        self.paddle1.reset_position(30, self.HEIGHT / 2 - 50)
+        self.paddle2.reset_position(self.WIDTH - 45, self.HEIGHT / 2 - 50)
+
+        # Clear power-up
+        self.__current_powerup = None
+        self.__powerup_timer = 0
+        self.__powerup_active_player = None
+
+        # Clear particles
+        self.particle_system.clear()
+
+        self._save_previous_positions()
+
+    def step(self, inputs=None, dt=1):
+        """
+        Jalankan satu step simulasi (setara satu frame game)
+
+        Args:
+            inputs (tuple): (input_player1, input_player2), masing-masing
+                MOVE_UP, STOP atau MOVE_DOWN. None berarti paddle tetap
+                bergerak sesuai perintah terakhir.
+            dt (float): Lama step dalam satuan frame. Nilai > 1 menjalankan
+                simulasi dengan step lebih besar (lebih sedikit step per detik
+                game); collision kontinu mencegah bola menembus paddle.
+                Pada dt=1 collision kontinu hanya dipakai untuk bola yang
+                bergerak lebih jauh dari ukurannya per step.
+
+        Returns:
+            list: Daftar event yang terjadi pada step ini (EVENT_*)
+        """
+        self.__events = []
+        if self.__winner is not None:
+            return self.__events
+
+        if inputs is not None:
+            self._apply_input(self.paddle1, inputs[0])
+            self._apply_input(self.paddle2, inputs[1])
+
+        self.__frame += 1
+        self.__dt = dt
+        self._save_previous_positions()
+
+        profiler = self.__profiler
+        if profiler is not None:
+            profiler.skip()
+
+        # Update game objects
+        self.ball.update(dt)
+        self.paddle1.update(dt)
+        self.paddle2.update(dt)
+        if profiler is not None:
+            profiler.lap(profiler.PHASE_OBJECTS)
+
+        # Update power-up
+        if self.__current_powerup and self.__current_powerup.is_active():
+            if dt == 1:
+                self.__current_powerup.update()
+            else:
+                self.__current_powerup.advance(dt)
+            # Jika lifetime habis, set ke None agar bisa spawn lagi
+            if not self.__current_powerup.is_active():
+                self.__current_powerup = None
+
+        self._update_powerup()
+        self._spawn_powerup()
+        self._check_powerup_collection()
+        if profiler is not None:
+            profiler.lap(profiler.PHASE_POWERUP)
+
+        # Update particle system
+        self.particle_system.update()
+        if profiler is not None:
+            profiler.lap(profiler.PHASE_PARTICLES)
+
+        # Check collisions
+        self._check_wall_collision()
+        self._check_paddle_collision()
+        self._check_scoring()
+
+        self._update_ball_respawn()
+        if profiler is not None:
+            profiler.lap(profiler.PHASE_COLLISIONS)
+
+        return self.__events
+
+    def export_state(self, buffer=None):
+        """
+        Tulis seluruh state objek dan status game ke satu buffer datar
+        RNG dan particle tidak ikut (particle hanya efek visual)
+
+        Args:
+            buffer: Buffer tujuan dengan panjang minimal STATE_SIZE
+                (None = buat array('d') baru)
+
+        Returns:
+            array: Buffer berisi state
+        """
+        if buffer is None:
+            buffer = array("d", bytes(8 * self.STATE_SIZE))
+
+        offset = self.ball.export_state(buffer, 0)
+        offset = self.paddle1.export_state(buffer, offset)
+        offset = self.paddle2.export_state(buffer, offset)
+
+        powerup = self.__current_powerup
+        if powerup is not None:
+            buffer[offset] = 1.0
+            offset = powerup.export_state(buffer, offset + 1)
+        else:
+            end = offset + 1 + PowerUp.STATE_SIZE
+            for index in range(offset, end):
+                buffer[index] = 0.0
+            offset = end
+
+        buffer[offset] = self.__powerup_timer
+        buffer[offset + 1] = self.__powerup_active_player or 0
+        buffer[offset + 2] = self.__player1_score
+        buffer[offset + 3] = self.__player2_score
+        buffer[offset + 4] = self.__winner or 0
+        buffer[offset + 5] = self.__ball_respawn_timer
+        buffer[offset + 6] = self.__frame
+        offset += 7
+
+        for value in self.__previous_positions:
+            buffer[offset] = value
+            offset += 1
+        return buffer
+
+    def import_state(self, buffer):
+        """
+        Pulihkan state yang ditulis export_state()
+
+        Args:
+            buffer: Buffer hasil export_state()
+        """
+        offset = self.ball.import_state(buffer, 0)
+        offset = self.paddle1.import_state(buffer, offset)
+        offset = self.paddle2.import_state(buffer, offset)
+
+        if buffer[offset] != 0.0:
+            # Pakai ulang objek power-up jika ada, tipe ikut dipulihkan
+            if self.__current_powerup is None:
+                self.__current_powerup = PowerUp(0, 0, 20, PowerUp.SPEED_BOOST)
+            self.__current_powerup.import_state(buffer, offset + 1)
+        else:
+            self.__current_powerup = None
+        offset += 1 + PowerUp.STATE_SIZE
+
+        # Timer berkurang sebesar dt (bisa pecahan), jadi tidak dibulatkan
+        self.__powerup_timer = buffer[offset]
+        self.__powerup_active_player = int(buffer[offset + 1]) or None
+        self.__player1_score = int(buffer[offset + 2])
+        self.__player2_score = int(buffer[offset + 3])
+        self.__winner = int(buffer[offset + 4]) or None
+        self.__ball_respawn_timer = buffer[offset + 5]
+        self.__frame = int(buffer[offset + 6])
+        offset += 7
+
+        self.__previous_positions = tuple(buffer[offset:offset + 4])
+
+    def skip_idle_frames(self, frames):
+        """
+        Majukan simulasi beberapa step sekaligus tanpa menjalankan step()
+        Caller wajib menjamin tidak ada event (collision, skor, power-up,
+        timer habis, spawn) dalam frames step tersebut dan tidak ada particle
+        aktif. Dipakai oleh FastForward untuk melompati frame kosong.
+
+        Args:
+            frames (int): Jumlah step yang dilompati
+        """
+        if frames <= 0 or self.__winner is not None:
+            return
+
+        self.__frame += frames
+
+        # Bola dan paddle bergerak lurus dengan velocity konstan
+        ball = self.ball
+        if ball.is_active():
+            ball.set_x(ball.get_x() + ball.get_velocity_x() * frames)
+            ball.set_y(ball.get_y() + ball.get_velocity_y() * frames)
+        self.paddle1.advance(frames)
+        self.paddle2.advance(frames)
+        self._save_previous_positions()
+
+        # Power-up dan timer
+        powerup = self.__current_powerup
+        if powerup is not None and powerup.is_active():
+            powerup.advance(frames)
+        else:
+            # Setiap step mengambil satu angka random untuk peluang spawn
+            rng_random = self.__rng.random
+            for _ in range(frames):
+                rng_random()
+
+        if self.__powerup_timer > 0:
+            self.__powerup_timer -= frames
+        if self.__ball_respawn_timer > 0:
+            self.__ball_respawn_timer -= frames
+
+    def _save_previous_positions(self):
+        """Simpan posisi bola dan paddle sebelum step dijalankan"""
+        self.__previous_positions = (
+            self.ball.get_x(),
+            self.ball.get_y(),
+            self.paddle1.get_y(),
+            self.paddle2.get_y()
+        )
+
+    def apply_interpolation(self, alpha):
+        """
+        Pindahkan bola dan paddle sementara ke posisi interpolasi antara
+        state sebelum dan sesudah step terakhir (untuk rendering)
+
+        Args:
+            alpha (float): 0.0 = posisi sebelum step, 1.0 = posisi terbaru
+
+        Returns:
+            tuple: Posisi asli, wajib dikembalikan dengan restore_positions()
+        """
+        current = (
+            self.ball.get_x(),
+            self.ball.get_y(),
+            self.paddle1.get_y(),
+            self.paddle2.get_y()
+        )
+        if alpha >= 1.0:
+            return current
+
+        previous = self.__previous_positions
+        self.ball.set_x(previous[0] + (current[0] - previous[0]) * alpha)
+        self.ball.set_y(previous[1] + (current[1] - previous[1]) * alpha)
+        self.paddle1.set_y(previous[2] + (current[2] - previous[2]) * alpha)
+        self.paddle2.set_y(previous[3] + (current[3] - previous[3]) * alpha)
+        return current
+
+    def restore_positions(self, positions):
+        """
+        Kembalikan posisi asli setelah apply_interpolation()
+
+        Args:
+            positions (tuple): Nilai yang dikembalikan apply_interpolation()
+        """
+        self.ball.set_x(positions[0])
+        self.ball.set_y(positions[1])
+        self.paddle1.set_y(positions[2])
+        self.paddle2.set_y(positions[3])
+
+    def _apply_input(self, paddle, direction):
+        """
+        Terjemahkan input menjadi gerakan paddle
+
+        Args:
+            paddle (Paddle): Paddle yang digerakkan
+            direction (int): MOVE_UP, STOP atau MOVE_DOWN
+        """
+        if direction < 0:
+            paddle.move_up()
+        elif direction > 0:
+            paddle.move_down()
+        else:
+            paddle.stop()
+
+    def _emit_particles(self, x, y, color, count):
+        """Emit particles jika efek particle diaktifkan"""
+        if self.__particles_enabled:
+            self.particle_system.emit(x, y, color, count=count)
+
+    def _update_ball_respawn(self):
+        """Aktifkan kembali bola setelah jeda skor selesai"""
+        if self.__ball_respawn_timer > 0:
+            self.__ball_respawn_timer -= self.__dt
+            if self.__ball_respawn_timer <= 0:
+                self.__ball_respawn_timer = 0
+                self.ball.set_active(True)
+
+    def _reset_ball(self):
+        """Reset ball ke tengah setelah score"""
+        self.ball.reset_position(self.WIDTH / 2, self.HEIGHT / 2)
+        # Set ball inactive sementara, simulasi tetap berjalan
+        self.ball.set_active(False)
+        self.__ball_respawn_timer = self.BALL_RESPAWN_DELAY
+
+        # Bola berpindah tempat, jangan diinterpolasi dari posisi lama
+        self.__previous_positions = (
+            self.ball.get_x(),
+            self.ball.get_y(),
+            self.__previous_positions[2],
+            self.__previous_positions[3]
+        )
+
+    def _check_scoring(self):
+        """Cek apakah ada yang score"""
+        ball_x = self.ball.get_x()
+
+        # Player 2 scores (ball keluar kiri)
+        if ball_x < 0:
+            self.__player2_score += 1
+            self.__events.append(self.EVENT_SCORE)
+            self._emit_particles(0, self.HEIGHT / 2, self.PLAYER2_COLOR, 30)
+            self._reset_ball()
+            self._check_game_over()
+            return True
+
+        # Player 1 scores (ball keluar kanan)
+        if ball_x > self.WIDTH:
+            self.__player1_score += 1
+            self.__events.append(self.EVENT_SCORE)
+            self._emit_particles(self.WIDTH, self.HEIGHT / 2, self.PLAYER1_COLOR, 30)
+            self._reset_ball()
+            self._check_game_over()
+            return True
+
+        return False
+
+    def _check_game_over(self):
+        """Cek apakah game sudah selesai"""
+        if self.__player1_score >= self.WINNING_SCORE:
+            self.__winner = 1
+        elif self.__player2_score >= self.WINNING_SCORE:
+            self.__winner = 2
+
+        if self.__winner is not None:
+            self.__events.append(self.EVENT_GAME_OVER)
+
+    def _check_wall_collision(self):
+        """Cek collision dengan dinding atas/bawah"""
+        ball_y = self.ball.get_y()
+        ball_radius = self.ball.get_radius()
+
+        # Collision dengan dinding atas
+        if ball_y - ball_radius < 0:
+            self.ball.set_y(ball_radius)
+            self.ball.reverse_y()
+            self.__events.append(self.EVENT_WALL_HIT)
+            self._emit_particles(self.ball.get_x(), 0, self.ACCENT_COLOR, 8)
+            return True
+
+        # Collision dengan dinding bawah
+        if ball_y + ball_radius > self.HEIGHT:
+            self.ball.set_y(self.HEIGHT - ball_radius)
+            self.ball.reverse_y()
+            self.__events.append(self.EVENT_WALL_HIT)
+            self._emit_particles(self.ball.get_x(), self.HEIGHT, self.ACCENT_COLOR, 8)
+            return True
+
+        return False
+
+    def _sweep_ball(self, target, target_dy=0.0):
+        """
+        Collision kontinu bola terhadap target selama step terakhir
+        Menangkap tabrakan yang terlewat oleh cek overlap di akhir step.
+        Hanya dijalankan jika dt > 1 atau bola bergerak (relatif terhadap
+        target) lebih jauh dari ukurannya dalam satu step; selain itu cek
+        overlap sudah cukup dan hasil step dt=1 sama persis dengan fisika
+        lama (replay, BatchPongSimulation, FastForward)
+
+        Args:
+            target (GameObject): Paddle atau power-up
+            target_dy (float): Perpindahan vertikal target selama step
+
+        Returns:
+            tuple: (toi, normal_x, normal_y) atau None
+        """
+        ball = self.ball
+        if not ball.is_active():
+            return None
+
+        start_x, start_y = self.__previous_positions[0], self.__previous_positions[1]
+        dx = ball.get_x() - start_x
+        dy = ball.get_y() - start_y
+        if dx == 0 and dy == 0 and target_dy == 0:
+            return None
+
+        size = ball.get_width()
+        if self.__dt <= 1 and abs(dx) <= size and abs(dy - target_dy) <= size:
+            return None
+        left, top, right, bottom = target.get_bounds()
+
+        # Broadphase: rentang x yang disapu bola tidak mencapai target
+        # (target hanya bergerak vertikal, jadi sumbu x cukup dicek langsung)
+        if dx < 0:
+            if start_x + dx > right or start_x + size < left:
+                return None
+        elif start_x > right or start_x + dx + size < left:
+            return None
+
+        return swept_aabb(
+            (start_x, start_y, start_x + size, start_y + size),
+            dx, dy - target_dy,
+            (left, top - target_dy, right, bottom - target_dy)
+        )
+
+    def _ball_hits_paddle(self, paddle, previous_y):
+        """
+        Cek bola menyentuh paddle: overlap di akhir step, atau tabrakan
+        di tengah step yang ditemukan collision kontinu. Untuk kasus kedua
+        bola dipindah ke titik kontak dan sisa step dijalankan setelah pantulan.
+
+        Args:
+            paddle (Paddle): Paddle yang dicek
+            previous_y (float): Posisi y paddle di awal step
+
+        Returns:
+            bool: True jika bola sudah dipantulkan
+        """
+        ball = self.ball
+        if ball.collides_with(paddle):
+            ball.bounce_off_paddle(paddle)
+            return True
+
+        paddle_dy = paddle.get_y() - previous_y
+        hit = self._sweep_ball(paddle, paddle_dy)
+        if hit is None:
+            return False
+
+        toi = hit[0]
+        start_x, start_y = self.__previous_positions[0], self.__previous_positions[1]
+        ball.set_x(start_x + (ball.get_x() - start_x) * toi)
+        ball.set_y(start_y + (ball.get_y() - start_y) * toi)
+        ball.bounce_off_paddle(paddle, paddle_y=previous_y + paddle_dy * toi)
+
+        # Sisa waktu step dipakai bergerak dengan velocity baru
+        remaining = (1.0 - toi) * self.__dt
+        ball.set_x(ball.get_x() + ball.get_velocity_x() * remaining)
+        ball.set_y(ball.get_y() + ball.get_velocity_y() * remaining)
+        return True
+
+    def _check_paddle_collision(self):
+        """Cek collision dengan paddle"""
+        # Collision dengan paddle 1
+        if self.ball.get_velocity_x() < 0 and self._ball_hits_paddle(self.paddle1, self.__previous_positions[2]):
+            self.__events.append(self.EVENT_PADDLE_HIT)
+            self._emit_particles(
+                self.paddle1.get_x() + self.paddle1.get_width(),
+                self.ball.get_y(),
+                self.PLAYER1_COLOR,
+                10
+            )
+            return True
+
+        # Collision dengan paddle 2
+        if self.ball.get_velocity_x() > 0 and self._ball_hits_paddle(self.paddle2, self.__previous_positions[3]):
+            self.__events.append(self.EVENT_PADDLE_HIT)
+            self._emit_particles(
+                self.paddle2.get_x(),
+                self.ball.get_y(),
+                self.PLAYER2_COLOR,
+                10
+            )
+            return True
+
+        return False
+
+    def _spawn_powerup(self):
+        """Spawn power-up secara random"""
+        # Spawn power-up jika tidak ada yang aktif atau yang sebelumnya sudah tidak aktif
+        chance = self.POWERUP_SPAWN_CHANCE
+        if self.__dt != 1:
+            # Peluang per step disesuaikan dengan lama step
+            chance = 1 - (1 - chance) ** self.__dt
+
+        if (self.__current_powerup is None or not self.__current_powerup.is_active()) and self.__rng.random() < chance:
+            self.__current_powerup = PowerUp.spawn_random(self.WIDTH, self.HEIGHT, rng=self.__rng)
+
+    def _check_powerup_collection(self):
+        """Cek apakah ada yang mengambil power-up"""
+        if self.__current_powerup is None or not self.__current_powerup.is_active():
+            return
+
+        # Cek collision dengan ball (termasuk tabrakan di tengah step)
+        if self.ball.collides_with(self.__current_powerup) or self._sweep_ball(self.__current_powerup) is not None:
+            powerup_type = self.__current_powerup.get_type()
+
+            # Simpan posisi untuk particle effect
+            powerup_x = self.__current_powerup.get_x()
+            powerup_y = self.__current_powerup.get_y()
+            powerup_color = self.__current_powerup.get_color()
+
+            # Collect power-up
+            self.__current_powerup.collect()
+            self.__events.append(self.EVENT_POWERUP_COLLECT)
+
+            # Tentukan siapa yang dapat power-up berdasarkan arah bola
+            if self.ball.get_velocity_x() > 0:
+                # Bola ke kanan, player 2 dapat power-up
+                self.__powerup_active_player = 2
+                if powerup_type == PowerUp.SPEED_BOOST:
+                    self.ball.set_speed_boost(1.5)
+                elif powerup_type == PowerUp.SIZE_BOOST:
+                    self.paddle2.set_size_boost(1.5)
+            else:
+                # Bola ke kiri, player 1 dapat power-up
+                self.__powerup_active_player = 1
+                if powerup_type == PowerUp.SPEED_BOOST:
+                    self.ball.set_speed_boost(1.5)
+                elif powerup_type == PowerUp.SIZE_BOOST:
+                    self.paddle1.set_size_boost(1.5)
+
+            self.__powerup_timer = self.POWERUP_DURATION
+
+            # Particle effect
+            self._emit_particles(powerup_x, powerup_y, powerup_color, 20)
+
+            # Set current_powerup ke None agar bisa spawn lagi
+            self.__current_powerup = None
+
+    def _update_powerup(self):
+        """Update power-up timer dan reset jika habis"""
+        if self.__powerup_timer > 0:
+            self.__powerup_timer -= self.__dt
+            if self.__powerup_timer <= 0:
+                self.__powerup_timer = 0
+                # Reset power-up effects
+                self.ball.reset_speed_boost()
+                self.paddle1.reset_size_boost()
+                self.paddle2.reset_size_boost()
+                self.__powerup_active_player = None
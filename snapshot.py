@@ -0,0 +1,94 @@
+"""
+Snapshot biner state pertandingan
+Satu snapshot berisi state objek dan status game (PongSimulation.export_state)
+beserta state RNG dalam layout tetap, sehingga bisa dipakai untuk checkpoint,
+rollback dan mencabangkan simulasi dari posisi yang sama
+"""
+
+import struct
+
+from simulation import PongSimulation
+
+MAGIC = b"PSNP"
+VERSION = 1
+
+# magic, versi, 3 byte padding agar state double rata 8 byte
+HEADER = struct.Struct("<4sBxxx")
+
+# State Mersenne Twister: 624 word + index, lalu cache gauss (flag + nilai)
+RNG_STATE = struct.Struct("<625I?d")
+
+STATE_OFFSET = HEADER.size
+RNG_OFFSET = STATE_OFFSET + 8 * PongSimulation.STATE_SIZE
+SNAPSHOT_SIZE = RNG_OFFSET + RNG_STATE.size
+
+
+def take_snapshot(simulation, buffer=None):
+    """
+    Simpan state simulasi ke buffer biner berukuran tetap
+    Particle tidak ikut (hanya efek visual)
+
+    Args:
+        simulation (PongSimulation): Simulasi yang disimpan
+        buffer (bytearray): Buffer tujuan berukuran SNAPSHOT_SIZE untuk
+            dipakai ulang (None = buat bytearray baru)
+
+    Returns:
+        bytearray: Buffer berisi snapshot
+    """
+    if buffer is None:
+        buffer = bytearray(SNAPSHOT_SIZE)
+
+    HEADER.pack_into(buffer, 0, MAGIC, VERSION)
+
+    # State ditulis langsung ke buffer lewat memoryview, tanpa salinan
+    with memoryview(buffer) as view:
+        with view[STATE_OFFSET:RNG_OFFSET].cast("d") as state:
+            simulation.export_state(state)
+
+    _, internal_state, gauss_next = simulation.get_rng().getstate()
+    RNG_STATE.pack_into(
+        buffer, RNG_OFFSET, *internal_state,
+        gauss_next is not None, gauss_next or 0.0
+    )
+    return buffer
+
+
+def restore_snapshot(simulation, data):
+    """
+    Pulihkan simulasi dari snapshot
+
+    Args:
+        simulation (PongSimulation): Simulasi tujuan (boleh simulasi lain,
+            misalnya untuk mencabangkan pertandingan)
+        data (bytes): Hasil take_snapshot()
+
+    Raises:
+        ValueError: Jika data bukan snapshot yang valid
+    """
+    if len(data) != SNAPSHOT_SIZE:
+        raise ValueError("Ukuran snapshot tidak sesuai")
+
+    magic, version = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Format snapshot tidak dikenal")
+
+    with memoryview(data) as view:
+        with view[STATE_OFFSET:RNG_OFFSET].cast("d") as state:
+            simulation.import_state(state)
+
+    values = RNG_STATE.unpack_from(data, RNG_OFFSET)
+    gauss_next = values[626] if values[625] else None
+    simulation.get_rng().setstate((3, values[:625], gauss_next))
+
+
+def save_snapshot(simulation, path):
+    """Simpan snapshot simulasi ke file"""
+    with open(path, "wb") as f:
+        f.write(take_snapshot(simulation))
+
+
+def load_snapshot(simulation, path):
+    """Pulihkan simulasi dari file snapshot"""
+    with open(path, "rb") as f:
+        restore_snapshot(simulation, f.read())
@@ -1,143 +1,452 @@
 """
 Sound Manager untuk mengelola efek suara game
-Menggunakan winsound untuk Windows atau fallback untuk OS lain
+Semua efek disintesis sekali menjadi PCM 16 bit lalu dimainkan oleh satu
+thread audio yang mencampur (mixing) efek yang bertumpuk menjadi satu stream.
+Backend: winsound (Windows), aplay/pacat (Linux) atau file WAV (headless)
 """
 
+import queue
+import shutil
+import subprocess
 import sys
 import threading
+import time
+import wave
+
+import numpy as np
+
+# Format audio untuk semua backend: mono, 16 bit signed little endian
+SAMPLE_RATE = 22050
+SAMPLE_WIDTH = 2
+CHANNELS = 1
+
+
+class WavFileBackend:
+    """
+    Backend yang menulis stream audio ke file WAV (untuk testing headless)
+    Jeda tanpa suara tidak ditulis, jadi file hanya berisi efek yang dimainkan
+    """
+
+    def __init__(self, path, realtime=False):
+        """
+        Constructor untuk WavFileBackend
+
+        Args:
+            path (str): File WAV tujuan
+            realtime (bool): True agar worker tetap mengikuti waktu nyata
+                (efek yang dipicu berdekatan tercampur seperti di speaker)
+        """
+        self.__file = wave.open(path, "wb")
+        self.__file.setnchannels(CHANNELS)
+        self.__file.setsampwidth(SAMPLE_WIDTH)
+        self.__file.setframerate(SAMPLE_RATE)
+        self.realtime = realtime
+        self.block_samples = 512
+
+    def write(self, data):
+        """Tulis satu blok PCM"""
+        self.__file.writeframes(data)
+
+    def close(self):
+        """Tutup file (header WAV diperbarui)"""
+        self.__file.close()
+
+
+class PipeBackend:
+    """
+    Backend Linux: satu proses player (aplay atau pacat) yang membaca PCM
+    mentah dari stdin selama game berjalan
+    """
+
+    realtime = True
+    block_samples = 512  # ~23 ms per blok
+
+    # Perintah yang dicoba berurutan; {rate} diganti sample rate
+    COMMANDS = (
+        ("aplay", "-q", "-t", "raw", "-f", "S16_LE", "-c", "1", "-r", "{rate}"),
+        ("pacat", "--playback", "--format=s16le", "--channels=1", "--rate={rate}"),
+    )
+
+    def __init__(self, command):
+        """
+        Constructor untuk PipeBackend
+
+        Args:
+            command (tuple): Perintah player beserta argumen
+        """
+        self.__process = subprocess.Popen(
+            command, stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+    @classmethod
+    def detect(cls):
+        """
+        Cari player yang terinstall
+
+        Returns:
+            PipeBackend: Backend siap pakai, atau None jika tidak ada
+        """
+        for command in cls.COMMANDS:
+            if shutil.which(command[0]):
+                try:
+                    return cls(tuple(part.format(rate=SAMPLE_RATE) for part in command))
+                except OSError:
+                    continue
+        return None
+
+    def write(self, data):
+        """Kirim satu blok PCM ke player"""
+        self.__process.stdin.write(data)
+        self.__process.stdin.flush()
+
+    def close(self):
+        """Tutup stdin player dan tunggu prosesnya selesai"""
+        try:
+            self.__process.stdin.close()
+        except OSError:
+            pass
+        self.__process.wait(timeout=2)
+
+
+class WinsoundBackend:
+    """
+    Backend Windows: setiap blok dimainkan sebagai WAV di memori
+    PlaySound tidak bisa streaming, jadi bloknya dibuat panjang (~200 ms)
+    """
+
+    realtime = True
+    block_samples = 4410
+
+    def __init__(self, winsound):
+        """
+        Constructor untuk WinsoundBackend
+
+        Args:
+            winsound: Modul winsound
+        """
+        self.__winsound = winsound
+
+    def write(self, data):
+        """Mainkan satu blok PCM (blocking sampai selesai)"""
+        header = b"".join((
+            b"RIFF", (36 + len(data)).to_bytes(4, "little"), b"WAVEfmt ",
+            (16).to_bytes(4, "little"), (1).to_bytes(2, "little"),
+            CHANNELS.to_bytes(2, "little"), SAMPLE_RATE.to_bytes(4, "little"),
+            (SAMPLE_RATE * SAMPLE_WIDTH * CHANNELS).to_bytes(4, "little"),
+            (SAMPLE_WIDTH * CHANNELS).to_bytes(2, "little"), (8 * SAMPLE_WIDTH).to_bytes(2, "little"),
+            b"data", len(data).to_bytes(4, "little")
+        ))
+        self.__winsound.PlaySound(header + data, self.__winsound.SND_MEMORY | self.__winsound.SND_NODEFAULT)
+
+    def close(self):
+        """Tidak ada resource yang perlu ditutup"""
+
+
+def detect_backend():
+    """
+    Pilih backend audio untuk platform ini
+
+    Returns:
+        object: Backend dengan method write(data) dan close(), atau None
+    """
+    if sys.platform == "win32":
+        try:
+            import winsound
+        except ImportError:
+            return None
+        return WinsoundBackend(winsound)
+    if sys.platform.startswith("linux"):
+        return PipeBackend.detect()
+    return None
+
+
+def synthesize(tones, volume=0.3):
+    """
+    Sintesis rangkaian nada kotak (seperti beep) menjadi PCM 16 bit
+
+    Args:
+        tones (tuple): Daftar (frekuensi Hz, durasi ms)
+        volume (float): Amplitudo relatif (0.0 - 1.0)
+
+    Returns:
+        np.ndarray: Sample int16
+    """
+    parts = []
+    fade = int(SAMPLE_RATE * 0.004)  # Fade 4 ms agar tidak ada bunyi klik
+    for frequency, duration in tones:
+        count = int(SAMPLE_RATE * duration / 1000)
+        phase = np.arange(count) * (frequency / SAMPLE_RATE)
+        tone = np.where((phase % 1.0) < 0.5, volume, -volume)
+        ramp = min(fade, count // 2)
+        if ramp:
+            envelope = np.linspace(0.0, 1.0, ramp)
+            tone[:ramp] *= envelope
+            tone[-ramp:] *= envelope[::-1]
+        parts.append(tone)
+    return (np.concatenate(parts) * 32767).astype(np.int16)
+
+
+class AudioWorker:
+    """
+    Thread audio tunggal yang mencampur efek suara menjadi satu stream
+    Efek dipicu lewat queue terbatas; jika queue penuh pemicu dibuang
+    sehingga game loop tidak pernah menunggu audio.
+    """
+
+    QUEUE_SIZE = 16
+    MAX_VOICES = 8
+    LOOKAHEAD_BLOCKS = 2  # Worker boleh mendahului waktu nyata sebanyak ini
+
+    def __init__(self, backend, sounds):
+        """
+        Constructor untuk AudioWorker
+
+        Args:
+            backend: Backend audio (write(data), close(), atribut realtime
+                dan block_samples)
+            sounds (dict): Nama efek -> PCM int16 yang sudah disintesis
+        """
+        self.__backend = backend
+        self.__sounds = sounds
+        self.__queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.__voices = []  # [nama, pcm, posisi]
+        self.__block_samples = backend.block_samples
+        self.__mix = np.zeros(self.__block_samples, dtype=np.int32)
+        self.__output = np.zeros(self.__block_samples, dtype=np.int16)
+        self.__dropped = 0
+        self.__thread = threading.Thread(target=self._run, name="audio", daemon=True)
+        self.__thread.start()
+
+    def get_dropped_count(self):
+        """Mengambil jumlah pemicu efek yang dibuang karena queue penuh"""
+        return self.__dropped
+
+    def trigger(self, name):
+        """
+        Mainkan efek (tidak pernah blocking)
+
+        Args:
+            name (str): Nama efek pada sounds
+        """
+        try:
+            self.__queue.put_nowait(name)
+        except queue.Full:
+            self.__dropped += 1
+
+    def close(self, timeout=2.0):
+        """Hentikan worker setelah efek yang sedang berbunyi selesai"""
+        try:
+            self.__queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self.__thread.join(timeout)
+        self.__backend.close()
+
+    def _start_voice(self, name):
+        """Tambah efek ke daftar yang sedang dicampur"""
+        pcm = self.__sounds.get(name)
+        if pcm is None:
+            return
+        voices = self.__voices
+        # Efek yang sama dipicu ulang: mulai dari awal, tidak ditumpuk
+        for voice in voices:
+            if voice[0] == name:
+                voice[2] = 0
+                return
+        if len(voices) >= self.MAX_VOICES:
+            voices.pop(0)
+        voices.append([name, pcm, 0])
+
+    def _render_block(self):
+        """
+        Campur semua efek aktif menjadi satu blok PCM
+
+        Returns:
+            bytes: Blok int16
+        """
+        mix = self.__mix
+        mix.fill(0)
+        block = self.__block_samples
+        for voice in self.__voices:
+            pcm, position = voice[1], voice[2]
+            chunk = pcm[position:position + block]
+            mix[:len(chunk)] += chunk
+            voice[2] = position + block
+        self.__voices = [voice for voice in self.__voices if voice[2] < len(voice[1])]
+        np.clip(mix, -32768, 32767, out=mix)
+        self.__output[:] = mix
+        return self.__output.tobytes()
+
+    def _run(self):
+        """Loop worker: tidur saat sunyi, render blok saat ada efek"""
+        block_duration = self.__block_samples / SAMPLE_RATE
+        deadline = 0.0
+        stopping = False
+        while True:
+            if not self.__voices:
+                if stopping:
+                    return
+                name = self.__queue.get()
+                if name is None:
+                    return
+                self._start_voice(name)
+                deadline = time.monotonic()
+
+            # Ambil semua pemicu baru tanpa menunggu
+            while True:
+                try:
+                    name = self.__queue.get_nowait()
+                except queue.Empty:
+                    break
+                if name is None:
+                    stopping = True
+                    continue
+                self._start_voice(name)
+
+            try:
+                self.__backend.write(self._render_block())
+            except (OSError, ValueError):
+                # Player audio tertutup: lanjut tanpa suara
+                self.__voices = []
+                continue
+
+            # Ikuti waktu nyata agar efek baru tidak tertahan di belakang antrean
+            if self.__backend.realtime:
+                deadline += block_duration
+                delay = deadline - time.monotonic() - self.LOOKAHEAD_BLOCKS * block_duration
+                if delay > 0:
+                    time.sleep(delay)
+
 
 class SoundManager:
     """
     Class untuk mengelola sound effects dalam game
-    Menggunakan beep sounds sebagai alternatif yang cross-platform
+    Nada setiap efek disintesis sekali saat dibuat; play_* hanya
+    memasukkan nama efek ke queue milik satu AudioWorker
     """
-    
-    def __init__(self):
-        """Constructor untuk SoundManager"""
+
+    # Rangkaian nada (frekuensi Hz, durasi ms) untuk setiap efek
+    EFFECTS = {
+        "paddle_hit": ((800, 50),),
+        "wall_hit": ((600, 50),),
+        "score": ((400, 100), (300, 150)),
+        "powerup_collect": ((500, 50), (700, 50), (900, 50)),
+        "game_start": ((600, 100), (800, 150)),
+        "game_over": ((800, 100), (600, 100), (400, 200)),
+    }
+
+    def __init__(self, backend=None, autodetect=True):
+        """
+        Constructor untuk SoundManager
+
+        Args:
+            backend: Backend audio (misalnya WavFileBackend). None berarti
+                dipilih otomatis sesuai platform; tanpa backend game tetap
+                berjalan tanpa suara.
+            autodetect (bool): False untuk tidak memilih backend otomatis
+                (misalnya game tanpa display di server atau CI)
+        """
         self.__enabled = True
-        self.__sound_available = False
-        
-        # Cek apakah winsound tersedia (Windows only)
-        try:
-            if sys.platform == 'win32':
-                import winsound
-                self.__winsound = winsound
-                self.__sound_available = True
-            else:
-                # Untuk Mac/Linux, kita akan gunakan print sebagai fallback
-                self.__sound_available = False
-        except ImportError:
-            self.__sound_available = False
-    
+        self.__sounds = {name: synthesize(tones) for name, tones in self.EFFECTS.items()}
+
+        if backend is None and autodetect:
+            backend = detect_backend()
+        self.__worker = AudioWorker(backend, self.__sounds) if backend is not None else None
+        self.__sound_available = self.__worker is not None
+
     def enable(self):
         """Enable sound effects"""
         self.__enabled = True
-    
+
     def disable(self):
         """Disable sound effects"""
         self.__enabled = False
-    
+
     def is_enabled(self):
         """Mengecek apakah sound enabled"""
         return self.__enabled
-    
+
+    def is_available(self):
+        """Mengecek apakah ada backend audio"""
+        return self.__sound_available
+
     def toggle(self):
         """Toggle sound on/off"""
         self.__enabled = not self.__enabled
         return self.__enabled
-    
-    def _play_beep(self, frequency, duration):
+
+    def get_sound(self, name):
         """
-        Helper method untuk play beep sound
-        
+        Mengambil PCM efek yang sudah disintesis
+
         Args:
-            frequency (int): Frekuensi suara dalam Hz
-            duration (int): Durasi dalam milliseconds
+            name (str): Nama efek pada EFFECTS
+
+        Returns:
+            np.ndarray: Sample int16
         """
-        if not self.__enabled:
-            return
-        
-        if self.__sound_available and sys.platform == 'win32':
-            # Play sound di thread terpisah agar tidak blocking
-            threading.Thread(
-                target=lambda: self.__winsound.Beep(frequency, duration),
-                daemon=True
-            ).start()
-    
+        return self.__sounds[name]
+
+    def get_dropped_count(self):
+        """Mengambil jumlah efek yang dibuang karena queue audio penuh"""
+        return self.__worker.get_dropped_count() if self.__worker is not None else 0
+
+    def close(self):
+        """Hentikan worker audio dan tutup backend"""
+        if self.__worker is not None:
+            self.__worker.close()
+            self.__worker = None
+            self.__sound_available = False
+
+    def _play(self, name):
+        """
+        Helper method untuk memainkan efek
+
+        Args:
+            name (str): Nama efek pada EFFECTS
+        """
+        if self.__enabled and self.__worker is not None:
+            self.__worker.trigger(name)
+
     def play_paddle_hit(self):
         """
         Play sound saat bola kena paddle
         Suara pendek dengan frekuensi sedang
         """
-        self._play_beep(800, 50)
-    
+        self._play("paddle_hit")
+
     def play_wall_hit(self):
         """
         Play sound saat bola kena dinding atas/bawah
         Suara pendek dengan frekuensi tinggi
         """
-        self._play_beep(600, 50)
-    
+        self._play("wall_hit")
+
     def play_score(self):
         """
         Play sound saat ada yang score
         Suara yang lebih panjang dan rendah
         """
-        if not self.__enabled:
-            return
-        
-        if self.__sound_available and sys.platform == 'win32':
-            # Sequence of beeps untuk score
-            def play_sequence():
-                self.__winsound.Beep(400, 100)
-                self.__winsound.Beep(300, 150)
-            
-            threading.Thread(target=play_sequence, daemon=True).start()
-    
+        self._play("score")
+
     def play_powerup_collect(self):
         """
         Play sound saat mengambil power-up
         Suara ascending untuk efek positif
         """
-        if not self.__enabled:
-            return
-        
-        if self.__sound_available and sys.platform == 'win32':
-            # Ascending beeps
-            def play_sequence():
-                self.__winsound.Beep(500, 50)
-                self.__winsound.Beep(700, 50)
-                self.__winsound.Beep(900, 50)
-            
-            threading.Thread(target=play_sequence, daemon=True).start()
-    
+        self._play("powerup_collect")
+
     def play_game_start(self):
         """
         Play sound saat game mulai
         Suara yang energetic
         """
-        if not self.__enabled:
-            return
-        
-        if self.__sound_available and sys.platform == 'win32':
-            def play_sequence():
-                self.__winsound.Beep(600, 100)
-                self.__winsound.Beep(800, 150)
-            
-            threading.Thread(target=play_sequence, daemon=True).start()
-    
+        self._play("game_start")
+
     def play_game_over(self):
         """
         Play sound saat game over
         Suara descending untuk efek ending
         """
-        if not self.__enabled:
-            return
-        
-        if self.__sound_available and sys.platform == 'win32':
-            def play_sequence():
-                self.__winsound.Beep(800, 100)
-                self.__winsound.Beep(600, 100)
-                self.__winsound.Beep(400, 200)
-            
-            threading.Thread(target=play_sequence, daemon=True).start()
\ No newline at end of file
+        self._play("game_over")
@@ -0,0 +1,129 @@
+"""
+SpatialHash - Broadphase collision dengan grid seragam
+Objek dimasukkan ke sel grid berdasarkan bounding box-nya sehingga
+pengecekan collision hanya dilakukan untuk objek yang berada di sel yang sama
+"""
+
+import math
+
+class SpatialHash:
+    """
+    Grid seragam yang disimpan dalam dictionary (hanya sel yang terisi)
+    Dibangun ulang setiap step: clear() lalu insert() semua objek.
+    Biaya insert dan query sebanding dengan jumlah sel yang ditempati objek,
+    sehingga total biaya per frame naik kurang lebih linear terhadap jumlah objek.
+    """
+
+    def __init__(self, cell_size):
+        """
+        Constructor untuk SpatialHash
+
+        Args:
+            cell_size (float): Ukuran sisi satu sel grid (sebaiknya sedikit
+                lebih besar dari objek yang paling sering dimasukkan)
+        """
+        self.__cell_size = cell_size
+        self.__inverse = 1.0 / cell_size
+        self.__cells = {}
+        self.__count = 0
+
+    def get_cell_size(self):
+        """Mengambil ukuran sel grid"""
+        return self.__cell_size
+
+    def get_count(self):
+        """Mengambil jumlah objek yang dimasukkan sejak clear()"""
+        return self.__count
+
+    def clear(self):
+        """Kosongkan grid"""
+        self.__cells.clear()
+        self.__count = 0
+
+    def _cell_range(self, bounds):
+        """
+        Hitung rentang sel yang ditempati bounding box
+
+        Returns:
+            tuple: (cell_left, cell_top, cell_right, cell_bottom), inklusif
+        """
+        inverse = self.__inverse
+        left, top, right, bottom = bounds
+        return (
+            math.floor(left * inverse),
+            math.floor(top * inverse),
+            math.floor(right * inverse),
+            math.floor(bottom * inverse)
+        )
+
+    def insert(self, item, bounds):
+        """
+        Masukkan objek ke semua sel yang ditempati bounding box-nya
+
+        Args:
+            item: Objek yang disimpan (biasanya GameObject)
+            bounds (tuple): (left, top, right, bottom)
+        """
+        cells = self.__cells
+        cell_left, cell_top, cell_right, cell_bottom = self._cell_range(bounds)
+        for cell_x in range(cell_left, cell_right + 1):
+            for cell_y in range(cell_top, cell_bottom + 1):
+                key = (cell_x, cell_y)
+                bucket = cells.get(key)
+                if bucket is None:
+                    cells[key] = [item]
+                else:
+                    bucket.append(item)
+        self.__count += 1
+
+    def query(self, bounds):
+        """
+        Cari kandidat objek yang mungkin bertabrakan dengan bounding box
+
+        Args:
+            bounds (tuple): (left, top, right, bottom)
+
+        Returns:
+            list: Objek unik yang menempati sel yang sama (belum dicek narrowphase)
+        """
+        cells = self.__cells
+        cell_left, cell_top, cell_right, cell_bottom = self._cell_range(bounds)
+
+        # Jalur cepat: bounding box hanya menempati satu sel
+        if cell_left == cell_right and cell_top == cell_bottom:
+            return list(cells.get((cell_left, cell_top), ()))
+
+        found = []
+        seen = set()
+        for cell_x in range(cell_left, cell_right + 1):
+            for cell_y in range(cell_top, cell_bottom + 1):
+                for item in cells.get((cell_x, cell_y), ()):
+                    if id(item) not in seen:
+                        seen.add(id(item))
+                        found.append(item)
+        return found
+
+    def candidate_pairs(self):
+        """
+        Semua pasangan objek yang berbagi minimal satu sel
+
+        Returns:
+            list: Daftar tuple (item_a, item_b), setiap pasangan muncul sekali
+        """
+        pairs = []
+        seen = set()
+        for bucket in self.__cells.values():
+            count = len(bucket)
+            if count < 2:
+                continue
+            for i in range(count - 1):
+                item_a = bucket[i]
+                id_a = id(item_a)
+                for j in range(i + 1, count):
+                    item_b = bucket[j]
+                    id_b = id(item_b)
+                    key = (id_a, id_b) if id_a < id_b else (id_b, id_a)
+                    if key not in seen:
+                        seen.add(key)
+                        pairs.append((item_a, item_b))
+        return pairs
@@ -0,0 +1,515 @@
+"""
+Siaran pertandingan untuk penonton (spectator) lewat socket lokal
+State dikuantisasi ke integer 16 bit lalu dikirim sebagai delta terhadap
+keyframe terakhir yang sudah di-ack penonton; keyframe dikirim berkala
+untuk penonton yang baru bergabung. Setiap penonton punya buffer terbatas,
+sehingga penonton yang lambat kehilangan frame tanpa memperlambat game loop.
+"""
+
+import argparse
+import asyncio
+import struct
+from collections import deque
+
+from powerup import PowerUp
+
+# Tipe pesan
+MESSAGE_SUBSCRIBE = 1
+MESSAGE_ACK = 2
+MESSAGE_KEYFRAME = 3
+MESSAGE_DELTA = 4
+
+# Setiap pesan diawali panjang isi (uint16)
+LENGTH = struct.Struct("<H")
+# Penonton -> broadcaster: tipe, match id / keyframe id
+SUBSCRIBE = struct.Struct("<BI")
+ACK = struct.Struct("<BI")
+
+# Field state yang dikuantisasi (urutan tetap) dan skala masing-masing
+FIELDS = (
+    ("ball_x", 8), ("ball_y", 8), ("ball_vx", 256), ("ball_vy", 256),
+    ("paddle1_y", 8), ("paddle1_height", 8), ("paddle2_y", 8), ("paddle2_height", 8),
+    ("powerup_type", 1), ("powerup_x", 8), ("powerup_y", 8),
+    ("score1", 1), ("score2", 1), ("flags", 1)
+)
+FIELD_COUNT = len(FIELDS)
+
+# Broadcaster -> penonton: tipe, keyframe id, frame, lalu semua field
+KEYFRAME = struct.Struct(f"<BII{FIELD_COUNT}h")
+# Broadcaster -> penonton: tipe, keyframe acuan, frame, mask field yang
+# berubah, lalu nilai field yang berubah saja (int16)
+DELTA_HEADER = struct.Struct("<BIIH")
+_DELTA_VALUES = [struct.Struct(f"<{count}h") for count in range(FIELD_COUNT + 1)]
+
+# Bit pada field flags
+FLAG_BALL_ACTIVE = 1
+FLAG_WINNER_1 = 2
+FLAG_WINNER_2 = 4
+
+
+def _quantize(value, scale):
+    """Ubah nilai menjadi int16 dengan skala tetap"""
+    return max(-32768, min(32767, round(value * scale)))
+
+
+def quantize_state(simulation):
+    """
+    Kuantisasi state simulasi untuk siaran
+
+    Args:
+        simulation (PongSimulation): Simulasi yang disiarkan
+
+    Returns:
+        tuple: FIELD_COUNT nilai integer sesuai urutan FIELDS
+    """
+    ball = simulation.ball
+    paddle1 = simulation.paddle1
+    paddle2 = simulation.paddle2
+
+    powerup_type = 0
+    powerup_x = powerup_y = 0
+    powerups = simulation.get_powerups()
+    if powerups:
+        powerup = powerups[0]
+        powerup_type = PowerUp.TYPES.index(powerup.get_type()) + 1
+        powerup_x = _quantize(powerup.get_x(), 8)
+        powerup_y = _quantize(powerup.get_y(), 8)
+
+    flags = FLAG_BALL_ACTIVE if ball.is_active() else 0
+    winner = simulation.get_winner()
+    if winner == 1:
+        flags |= FLAG_WINNER_1
+    elif winner == 2:
+        flags |= FLAG_WINNER_2
+
+    score1, score2 = simulation.get_scores()
+    return (
+        _quantize(ball.get_x(), 8), _quantize(ball.get_y(), 8),
+        _quantize(ball.get_velocity_x(), 256), _quantize(ball.get_velocity_y(), 256),
+        _quantize(paddle1.get_y(), 8), _quantize(paddle1.get_height(), 8),
+        _quantize(paddle2.get_y(), 8), _quantize(paddle2.get_height(), 8),
+        powerup_type, powerup_x, powerup_y,
+        min(score1, 32767), min(score2, 32767), flags
+    )
+
+
+def dequantize_state(values):
+    """
+    Ubah state terkuantisasi menjadi dictionary nilai asli
+
+    Args:
+        values (tuple): Hasil quantize_state()
+
+    Returns:
+        dict: Nama field -> nilai (float untuk posisi, int untuk lainnya)
+    """
+    state = {}
+    for (name, scale), value in zip(FIELDS, values):
+        state[name] = value / scale if scale != 1 else value
+    return state
+
+
+def encode_keyframe(keyframe_id, frame, values):
+    """Buat pesan keyframe (state lengkap)"""
+    return KEYFRAME.pack(MESSAGE_KEYFRAME, keyframe_id, frame, *values)
+
+
+def encode_delta(base_id, base_values, frame, values):
+    """
+    Buat pesan delta: hanya field yang berbeda dari keyframe acuan
+
+    Args:
+        base_id (int): Id keyframe acuan
+        base_values (tuple): State keyframe acuan
+        frame (int): Frame state ini
+        values (tuple): State saat ini
+    """
+    mask = 0
+    changed = []
+    for index in range(FIELD_COUNT):
+        if values[index] != base_values[index]:
+            mask |= 1 << index
+            changed.append(values[index])
+    return DELTA_HEADER.pack(MESSAGE_DELTA, base_id, frame, mask) + _DELTA_VALUES[len(changed)].pack(*changed)
+
+
+def apply_delta(base_values, data):
+    """
+    Terapkan pesan delta ke keyframe acuan
+
+    Args:
+        base_values (tuple): State keyframe acuan
+        data (bytes): Pesan delta
+
+    Returns:
+        tuple: (frame, state baru)
+    """
+    _, _, frame, mask = DELTA_HEADER.unpack_from(data)
+    changed = iter(struct.unpack_from(f"<{bin(mask).count('1')}h", data, DELTA_HEADER.size))
+    values = tuple(
+        next(changed) if mask & (1 << index) else base_values[index]
+        for index in range(FIELD_COUNT)
+    )
+    return frame, values
+
+
+class _Channel:
+    """Keyframe dan penonton untuk satu pertandingan"""
+
+    def __init__(self):
+        self.keyframes = {}  # keyframe id -> (frame, state)
+        self.keyframe_order = deque()
+        self.latest_keyframe = None
+        self.publish_count = 0
+        self.subscribers = []
+
+
+class _Subscriber:
+    """
+    Satu penonton: buffer pesan terbatas dan task penulis sendiri
+    Jika buffer penuh, pesan tertua dibuang (deque maxlen)
+    """
+
+    def __init__(self, writer, buffer_size):
+        self.writer = writer
+        self.buffer = deque(maxlen=buffer_size)
+        self.ready = asyncio.Event()
+        self.acked_keyframe = None
+        # Keyframe yang sudah masuk buffer tapi belum di-ack
+        self.pending_keyframe = None
+        self.pending_message = None
+        self.sent = 0
+        self.dropped = 0
+        self.task = None
+
+    def get_base(self):
+        """Keyframe acuan untuk delta: yang sudah di-ack atau yang sedang dikirim"""
+        if self.pending_keyframe is not None:
+            return self.pending_keyframe
+        return self.acked_keyframe
+
+    def push(self, message):
+        """Masukkan pesan ke buffer tanpa menunggu"""
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+            if self.buffer[0] is self.pending_message:
+                # Keyframe terbuang sebelum terkirim, harus dikirim ulang
+                self.pending_keyframe = None
+                self.pending_message = None
+        self.buffer.append(message)
+        self.ready.set()
+
+    def push_keyframe(self, keyframe_id, message):
+        """Masukkan keyframe dan jadikan acuan delta berikutnya"""
+        self.push(message)
+        self.pending_keyframe = keyframe_id
+        self.pending_message = message
+
+    def acknowledge(self, keyframe_id):
+        """Penonton sudah menerima keyframe"""
+        self.acked_keyframe = keyframe_id
+        if keyframe_id == self.pending_keyframe:
+            self.pending_keyframe = None
+            self.pending_message = None
+
+
+class SpectatorBroadcaster:
+    """
+    Server siaran untuk banyak penonton per pertandingan
+    publish() dipanggil dari game loop (sinkron, tidak pernah menunggu).
+    Pesan untuk keyframe acuan yang sama hanya di-encode sekali per frame
+    dan dipakai bersama oleh semua penonton.
+    """
+
+    KEYFRAMES_KEPT = 8
+    WRITE_BUFFER_LIMIT = 4096
+
+    def __init__(self, keyframe_interval=60, client_buffer=8):
+        """
+        Constructor untuk SpectatorBroadcaster
+
+        Args:
+            keyframe_interval (int): Jarak antar keyframe (dalam publish)
+            client_buffer (int): Jumlah pesan maksimal yang menunggu per penonton
+        """
+        self.__keyframe_interval = keyframe_interval
+        self.__client_buffer = client_buffer
+        self.__channels = {}
+        self.__server = None
+        self.__handlers = set()
+        self.__next_keyframe_id = 1
+
+    def get_subscriber_count(self, match_id=None):
+        """Mengambil jumlah penonton (semua match atau satu match)"""
+        if match_id is not None:
+            channel = self.__channels.get(match_id)
+            return len(channel.subscribers) if channel else 0
+        return sum(len(channel.subscribers) for channel in self.__channels.values())
+
+    def get_dropped_count(self):
+        """Mengambil total frame yang dibuang karena penonton lambat"""
+        return sum(
+            subscriber.dropped
+            for channel in self.__channels.values()
+            for subscriber in channel.subscribers
+        )
+
+    def get_address(self):
+        """Mengambil alamat (host, port) socket broadcaster"""
+        return self.__server.sockets[0].getsockname()
+
+    async def start(self, host="127.0.0.1", port=9998):
+        """
+        Buka socket TCP lokal untuk penonton
+
+        Args:
+            host (str): Alamat bind
+            port (int): Port bind (0 = port bebas)
+        """
+        self.__server = await asyncio.start_server(self._handle_client, host, port)
+
+    async def stop(self):
+        """Tutup socket dan semua koneksi penonton"""
+        if self.__server is not None:
+            self.__server.close()
+        for channel in self.__channels.values():
+            for subscriber in list(channel.subscribers):
+                subscriber.writer.close()
+        if self.__handlers:
+            await asyncio.gather(*self.__handlers, return_exceptions=True)
+        if self.__server is not None:
+            await self.__server.wait_closed()
+            self.__server = None
+
+    def publish(self, match_id, simulation):
+        """
+        Siarkan state terbaru satu pertandingan
+
+        Args:
+            match_id (int): Id pertandingan
+            simulation (PongSimulation): Simulasi yang disiarkan
+        """
+        channel = self.__channels.get(match_id)
+        if channel is None:
+            channel = self.__channels[match_id] = _Channel()
+
+        values = quantize_state(simulation)
+        frame = simulation.get_frame()
+
+        new_keyframe = channel.publish_count % self.__keyframe_interval == 0
+        channel.publish_count += 1
+        if new_keyframe:
+            self._add_keyframe(channel, frame, values)
+        if not channel.subscribers:
+            return
+
+        keyframes = channel.keyframes
+        keyframe_id = channel.latest_keyframe
+        keyframe_message = None
+        deltas = {}
+        for subscriber in channel.subscribers:
+            base = subscriber.get_base()
+            if base not in keyframes or (new_keyframe and base != keyframe_id):
+                # Baru bergabung, acuan sudah dibuang, atau ada keyframe baru
+                if keyframe_message is None:
+                    keyframe_frame, keyframe_values = keyframes[keyframe_id]
+                    keyframe_message = encode_keyframe(keyframe_id, keyframe_frame, keyframe_values)
+                subscriber.push_keyframe(keyframe_id, keyframe_message)
+                continue
+
+            message = deltas.get(base)
+            if message is None:
+                message = deltas[base] = encode_delta(base, keyframes[base][1], frame, values)
+            subscriber.push(message)
+
+    def _add_keyframe(self, channel, frame, values):
+        """Simpan keyframe baru dan buang yang paling lama"""
+        keyframe_id = self.__next_keyframe_id
+        self.__next_keyframe_id += 1
+        channel.keyframes[keyframe_id] = (frame, values)
+        channel.keyframe_order.append(keyframe_id)
+        channel.latest_keyframe = keyframe_id
+        while len(channel.keyframe_order) > self.KEYFRAMES_KEPT:
+            del channel.keyframes[channel.keyframe_order.popleft()]
+
+    async def _handle_client(self, reader, writer):
+        """Koneksi penonton: baca SUBSCRIBE lalu ACK sampai terputus"""
+        # Buffer transport kecil: antrean utama adalah buffer penonton yang terbatas
+        writer.transport.set_write_buffer_limits(high=self.WRITE_BUFFER_LIMIT)
+        subscriber = _Subscriber(writer, self.__client_buffer)
+        channel = None
+        handler = asyncio.current_task()
+        self.__handlers.add(handler)
+        try:
+            data = await reader.readexactly(SUBSCRIBE.size)
+            message_type, match_id = SUBSCRIBE.unpack(data)
+            if message_type != MESSAGE_SUBSCRIBE:
+                return
+
+            channel = self.__channels.get(match_id)
+            if channel is None:
+                channel = self.__channels[match_id] = _Channel()
+            channel.subscribers.append(subscriber)
+            subscriber.task = asyncio.create_task(self._write_loop(subscriber))
+
+            while True:
+                data = await reader.readexactly(ACK.size)
+                message_type, keyframe_id = ACK.unpack(data)
+                if message_type == MESSAGE_ACK and keyframe_id in channel.keyframes:
+                    subscriber.acknowledge(keyframe_id)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            if channel is not None and subscriber in channel.subscribers:
+                channel.subscribers.remove(subscriber)
+            if subscriber.task is not None:
+                subscriber.task.cancel()
+            writer.close()
+            self.__handlers.discard(handler)
+
+    async def _write_loop(self, subscriber):
+        """Kirim isi buffer penonton; hanya task ini yang menunggu penonton lambat"""
+        writer = subscriber.writer
+        buffer = subscriber.buffer
+        try:
+            while True:
+                await subscriber.ready.wait()
+                subscriber.ready.clear()
+                while buffer:
+                    message = buffer.popleft()
+                    writer.write(LENGTH.pack(len(message)) + message)
+                    subscriber.sent += 1
+                    await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+
+class SpectatorClient:
+    """
+    Penonton: menerima keyframe dan delta lalu menyusun state lengkap
+    Setiap keyframe yang diterima di-ack agar delta berikutnya memakai acuan itu
+    """
+
+    def __init__(self, match_id):
+        """
+        Constructor untuk SpectatorClient
+
+        Args:
+            match_id (int): Id pertandingan yang ditonton
+        """
+        self.__match_id = match_id
+        self.__keyframes = {}
+        self.__frame = -1
+        self.__values = None
+        self.__reader = None
+        self.__writer = None
+        self.__received = 0
+
+    def get_frame(self):
+        """Mengambil frame state terbaru"""
+        return self.__frame
+
+    def get_received_count(self):
+        """Mengambil jumlah pesan yang diterima"""
+        return self.__received
+
+    def get_state(self):
+        """Mengambil state terbaru (dictionary) atau None"""
+        if self.__values is None:
+            return None
+        return dequantize_state(self.__values)
+
+    async def connect(self, host="127.0.0.1", port=9998):
+        """Hubungkan ke broadcaster dan berlangganan pertandingan"""
+        self.__reader, self.__writer = await asyncio.open_connection(host, port)
+        self.__writer.write(SUBSCRIBE.pack(MESSAGE_SUBSCRIBE, self.__match_id))
+        await self.__writer.drain()
+
+    def close(self):
+        """Tutup koneksi"""
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__writer = None
+
+    async def run(self, on_state=None):
+        """
+        Terima pesan sampai koneksi putus
+
+        Args:
+            on_state: Callback on_state(frame, state) untuk setiap state baru
+        """
+        reader = self.__reader
+        try:
+            while True:
+                (length,) = LENGTH.unpack(await reader.readexactly(LENGTH.size))
+                data = await reader.readexactly(length)
+                self.__received += 1
+                if self._handle_message(data) and on_state is not None:
+                    on_state(self.__frame, self.get_state())
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+    def _handle_message(self, data):
+        """
+        Proses satu pesan
+
+        Returns:
+            bool: True jika state terbaru berubah
+        """
+        message_type = data[0]
+        if message_type == MESSAGE_KEYFRAME:
+            unpacked = KEYFRAME.unpack(data)
+            keyframe_id, frame, values = unpacked[1], unpacked[2], unpacked[3:]
+            self.__keyframes[keyframe_id] = values
+            # Simpan beberapa keyframe terakhir saja
+            for old_id in [old_id for old_id in self.__keyframes if old_id < keyframe_id - 16]:
+                del self.__keyframes[old_id]
+            self.__writer.write(ACK.pack(MESSAGE_ACK, keyframe_id))
+        elif message_type == MESSAGE_DELTA:
+            base_id = DELTA_HEADER.unpack_from(data)[1]
+            base_values = self.__keyframes.get(base_id)
+            if base_values is None:
+                return False
+            frame, values = apply_delta(base_values, data)
+        else:
+            return False
+
+        # TCP menjaga urutan pesan, jadi pesan terakhir selalu yang terbaru
+        self.__frame = frame
+        self.__values = values
+        return True
+
+
+async def watch(host, port, match_id):
+    """Tampilkan score pertandingan yang ditonton di terminal"""
+    client = SpectatorClient(match_id)
+    await client.connect(host, port)
+    last_score = [None]
+
+    def on_state(frame, state):
+        score = (state["score1"], state["score2"])
+        if score != last_score[0]:
+            last_score[0] = score
+            print(f"frame {frame}: {score[0]} - {score[1]}")
+
+    try:
+        await client.run(on_state)
+    finally:
+        client.close()
+
+
+def main(argv=None):
+    """Entry point command line (penonton teks)"""
+    parser = argparse.ArgumentParser(description="Penonton pertandingan Pong")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9998)
+    parser.add_argument("--match", type=int, default=1)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(watch(args.host, args.port, args.match))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
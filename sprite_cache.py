@@ -0,0 +1,372 @@
+"""
+SpriteCache - Cache gambar pre-render untuk objek game
+Bentuk (bola, paddle, power-up dan arena statis) dirasterisasi sekali
+dengan NumPy menjadi PNG RGBA lalu disimpan sebagai tk.PhotoImage.
+Menggambar satu frame cukup dengan memindahkan item image di canvas,
+tanpa stipple dan tanpa membuat font/text baru setiap frame.
+"""
+
+import base64
+import struct
+import zlib
+
+import numpy as np
+import tkinter as tk
+
+# Sub-sample per sumbu untuk anti-aliasing tepi bentuk
+SUPERSAMPLE = 4
+
+# Pengganti stipple "gray50": putih dengan alpha 50%
+HIGHLIGHT_ALPHA = 0.5
+
+# Lebar outline putih (sama dengan width=2 pada item canvas)
+OUTLINE_WIDTH = 2
+
+# Ukuran power-up yang berdenyut dibulatkan ke kelipatan ini (pixel)
+POWERUP_SIZE_STEP = 2
+
+# Icon power-up sebagai polygon dalam satuan ukuran icon (pusat di 0, 0)
+ICON_SHAPES = {
+    "speed": (
+        (0.25, -1.0), (-0.55, 0.15), (-0.05, 0.15),
+        (-0.25, 1.0), (0.55, -0.15), (0.05, -0.15),
+    ),
+    "size": (
+        (0.0, -1.0), (0.75, -0.1), (0.25, -0.1), (0.25, 1.0),
+        (-0.25, 1.0), (-0.25, -0.1), (-0.75, -0.1),
+    ),
+}
+
+
+def _sample_grid(width, height):
+    """
+    Koordinat titik sample (pusat sub-pixel) untuk sprite width x height
+
+    Returns:
+        tuple: (xs, ys) array yang bisa di-broadcast ke (height*S, width*S)
+    """
+    xs = (np.arange(width * SUPERSAMPLE) + 0.5) / SUPERSAMPLE
+    ys = (np.arange(height * SUPERSAMPLE) + 0.5) / SUPERSAMPLE
+    return xs[np.newaxis, :], ys[:, np.newaxis]
+
+
+def _coverage(mask, width, height):
+    """Rata-rata mask sub-pixel menjadi coverage 0.0 - 1.0 per pixel"""
+    mask = np.broadcast_to(mask, (height * SUPERSAMPLE, width * SUPERSAMPLE))
+    return mask.reshape(height, SUPERSAMPLE, width, SUPERSAMPLE).mean(axis=(1, 3))
+
+
+def ellipse_mask(xs, ys, cx, cy, rx, ry):
+    """Mask titik di dalam ellipse"""
+    if rx <= 0 or ry <= 0:
+        return np.zeros(np.broadcast(xs, ys).shape, dtype=bool)
+    return ((xs - cx) / rx) ** 2 + ((ys - cy) / ry) ** 2 <= 1.0
+
+
+def rectangle_mask(xs, ys, left, top, right, bottom):
+    """Mask titik di dalam rectangle"""
+    return (xs >= left) & (xs < right) & (ys >= top) & (ys < bottom)
+
+
+def diamond_mask(xs, ys, cx, cy, half_size):
+    """Mask titik di dalam diamond (persegi diputar 45 derajat)"""
+    if half_size <= 0:
+        return np.zeros(np.broadcast(xs, ys).shape, dtype=bool)
+    return np.abs(xs - cx) + np.abs(ys - cy) <= half_size
+
+
+def polygon_mask(xs, ys, points):
+    """
+    Mask titik di dalam polygon (aturan even-odd)
+
+    Args:
+        xs, ys: Koordinat titik sample
+        points (list): Titik sudut polygon [(x, y), ...]
+    """
+    inside = np.zeros(np.broadcast(xs, ys).shape, dtype=bool)
+    count = len(points)
+    for index in range(count):
+        x1, y1 = points[index]
+        x2, y2 = points[(index + 1) % count]
+        if y1 == y2:
+            continue
+        crosses = (ys >= min(y1, y2)) & (ys < max(y1, y2))
+        edge_x = x1 + (ys - y1) * (x2 - x1) / (y2 - y1)
+        inside ^= crosses & (xs < edge_x)
+    return inside
+
+
+def compose(width, height, layers):
+    """
+    Tumpuk layer warna menjadi gambar RGBA (operator "over")
+
+    Args:
+        width (int): Lebar sprite
+        height (int): Tinggi sprite
+        layers (list): Daftar (mask sub-pixel, (r, g, b), alpha) dari bawah ke atas
+
+    Returns:
+        numpy.ndarray: Array uint8 (height, width, 4)
+    """
+    rgb = np.zeros((height, width, 3))
+    alpha = np.zeros((height, width, 1))
+    for mask, color, opacity in layers:
+        layer_alpha = (_coverage(mask, width, height) * opacity)[:, :, np.newaxis]
+        new_alpha = layer_alpha + alpha * (1.0 - layer_alpha)
+        blended = np.asarray(color, dtype=float) * layer_alpha + rgb * alpha * (1.0 - layer_alpha)
+        rgb = np.divide(blended, new_alpha, out=np.zeros_like(rgb), where=new_alpha > 0)
+        alpha = new_alpha
+    image = np.concatenate((rgb, alpha * 255.0), axis=2)
+    return np.clip(np.rint(image), 0, 255).astype(np.uint8)
+
+
+def encode_png(pixels):
+    """
+    Encode array RGBA uint8 (height, width, 4) menjadi file PNG
+
+    Returns:
+        bytes: Isi file PNG
+    """
+    height, width = pixels.shape[:2]
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    # Setiap baris diawali byte filter 0 (None)
+    rows = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    rows[:, 1:] = pixels.reshape(height, width * 4)
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(rows.tobytes(), 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+def parse_hex_color(color):
+    """
+    Ubah warna "#rrggbb" menjadi tuple (r, g, b)
+
+    Returns:
+        tuple: (r, g, b) atau None jika bukan format hex
+    """
+    if isinstance(color, str) and len(color) == 7 and color.startswith("#"):
+        try:
+            return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+        except ValueError:
+            return None
+    return None
+
+
+WHITE = (255, 255, 255)
+
+
+def render_ball(radius, color):
+    """
+    Raster bola: lingkaran berwarna, outline putih dan highlight kiri atas
+
+    Args:
+        radius (float): Jari-jari bola
+        color (tuple): Warna (r, g, b)
+
+    Returns:
+        numpy.ndarray: RGBA dengan pusat bola di tengah gambar
+    """
+    half = radius + OUTLINE_WIDTH
+    size = int(np.ceil(half * 2))
+    xs, ys = _sample_grid(size, size)
+    c = size / 2
+    edge = OUTLINE_WIDTH / 2
+    return compose(size, size, [
+        (ellipse_mask(xs, ys, c, c, radius, radius), color, 1.0),
+        (ellipse_mask(xs, ys, c, c, radius + edge, radius + edge)
+         & ~ellipse_mask(xs, ys, c, c, radius - edge, radius - edge), WHITE, 1.0),
+        (ellipse_mask(xs, ys, c - radius / 4, c - radius / 4, radius / 4, radius / 4),
+         WHITE, HIGHLIGHT_ALPHA),
+    ])
+
+
+def render_paddle(width, height, color):
+    """
+    Raster paddle: rectangle berwarna, outline putih dan highlight setengah atas
+
+    Returns:
+        numpy.ndarray: RGBA dengan paddle di tengah gambar
+    """
+    image_width = int(np.ceil(width)) + OUTLINE_WIDTH
+    image_height = int(np.ceil(height)) + OUTLINE_WIDTH
+    xs, ys = _sample_grid(image_width, image_height)
+    left = (image_width - width) / 2
+    top = (image_height - height) / 2
+    right = left + width
+    bottom = top + height
+    edge = OUTLINE_WIDTH / 2
+    return compose(image_width, image_height, [
+        (rectangle_mask(xs, ys, left, top, right, bottom), color, 1.0),
+        (rectangle_mask(xs, ys, left - edge, top - edge, right + edge, bottom + edge)
+         & ~rectangle_mask(xs, ys, left + edge, top + edge, right - edge, bottom - edge), WHITE, 1.0),
+        (rectangle_mask(xs, ys, left + 2, top + 2, right - 2, top + height / 2),
+         WHITE, HIGHLIGHT_ALPHA),
+    ])
+
+
+def render_powerup(size, icon_size, color, icon):
+    """
+    Raster power-up: diamond berwarna, highlight di tengah dan icon tipe
+
+    Args:
+        size (float): Lebar diamond (sudah termasuk efek pulse)
+        icon_size (float): Ukuran icon (setengah tinggi icon)
+        color (tuple): Warna (r, g, b)
+        icon (str): Kunci ICON_SHAPES ("speed" atau "size")
+
+    Returns:
+        numpy.ndarray: RGBA dengan pusat power-up di tengah gambar
+    """
+    half = size / 2
+    # Stroke tegak lurus sisi diamond = OUTLINE_WIDTH, dilihat sepanjang sumbu * sqrt(2)
+    edge = OUTLINE_WIDTH / 2 * np.sqrt(2)
+    image_size = int(np.ceil(max(half + edge, icon_size) * 2)) + 2
+    xs, ys = _sample_grid(image_size, image_size)
+    c = image_size / 2
+    points = [(c + px * icon_size, c + py * icon_size) for px, py in ICON_SHAPES[icon]]
+    return compose(image_size, image_size, [
+        (diamond_mask(xs, ys, c, c, half), color, 1.0),
+        (diamond_mask(xs, ys, c, c, half + edge) & ~diamond_mask(xs, ys, c, c, half - edge), WHITE, 1.0),
+        (diamond_mask(xs, ys, c, c, half * 0.5), WHITE, HIGHLIGHT_ALPHA),
+        (polygon_mask(xs, ys, points), WHITE, 1.0),
+    ])
+
+
+def render_arena(width, height, background):
+    """
+    Raster arena statis: warna background dan garis tengah putus-putus
+
+    Returns:
+        numpy.ndarray: RGBA ukuran layar (tanpa transparansi)
+    """
+    image = np.empty((height, width, 4), dtype=np.uint8)
+    image[:, :, :3] = background
+    image[:, :, 3] = 255
+    line = slice(width // 2 - 2, width // 2 + 2)
+    blended = np.rint(np.asarray(background) * (1 - HIGHLIGHT_ALPHA) + 255 * HIGHLIGHT_ALPHA)
+    for top in range(0, height, 20):
+        image[top:top + 10, line, :3] = blended
+    return image
+
+
+class SpriteCache:
+    """
+    Cache tk.PhotoImage pre-render, dikunci dengan (jenis, ukuran, warna)
+    Ukuran yang berubah terus (pulse power-up) dibulatkan ke bucket
+    sehingga jumlah gambar tetap kecil.
+    """
+
+    def __init__(self, master):
+        """
+        Constructor untuk SpriteCache
+
+        Args:
+            master: Widget Tkinter pemilik gambar (misalnya canvas)
+        """
+        self.__master = master
+        self.__images = {}  # kunci -> tk.PhotoImage
+        self.__colors = {}  # nama warna -> (r, g, b)
+
+    @staticmethod
+    def is_supported():
+        """Format PNG untuk PhotoImage baru tersedia sejak Tk 8.6"""
+        return tk.TkVersion >= 8.6
+
+    def get_sprite_count(self):
+        """Mengambil jumlah gambar di cache"""
+        return len(self.__images)
+
+    def clear(self):
+        """Hapus semua gambar dari cache"""
+        self.__images.clear()
+
+    def _rgb(self, color):
+        """Ubah warna Tk (hex atau nama) menjadi tuple (r, g, b) 8 bit"""
+        rgb = self.__colors.get(color)
+        if rgb is None:
+            rgb = parse_hex_color(color)
+            if rgb is None:
+                rgb = tuple(value >> 8 for value in self.__master.winfo_rgb(color))
+            self.__colors[color] = rgb
+        return rgb
+
+    def _get(self, key, render):
+        """Ambil gambar dari cache, atau raster lalu simpan jika belum ada"""
+        image = self.__images.get(key)
+        if image is None:
+            png = encode_png(render())
+            image = tk.PhotoImage(master=self.__master, data=base64.b64encode(png).decode("ascii"),
+                                  format="png")
+            self.__images[key] = image
+        return image
+
+    def ball(self, radius, color):
+        """
+        Sprite bola
+
+        Args:
+            radius (float): Jari-jari bola
+            color (str): Warna Tk
+
+        Returns:
+            tk.PhotoImage: Gambar dengan pusat bola di tengah
+        """
+        radius = round(radius)
+        return self._get(
+            ("ball", radius, color),
+            lambda: render_ball(radius, self._rgb(color))
+        )
+
+    def paddle(self, width, height, color):
+        """
+        Sprite paddle (tinggi dibulatkan ke pixel)
+
+        Returns:
+            tk.PhotoImage: Gambar dengan paddle di tengah
+        """
+        width = round(width)
+        height = round(height)
+        return self._get(
+            ("paddle", width, height, color),
+            lambda: render_paddle(width, height, self._rgb(color))
+        )
+
+    def powerup(self, icon, size, icon_size, color):
+        """
+        Sprite power-up
+
+        Args:
+            icon (str): Kunci ICON_SHAPES
+            size (float): Lebar diamond saat ini (dibulatkan ke POWERUP_SIZE_STEP)
+            icon_size (float): Ukuran icon
+            color (str): Warna Tk
+
+        Returns:
+            tk.PhotoImage: Gambar dengan pusat power-up di tengah
+        """
+        size = round(size / POWERUP_SIZE_STEP) * POWERUP_SIZE_STEP
+        icon_size = round(icon_size)
+        return self._get(
+            ("powerup", icon, size, icon_size, color),
+            lambda: render_powerup(size, icon_size, self._rgb(color), icon)
+        )
+
+    def arena(self, width, height, background):
+        """
+        Gambar arena statis satu layar penuh (background + garis tengah)
+
+        Returns:
+            tk.PhotoImage: Gambar width x height
+        """
+        return self._get(
+            ("arena", width, height, background),
+            lambda: render_arena(width, height, self._rgb(background))
+        )
@@ -0,0 +1,4 @@
+"""
+Test determinisme simulasi (replay, fast-forward, snapshot, rollback)
+Jalankan dari root project: python -m unittest discover tests
+"""
@@ -0,0 +1,57 @@
+"""
+Test FastForward: advance() dengan input konstan harus menghasilkan event,
+score dan frame yang sama dengan menjalankan step() satu per satu
+"""
+
+import random
+import unittest
+
+from simulation import PongSimulation
+from fast_forward import FastForward
+
+
+def input_segments(seed, count=60):
+    """Potongan (inputs, jumlah frame) random tetapi deterministik"""
+    rng = random.Random(seed)
+    directions = (PongSimulation.MOVE_UP, PongSimulation.STOP, PongSimulation.MOVE_DOWN)
+    return [((rng.choice(directions), rng.choice(directions)), rng.randint(1, 400)) for _ in range(count)]
+
+
+class FastForwardTest(unittest.TestCase):
+
+    def test_advance_matches_frame_by_frame(self):
+        for seed in range(40):
+            with self.subTest(seed=seed):
+                stepped = PongSimulation(particles=False, seed=seed)
+                forwarded = PongSimulation(particles=False, seed=seed)
+                fast_forward = FastForward(forwarded)
+
+                stepped_events = []
+                forwarded_events = []
+                for inputs, frames in input_segments(seed):
+                    for _ in range(frames):
+                        if stepped.is_game_over():
+                            break
+                        stepped_events.extend(stepped.step(inputs))
+                    forwarded_events.extend(fast_forward.advance(inputs, frames))
+
+                self.assertEqual(forwarded_events, stepped_events)
+                self.assertEqual(forwarded.get_scores(), stepped.get_scores())
+                self.assertEqual(forwarded.get_frame(), stepped.get_frame())
+                self.assertEqual(forwarded.get_rng().getstate(), stepped.get_rng().getstate())
+                # Posisi hanya boleh berbeda sebatas pembulatan floating point
+                self.assertAlmostEqual(forwarded.ball.get_x(), stepped.ball.get_x(), places=6)
+                self.assertAlmostEqual(forwarded.ball.get_y(), stepped.ball.get_y(), places=6)
+                self.assertAlmostEqual(forwarded.paddle1.get_y(), stepped.paddle1.get_y(), places=6)
+                self.assertAlmostEqual(forwarded.paddle2.get_y(), stepped.paddle2.get_y(), places=6)
+
+    def test_frames_are_actually_skipped(self):
+        simulation = PongSimulation(particles=False, seed=1)
+        fast_forward = FastForward(simulation)
+        fast_forward.run_until_game_over((PongSimulation.STOP, PongSimulation.STOP))
+        self.assertTrue(simulation.is_game_over())
+        self.assertGreater(fast_forward.get_skipped_frames(), simulation.get_frame() // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
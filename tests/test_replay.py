@@ -0,0 +1,68 @@
+"""
+Test replay: seed + input yang direkam harus menghasilkan pertandingan
+yang sama persis dengan pertandingan aslinya
+"""
+
+import unittest
+
+from simulation import PongSimulation
+from ai_player import AIController
+from replay import MatchRecorder, MatchRecording, replay_match, verify_recording
+
+
+def play_recorded_match(seed):
+    """
+    Mainkan satu pertandingan AI vs AI (dengan particle, seperti game)
+    sambil merekam inputnya
+
+    Returns:
+        tuple: (simulation, recording)
+    """
+    simulation = PongSimulation(seed=seed)
+    player1 = AIController(1, "hard", seed=seed)
+    player2 = AIController(2, "medium", seed=seed + 1)
+    recorder = MatchRecorder()
+    recorder.start(seed)
+    while not simulation.is_game_over():
+        inputs = (player1.get_input(simulation), player2.get_input(simulation))
+        recorder.record(inputs)
+        simulation.step(inputs)
+    return simulation, recorder.finish(simulation.get_scores())
+
+
+class ReplayTest(unittest.TestCase):
+
+    def test_replay_matches_live_match(self):
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                live, recording = play_recorded_match(seed)
+                replayed = replay_match(recording)
+                self.assertEqual(recording.frame_count, live.get_frame())
+                self.assertEqual(replayed.export_state(), live.export_state())
+                self.assertEqual(replayed.get_rng().getstate(), live.get_rng().getstate())
+                self.assertTrue(verify_recording(recording))
+
+    def test_recording_survives_serialization(self):
+        live, recording = play_recorded_match(7)
+        loaded = MatchRecording.from_bytes(recording.to_bytes())
+        self.assertEqual(list(loaded.iter_inputs()), list(recording.iter_inputs()))
+        self.assertEqual(replay_match(loaded).export_state(), live.export_state())
+
+    def test_headless_game_recording_verifies(self):
+        # Game lengkap: game loop tidur dan melompati frame saat diam (FastForward)
+        from pong_game import PongGame
+
+        game = PongGame()
+        game.press_key("c")       # lawan CPU
+        game.press_key("Return")
+        game.press_key("w")
+        while game.game_loop.is_running():
+            game.scheduler.advance(1.0)
+        recording = game.recorder.get_recording()
+        self.assertTrue(game.simulation.is_game_over())
+        self.assertEqual(recording.frame_count, game.simulation.get_frame())
+        self.assertEqual(replay_match(recording).export_state(), game.simulation.export_state())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Test RollbackPeer: dua peer dengan input yang sering salah ditebak harus
+berakhir di state yang sama saat pertandingan selesai
+"""
+
+import asyncio
+import random
+import unittest
+
+from simulation import PongSimulation
+from rollback import RollbackSession, RollbackPeer
+
+
+class DelayedTransport:
+    """Transport palsu: paket sampai ke peer lawan setelah beberapa tick"""
+
+    def __init__(self, network, target):
+        self.network = network
+        self.target = target
+
+    def sendto(self, data, addr):
+        self.network.queue.append((self.network.tick + self.network.delay, self.target, data))
+
+    def close(self):
+        pass
+
+
+class DelayedNetwork:
+    """Jaringan offline untuk dua peer dengan delay tetap (dalam tick)"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.tick = 0
+        self.queue = []
+
+    def deliver(self):
+        due = [packet for packet in self.queue if packet[0] <= self.tick]
+        self.queue = [packet for packet in self.queue if packet[0] > self.tick]
+        for _, peer, data in due:
+            peer.datagram_received(data, None)
+
+
+def play_offline(seed, delay=6, change_chance=0.3, max_ticks=20000):
+    """
+    Mainkan dua RollbackPeer sampai selesai tanpa socket
+
+    Returns:
+        tuple: (peer1, peer2)
+    """
+    peers = [RollbackPeer(RollbackSession(PongSimulation(particles=False, seed=seed), player))
+             for player in (1, 2)]
+    network = DelayedNetwork(delay)
+    peers[0].connect(DelayedTransport(network, peers[1]), None)
+    peers[1].connect(DelayedTransport(network, peers[0]), None)
+
+    rng = random.Random(seed)
+    directions = [PongSimulation.STOP, PongSimulation.STOP]
+    for _ in range(max_ticks):
+        if all(peer.is_finished() for peer in peers):
+            break
+        network.tick += 1
+        network.deliver()
+        for index, peer in enumerate(peers):
+            if peer.is_finished():
+                continue
+            if rng.random() < change_chance:
+                directions[index] = rng.choice((PongSimulation.MOVE_UP, PongSimulation.STOP, PongSimulation.MOVE_DOWN))
+            peer.tick(directions[index])
+    return peers
+
+
+class RollbackPeerTest(unittest.TestCase):
+
+    def test_peers_converge_at_game_over(self):
+        for seed in range(4):
+            with self.subTest(seed=seed):
+                peer1, peer2 = play_offline(seed)
+                self.assertTrue(peer1.is_finished() and peer2.is_finished())
+                self.assertTrue(peer1.session.simulation.is_game_over())
+                self.assertGreater(peer1.session.get_rollback_count(), 0)
+                self.assertEqual(peer1.session.get_checksum(), peer2.session.get_checksum())
+                self.assertEqual(peer1.session.simulation.get_scores(), peer2.session.simulation.get_scores())
+
+    def test_run_stops_at_game_over_before_frame_limit(self):
+        session = RollbackSession(PongSimulation(particles=False, seed=0), 1)
+        peer = RollbackPeer(session)
+        # Semua input lawan sudah diketahui; tanpa transport tidak ada ack,
+        # jadi run() berhenti setelah FINISH_LINGER_FRAMES tick
+        for frame in range(1, 20001):
+            session.add_remote_input(frame, PongSimulation.STOP)
+
+        run = peer.run(lambda frame: PongSimulation.STOP, frames=20000, tick_rate=1e9)
+        asyncio.run(asyncio.wait_for(run, timeout=60))
+        self.assertTrue(session.simulation.is_game_over())
+        self.assertLess(session.get_frame(), 20000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Test snapshot: simulasi yang dicabangkan dari snapshot harus identik
+dengan aslinya, termasuk setelah step dengan dt pecahan
+"""
+
+import unittest
+
+from simulation import PongSimulation
+from snapshot import take_snapshot, restore_snapshot, SNAPSHOT_SIZE
+
+
+def scripted_inputs(frame):
+    """Input tetap yang sering berganti arah (tanpa random)"""
+    return ((frame // 37) % 3 - 1, (frame // 53) % 3 - 1)
+
+
+class SnapshotTest(unittest.TestCase):
+
+    def assert_branches_identical(self, seed, dt, warmup, frames):
+        original = PongSimulation(particles=False, seed=seed)
+        for frame in range(warmup):
+            original.step(scripted_inputs(frame), dt=dt)
+
+        data = bytes(take_snapshot(original))
+        self.assertEqual(len(data), SNAPSHOT_SIZE)
+        branch = PongSimulation(particles=False, seed=seed + 1000)
+        restore_snapshot(branch, data)
+        self.assertEqual(original.export_state(), branch.export_state())
+
+        for frame in range(warmup, warmup + frames):
+            inputs = scripted_inputs(frame)
+            self.assertEqual(original.step(inputs, dt=dt), branch.step(inputs, dt=dt))
+        self.assertEqual(original.export_state(), branch.export_state())
+        self.assertEqual(original.get_rng().getstate(), branch.get_rng().getstate())
+
+    def test_branch_matches_original(self):
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                self.assert_branches_identical(seed, 1, 500, 1500)
+
+    def test_branch_matches_original_with_fractional_dt(self):
+        # Timer berkurang sebesar dt; restore tidak boleh membulatkannya
+        for seed in range(20):
+            with self.subTest(seed=seed):
+                self.assert_branches_identical(seed, 0.75, 400, 1500)
+
+    def test_snapshot_is_reusable_buffer(self):
+        simulation = PongSimulation(particles=False, seed=3)
+        buffer = take_snapshot(simulation)
+        for frame in range(200):
+            simulation.step(scripted_inputs(frame))
+        self.assertIs(take_snapshot(simulation, buffer), buffer)
+        restored = PongSimulation(particles=False)
+        restore_snapshot(restored, buffer)
+        self.assertEqual(restored.get_frame(), simulation.get_frame())
+
+
+if __name__ == "__main__":
+    unittest.main()
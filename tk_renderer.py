@@ -0,0 +1,156 @@
+"""
+TkRenderer - Backend Renderer di atas Tkinter Canvas
+Membuat canvas game, arena statis dan label UI, lalu menggambar objek game
+lewat CanvasRenderer (item dipakai ulang), sprite pre-render, atau
+FramebufferRenderer (software render, satu image per frame)
+"""
+
+import tkinter as tk
+
+from game_object import GameObject
+from renderer import Renderer, CanvasRenderer
+from sprite_cache import SpriteCache
+from framebuffer import FramebufferRenderer
+
+
+class TkRenderer(Renderer):
+    """
+    Renderer untuk jendela Tkinter (INHERITANCE dari Renderer)
+    Setiap layer UI adalah tag canvas, sehingga satu layer ditampilkan atau
+    disembunyikan dengan satu itemconfig
+    """
+
+    def __init__(self, root, width, height, background, software_render=False):
+        """
+        Constructor untuk TkRenderer
+
+        Args:
+            root: Tkinter root window (atau Toplevel)
+            width (int): Lebar canvas
+            height (int): Tinggi canvas
+            background (str): Warna background
+            software_render (bool): True untuk menggambar objek game ke
+                framebuffer NumPy yang ditampilkan sebagai satu image per frame
+        """
+        super().__init__()
+        self.__canvas = tk.Canvas(
+            root,
+            width=width,
+            height=height,
+            bg=background,
+            highlightthickness=0
+        )
+        self.__canvas.pack()
+
+        # Item canvas dipakai ulang setiap frame, atau software renderer
+        # yang menggambar ke array NumPy
+        if software_render:
+            self.__frame_renderer = FramebufferRenderer(width, height, background, canvas=self.__canvas)
+        else:
+            self.__frame_renderer = CanvasRenderer(self.__canvas)
+
+        # Sprite pre-render untuk objek game (None = gambar bentuk biasa)
+        if not software_render and SpriteCache.is_supported():
+            self.__sprites = SpriteCache(self.__canvas)
+        else:
+            self.__sprites = None
+
+        self.__labels = {}  # nama -> item id
+        self.__layers = {}  # layer -> visible
+        self._create_arena(width, height, background, software_render)
+
+    def get_canvas(self):
+        """Mengambil Tkinter canvas"""
+        return self.__canvas
+
+    def get_frame_renderer(self):
+        """Mengambil renderer objek game (CanvasRenderer atau FramebufferRenderer)"""
+        return self.__frame_renderer
+
+    def get_sprites(self):
+        """Mengambil SpriteCache (None jika tidak dipakai)"""
+        return self.__sprites
+
+    def _create_arena(self, width, height, background, software_render):
+        """Center line: satu gambar arena statis di lapisan paling bawah"""
+        canvas = self.__canvas
+        layer = self.LAYER_ARENA
+        if self.__sprites is not None:
+            arena = canvas.create_image(
+                0, 0,
+                image=self.__sprites.arena(width, height, background),
+                anchor="nw",
+                tags=layer
+            )
+            canvas.tag_lower(arena)
+        elif not software_render:
+            # Software renderer sudah menggambar garis tengah di framebuffer
+            for i in range(0, height, 20):
+                canvas.create_rectangle(
+                    width / 2 - 2, i,
+                    width / 2 + 2, i + 10,
+                    fill="white",
+                    outline="",
+                    stipple="gray50",
+                    tags=layer
+                )
+        self.set_layer_visible(layer, False)
+
+    def begin_frame(self):
+        """Mulai frame baru objek game"""
+        self.__frame_renderer.begin_frame()
+
+    def end_frame(self):
+        """Sembunyikan item yang tidak terpakai / tampilkan framebuffer"""
+        self.__frame_renderer.end_frame()
+
+    def hide_all(self):
+        """Sembunyikan seluruh objek game"""
+        self.__frame_renderer.hide_all()
+
+    def draw(self, drawable):
+        """
+        Override: objek game digambar dengan sprite jika tersedia
+
+        Args:
+            drawable: GameObject atau ParticleSystem
+        """
+        detail = self.get_detail()
+        if self.__sprites is not None and isinstance(drawable, GameObject):
+            drawable.draw_sprite(self.__frame_renderer, self.__sprites, detail)
+        else:
+            drawable.draw(self.__frame_renderer, detail)
+
+    def create_oval(self, *coords, **options):
+        """Gambar oval lewat renderer objek game"""
+        return self.__frame_renderer.create_oval(*coords, **options)
+
+    def create_rectangle(self, *coords, **options):
+        """Gambar rectangle lewat renderer objek game"""
+        return self.__frame_renderer.create_rectangle(*coords, **options)
+
+    def create_polygon(self, *coords, **options):
+        """Gambar polygon lewat renderer objek game"""
+        return self.__frame_renderer.create_polygon(*coords, **options)
+
+    def create_text(self, *coords, **options):
+        """Gambar text lewat renderer objek game"""
+        return self.__frame_renderer.create_text(*coords, **options)
+
+    def create_image(self, *coords, **options):
+        """Gambar image lewat renderer objek game"""
+        return self.__frame_renderer.create_image(*coords, **options)
+
+    def create_label(self, name, layer, x, y, **options):
+        """Buat label sebagai item text canvas dengan tag layer"""
+        state = "normal" if self.__layers.get(layer, False) else "hidden"
+        self.__labels[name] = self.__canvas.create_text(x, y, state=state, tags=layer, **options)
+
+    def update_label(self, name, **options):
+        """Ubah teks atau style label"""
+        self.__canvas.itemconfig(self.__labels[name], **options)
+
+    def set_layer_visible(self, layer, visible):
+        """Tampilkan atau sembunyikan semua item dengan tag layer"""
+        self.__layers[layer] = visible
+        self.__canvas.itemconfig(layer, state="normal" if visible else "hidden")
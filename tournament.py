@@ -0,0 +1,318 @@
+"""
+Turnamen bot Pong dengan process pool
+Setiap pertandingan headless dijalankan di proses worker dengan seed yang
+ditentukan dari seed turnamen dan nomor pertandingan. Hasil ditulis ke file
+JSON lines begitu pertandingan selesai, sehingga turnamen yang terhenti
+bisa dilanjutkan, lalu diringkas menjadi rating Elo dan Glicko.
+
+Jalankan dengan: python tournament.py --bots easy medium hard --rounds 10
+"""
+
+import argparse
+import importlib
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import time
+
+from simulation import PongSimulation
+from ai_player import AIController
+from rating import bootstrap_elo, glicko_ratings
+
+# Batas frame per pertandingan (10 menit game); lewat batas dihitung seri
+DEFAULT_MAX_FRAMES = 10 * 60 * PongSimulation.FPS
+
+
+class TrackingBot:
+    """Bot sederhana: tengah paddle mengikuti posisi y bola"""
+
+    def __init__(self, player, seed=None):
+        """
+        Constructor untuk TrackingBot
+
+        Args:
+            player (int): Player yang dikendalikan (1 atau 2)
+            seed (int): Tidak dipakai (bot deterministik)
+        """
+        self.__player = player
+
+    def get_input(self, simulation):
+        """Input paddle untuk frame ini"""
+        paddle = simulation.paddle1 if self.__player == 1 else simulation.paddle2
+        distance = simulation.ball.get_y() - (paddle.get_y() + paddle.get_height() / 2)
+        if distance > paddle.get_speed():
+            return PongSimulation.MOVE_DOWN
+        if distance < -paddle.get_speed():
+            return PongSimulation.MOVE_UP
+        return PongSimulation.STOP
+
+
+def make_bot(spec, player, seed):
+    """
+    Buat bot dari nama
+
+    Args:
+        spec (str): Nama difficulty AIController ("easy", "hard", ...),
+            "track", atau "modul:Class" untuk class bot sendiri dengan
+            constructor (player, seed) dan method get_input(simulation)
+        player (int): Player yang dikendalikan (1 atau 2)
+        seed (int): Seed RNG bot
+
+    Returns:
+        object: Bot dengan method get_input(simulation)
+    """
+    if spec in AIController.DIFFICULTIES:
+        return AIController(player, spec, seed=seed)
+    if spec == "track":
+        return TrackingBot(player, seed)
+    if ":" in spec:
+        module_name, class_name = spec.split(":", 1)
+        bot_class = getattr(importlib.import_module(module_name), class_name)
+        return bot_class(player, seed)
+    raise ValueError(f"Bot tidak dikenal: {spec}")
+
+
+def match_seed(tournament_seed, index):
+    """
+    Seed pertandingan ke-index (sama di setiap mesin dan urutan eksekusi)
+
+    Args:
+        tournament_seed (int): Seed turnamen
+        index (int): Nomor pertandingan
+
+    Returns:
+        int: Seed 63 bit
+    """
+    return random.Random(f"{tournament_seed}:{index}").getrandbits(63)
+
+
+def schedule(bots, rounds, tournament_seed):
+    """
+    Jadwal round robin: setiap pasangan bermain dua kali per ronde
+    (bergantian sisi kiri dan kanan)
+
+    Args:
+        bots (list): Nama bot
+        rounds (int): Jumlah ronde
+        tournament_seed (int): Seed turnamen
+
+    Returns:
+        list: Daftar dict pertandingan (match, round, player1, player2, seed)
+    """
+    matches = []
+    for round_index in range(rounds):
+        for bot_a, bot_b in itertools.combinations(bots, 2):
+            for player1, player2 in ((bot_a, bot_b), (bot_b, bot_a)):
+                index = len(matches)
+                matches.append({
+                    "match": index,
+                    "round": round_index,
+                    "player1": player1,
+                    "player2": player2,
+                    "seed": match_seed(tournament_seed, index),
+                })
+    return matches
+
+
+def play_match(match, max_frames=DEFAULT_MAX_FRAMES):
+    """
+    Mainkan satu pertandingan headless (dijalankan di proses worker)
+    Aturan sama dengan PongGame: WINNING_SCORE dan power-up aktif
+
+    Args:
+        match (dict): Satu entri dari schedule()
+        max_frames (int): Batas frame sebelum pertandingan dihitung seri
+
+    Returns:
+        dict: Entri match ditambah winner (0 = seri), score dan frames
+    """
+    simulation = PongSimulation(particles=False, seed=match["seed"])
+    bot_rng = random.Random(match["seed"])
+    bot1 = make_bot(match["player1"], 1, bot_rng.getrandbits(32))
+    bot2 = make_bot(match["player2"], 2, bot_rng.getrandbits(32))
+
+    started = time.perf_counter()
+    inputs = [PongSimulation.STOP, PongSimulation.STOP]
+    while not simulation.is_game_over() and simulation.get_frame() < max_frames:
+        inputs[0] = bot1.get_input(simulation)
+        inputs[1] = bot2.get_input(simulation)
+        simulation.step(inputs)
+
+    result = dict(match)
+    result["winner"] = simulation.get_winner() or 0
+    result["score"] = list(simulation.get_scores())
+    result["frames"] = simulation.get_frame()
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def _play_match_worker(arguments):
+    """Wrapper untuk Pool.imap_unordered (satu argumen)"""
+    match, max_frames = arguments
+    return play_match(match, max_frames)
+
+
+def load_results(path, config):
+    """
+    Baca hasil yang sudah ada untuk melanjutkan turnamen
+
+    Args:
+        path (str): File hasil (JSON lines)
+        config (dict): Konfigurasi turnamen saat ini
+
+    Returns:
+        dict: Nomor pertandingan -> hasil
+
+    Raises:
+        ValueError: Jika file berisi turnamen dengan konfigurasi lain
+    """
+    results = {}
+    if not os.path.exists(path):
+        return results
+
+    with open(path, "r", encoding="utf-8") as file:
+        for line_number, line in enumerate(file):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Baris terakhir bisa terpotong jika proses dihentikan paksa
+                continue
+            if line_number == 0:
+                if entry.get("config") != config:
+                    raise ValueError(f"{path} berisi turnamen dengan konfigurasi berbeda")
+                continue
+            results[entry["match"]] = entry
+    return results
+
+
+def run_tournament(bots, rounds=1, seed=0, results_path="tournament_results.jsonl",
+                   workers=None, max_frames=DEFAULT_MAX_FRAMES, on_result=None):
+    """
+    Jalankan (atau lanjutkan) turnamen
+
+    Args:
+        bots (list): Nama bot (lihat make_bot)
+        rounds (int): Jumlah ronde round robin
+        seed (int): Seed turnamen
+        results_path (str): File hasil JSON lines (dipakai untuk resume)
+        workers (int): Jumlah proses (None = semua core)
+        max_frames (int): Batas frame per pertandingan
+        on_result: Callback on_result(result, done, total) untuk setiap hasil baru
+
+    Returns:
+        list: Semua hasil, urut nomor pertandingan
+    """
+    config = {"bots": list(bots), "rounds": rounds, "seed": seed, "max_frames": max_frames}
+    matches = schedule(bots, rounds, seed)
+    results = load_results(results_path, config)
+    pending = [match for match in matches if match["match"] not in results]
+
+    if not os.path.exists(results_path) or os.path.getsize(results_path) == 0:
+        with open(results_path, "w", encoding="utf-8") as file:
+            file.write(json.dumps({"config": config}) + "\n")
+
+    if pending:
+        workers = workers or os.cpu_count() or 1
+        # Pertandingan dibagikan satu per satu (chunksize 1), jadi worker
+        # yang selesai lebih dulu langsung mengambil pertandingan berikutnya
+        with multiprocessing.Pool(workers) as pool, open(results_path, "a", encoding="utf-8") as file:
+            tasks = ((match, max_frames) for match in pending)
+            for result in pool.imap_unordered(_play_match_worker, tasks, chunksize=1):
+                file.write(json.dumps(result) + "\n")
+                file.flush()
+                results[result["match"]] = result
+                if on_result is not None:
+                    on_result(result, len(results), len(matches))
+
+    return [results[index] for index in sorted(results)]
+
+
+def _score(result):
+    """Skor player 1 untuk rating (1 menang, 0.5 seri, 0 kalah)"""
+    return {1: 1.0, 2: 0.0}.get(result["winner"], 0.5)
+
+
+def compute_ratings(results, bots):
+    """
+    Ringkas hasil menjadi rating
+
+    Args:
+        results (list): Hasil dari run_tournament()
+        bots (list): Nama bot
+
+    Returns:
+        tuple: (elo, glicko), masing-masing dict nama -> (rating, bawah, atas)
+    """
+    games = [(result["player1"], result["player2"], _score(result)) for result in results]
+    elo = bootstrap_elo(games, bots)
+
+    # Satu ronde round robin = satu rating period Glicko
+    periods = {}
+    for result, game in zip(results, games):
+        periods.setdefault(result["round"], []).append(game)
+    glicko = glicko_ratings([periods[key] for key in sorted(periods)], bots)
+    return elo, glicko
+
+
+def format_table(results, bots):
+    """Tabel rating dan statistik menang/kalah per bot"""
+    elo, glicko = compute_ratings(results, bots)
+    records = {bot: [0, 0, 0] for bot in bots}
+    for result in results:
+        player1, player2, winner = result["player1"], result["player2"], result["winner"]
+        if winner == 1:
+            records[player1][0] += 1
+            records[player2][1] += 1
+        elif winner == 2:
+            records[player2][0] += 1
+            records[player1][1] += 1
+        else:
+            records[player1][2] += 1
+            records[player2][2] += 1
+
+    lines = [f"{'bot':<16}{'elo':>8}{'95% ci':>16}{'glicko':>9}{'95% ci':>16}{'w-l-d':>12}"]
+    for bot in sorted(bots, key=lambda name: -glicko[name][0]):
+        rating, low, high = elo[bot]
+        glicko_rating, glicko_low, glicko_high = glicko[bot]
+        wins, losses, draws = records[bot]
+        lines.append(
+            f"{bot:<16}{rating:>8.0f}{f'{low:.0f}..{high:.0f}':>16}"
+            f"{glicko_rating:>9.0f}{f'{glicko_low:.0f}..{glicko_high:.0f}':>16}"
+            f"{f'{wins}-{losses}-{draws}':>12}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Entry point command line"""
+    parser = argparse.ArgumentParser(description="Turnamen bot Pong (process pool)")
+    parser.add_argument("--bots", nargs="+", default=["easy", "medium", "hard", "track"],
+                        help="difficulty AIController, 'track' atau modul:Class")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="jumlah proses (default semua core)")
+    parser.add_argument("--max-frames", type=int, default=DEFAULT_MAX_FRAMES)
+    parser.add_argument("--results", default="tournament_results.jsonl",
+                        help="file hasil; dijalankan ulang untuk melanjutkan turnamen")
+    args = parser.parse_args(argv)
+
+    def on_result(result, done, total):
+        player1, player2 = result["player1"], result["player2"]
+        score1, score2 = result["score"]
+        print(f"[{done}/{total}] #{result['match']} {player1} {score1} - {score2} {player2}", flush=True)
+
+    results = run_tournament(
+        args.bots, args.rounds, args.seed, args.results,
+        workers=args.workers, max_frames=args.max_frames, on_result=on_result
+    )
+    print()
+    print(format_table(results, args.bots))
+
+
+if __name__ == "__main__":
+    main()